@@ -0,0 +1,245 @@
+import csv
+import os
+import re
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote, urlparse
+
+import pandas as pd
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from ttl_cache import TTLCache
+from whitelist_journal import ChangeJournal
+
+# Fills in the blank Link column of the whitelist, blacklist and Zero_Reviews workbooks so
+# the scrapers can match films by URL instead of by title. Run it while no scraper is running.
+
+# Configure settings
+BACKFILL_WORKERS = 8
+SEARCH_RESULTS_CHECKED = 5  # Search results verified per title when no direct guess matches
+REQUEST_TIMEOUT = 30
+
+# File paths
+LIST_DIR = r'C:\Users\bigba\aa Personal Projects\Letterboxd List Scraping'
+BLACKLIST_PATH = os.path.join(LIST_DIR, 'blacklist.xlsx')
+WHITELIST_PATH = os.path.join(LIST_DIR, 'whitelist.xlsx')
+ZERO_REVIEWS_PATH = os.path.join(LIST_DIR, 'Zero_Reviews.xlsx')
+WHITELIST_JOURNAL_PATH = os.path.join(LIST_DIR, 'whitelist_journal.jsonl')
+LINK_CANDIDATES_PATH = os.path.join(LIST_DIR, 'link_candidates.json')
+REVIEW_PATH = os.path.join(LIST_DIR, 'link_backfill_review.csv')
+
+LETTERBOXD_URL = 'https://letterboxd.com'
+FILM_PATH = re.compile(r'^/film/([^/]+)/$')
+
+def create_session(workers: int = BACKFILL_WORKERS) -> requests.Session:
+    """A session shared by all workers, with one pooled connection per worker."""
+    session = requests.Session()
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=workers, pool_maxsize=workers)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def normalize_text(text):
+    return unicodedata.normalize('NFKC', str(text)).strip()
+
+def comparable_title(title: str) -> str:
+    """Lowercase a title and drop accents and punctuation so page titles and workbook titles compare equal."""
+    decomposed = unicodedata.normalize('NFKD', normalize_text(title))
+    return re.sub(r'[^a-z0-9]+', '', ''.join(ch for ch in decomposed if not unicodedata.combining(ch)).lower())
+
+def slugify(title: str) -> str:
+    """Guess the Letterboxd slug for a title."""
+    decomposed = unicodedata.normalize('NFKD', normalize_text(title))
+    ascii_title = ''.join(ch for ch in decomposed if not unicodedata.combining(ch)).lower()
+    return re.sub(r'[^a-z0-9]+', '-', ascii_title.replace("'", '')).strip('-')
+
+def film_url(slug: str) -> str:
+    return f'{LETTERBOXD_URL}/film/{slug}/'
+
+# Column 4 of every list workbook is the Link column
+LINK_COLUMN = 3
+
+def read_workbook(path: str) -> pd.DataFrame:
+    """Read a list workbook as stored, so writing it back only changes the cells that were patched."""
+    return pd.read_excel(path, header=0, dtype=object)
+
+def list_view(workbook: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Normalized copy of the first four columns, keeping the workbook's row index."""
+    frame = workbook.iloc[:, :4].copy()
+    frame.columns = columns
+    frame['Title'] = frame['Title'].apply(normalize_text)
+    frame['Year'] = frame['Year'].apply(lambda year: '' if pd.isna(year) else str(year).strip())
+    frame['Link'] = frame['Link'].fillna('')
+    return frame
+
+def load_list_rows() -> Tuple[Dict[str, pd.DataFrame], Dict[str, pd.DataFrame]]:
+    """Read the three list workbooks, with whitelist changes still in the journal applied.
+
+    Returns the normalized rows used for matching and the untouched blacklist and
+    Zero_Reviews workbooks that resolved links are written back into.
+    """
+    workbooks = {'blacklist': read_workbook(BLACKLIST_PATH), 'zero_reviews': read_workbook(ZERO_REVIEWS_PATH)}
+    whitelist = list_view(read_workbook(WHITELIST_PATH), ['Title', 'Year', 'Information', 'Link'])
+    blacklist = list_view(workbooks['blacklist'], ['Title', 'Year', 'Reason', 'Link'])
+    zero_reviews = list_view(workbooks['zero_reviews'], ['Title', 'Year', 'Blank', 'Link'])
+
+    # A scraper run that was not compacted leaves its latest whitelist rows in the journal
+    rows_by_key = {key: idx for idx, key in enumerate(whitelist['Title'].str.lower() + '_' + whitelist['Year'])}
+    for entry in ChangeJournal(WHITELIST_JOURNAL_PATH).read():
+        key = f"{entry['Title'].lower()}_{entry['Year']}"
+        if key in rows_by_key:
+            idx = rows_by_key[key]
+            whitelist.at[idx, 'Information'] = entry['Information']
+            whitelist.at[idx, 'Link'] = entry['Link']
+        else:
+            rows_by_key[key] = len(whitelist)
+            whitelist.loc[len(whitelist)] = [entry['Title'], entry['Year'], entry['Information'], entry['Link']]
+
+    return {'whitelist': whitelist, 'blacklist': blacklist, 'zero_reviews': zero_reviews}, workbooks
+
+class LinkResolver:
+    """Finds the Letterboxd page for a title and year.
+
+    Candidates are URLs the scrapers saw for the entry, then slug guesses, then the
+    site search. A candidate only counts if its og:title has the same title and year.
+    """
+
+    def __init__(self, session: requests.Session, hints: TTLCache):
+        self.session = session
+        self.hints = hints
+
+    def fetch(self, url: str) -> Optional[requests.Response]:
+        try:
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+        except requests.RequestException:
+            return None
+        return response if response.status_code == 200 else None
+
+    def verify(self, url: str, title: str, year: str) -> Optional[str]:
+        """Return the canonical film URL if the page at url is the film title (year)."""
+        response = self.fetch(url)
+        if response is None:
+            return None
+        match = re.search(r'<meta[^>]+property="og:title"[^>]+content="([^"]*)"', response.text)
+        if not match:
+            return None
+        content = BeautifulSoup(match.group(1), 'html.parser').get_text()
+        if '(' not in content or ')' not in content:
+            return None
+        page_title, page_year = content.rsplit('(', 1)
+        if page_year.split(')')[0].strip() != year or comparable_title(page_title) != comparable_title(title):
+            return None
+        slug = FILM_PATH.match(urlparse(response.url).path or '')
+        return film_url(slug.group(1)) if slug else url
+
+    def search(self, title: str) -> List[str]:
+        response = self.fetch(f'{LETTERBOXD_URL}/search/films/{quote(title)}/')
+        if response is None:
+            return []
+        soup = BeautifulSoup(response.text, 'html.parser')
+        urls = []
+        for element in soup.select('[data-film-slug], [data-target-link], a[href^="/film/"]'):
+            slug = element.get('data-film-slug')
+            if not slug:
+                path = FILM_PATH.match(element.get('data-target-link') or element.get('href') or '')
+                slug = path.group(1) if path else None
+            if slug and film_url(slug) not in urls:
+                urls.append(film_url(slug))
+            if len(urls) >= SEARCH_RESULTS_CHECKED:
+                break
+        return urls
+
+    def resolve(self, title: str, year: str) -> List[str]:
+        """Return every distinct URL that verifies as title (year); more than one means ambiguous."""
+        slug = slugify(title)
+        candidates = list(self.hints.get(f"{title.lower()}_{year}", []))
+        candidates += [film_url(slug), film_url(f'{slug}-{year}')]
+
+        matches: List[str] = []
+        for candidate in dict.fromkeys(candidates):
+            verified = self.verify(candidate, title, year)
+            if verified and verified not in matches:
+                matches.append(verified)
+        if matches:
+            return matches
+
+        for candidate in self.search(title):
+            if candidate in candidates:
+                continue
+            verified = self.verify(candidate, title, year)
+            if verified and verified not in matches:
+                matches.append(verified)
+        return matches
+
+def main():
+    start_time = time.time()
+    frames, workbooks = load_list_rows()
+    hints = TTLCache(LINK_CANDIDATES_PATH, ttl=float('inf'))
+    resolver = LinkResolver(create_session(), hints)
+
+    # Rows without a link, as (store, row index, title, year)
+    jobs: List[Tuple[str, int, str, str]] = []
+    for store, frame in frames.items():
+        missing = frame[frame['Link'] == '']
+        jobs.extend((store, idx, title, year) for idx, title, year in zip(missing.index, missing['Title'], missing['Year']))
+    print(f"Resolving {len(jobs)} missing links with {BACKFILL_WORKERS} workers...")
+
+    with ThreadPoolExecutor(max_workers=BACKFILL_WORKERS) as executor:
+        results = list(executor.map(lambda job: resolver.resolve(job[2], job[3]), jobs))
+
+    used_links = {store: set(filter(None, frame['Link'].tolist())) for store, frame in frames.items()}
+    review: List[List[str]] = []
+    resolved: Dict[str, int] = {store: 0 for store in frames}
+    journal = ChangeJournal(WHITELIST_JOURNAL_PATH)
+
+    for (store, idx, title, year), matches in zip(jobs, results):
+        if len(matches) != 1:
+            review.append([store, title, year, 'Ambiguous' if matches else 'Not found', ' '.join(matches)])
+            continue
+        link = matches[0]
+        if link in used_links[store]:
+            review.append([store, title, year, 'Link already used by another row', link])
+            continue
+
+        used_links[store].add(link)
+        frame = frames[store]
+        frame.at[idx, 'Link'] = link
+        resolved[store] += 1
+        hints.discard(f"{title.lower()}_{year}")
+        if store == 'whitelist':
+            # Whitelist changes go through the journal the scrapers compact from
+            information = frame.at[idx, 'Information']
+            journal.append({'Title': title, 'Year': year, 'Information': information if isinstance(information, str) else '', 'Link': link})
+        else:
+            # Only the Link cell changes; titles, years and any extra columns are written back as read
+            workbooks[store].iat[idx, LINK_COLUMN] = link
+
+    journal.flush()
+    if resolved['blacklist']:
+        workbooks['blacklist'].to_excel(BLACKLIST_PATH, index=False)
+    if resolved['zero_reviews']:
+        workbooks['zero_reviews'].to_excel(ZERO_REVIEWS_PATH, index=False)
+    hints.save()
+
+    with open(REVIEW_PATH, mode='w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(['List', 'Title', 'Year', 'Issue', 'Candidates'])
+        writer.writerows(review)
+
+    for store, count in resolved.items():
+        print(f"{store}: {count} links added")
+    print(f"{len(review)} entries need review, see {REVIEW_PATH}")
+    print(f"Finished in {time.time() - start_time:.1f} seconds")
+
+if __name__ == "__main__":
+    main()
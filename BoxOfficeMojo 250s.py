@@ -1,8 +1,13 @@
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import csv
 import os
 import platform
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from ttl_cache import TTLCache
 
 # Detect operating system and set appropriate paths
 def get_os_specific_paths():
@@ -27,6 +32,25 @@ def get_os_specific_paths():
 paths = get_os_specific_paths()
 output_dir = paths['output_dir']
 
+# Configure settings
+MAX_MOVIES = 250
+REQUEST_TIMEOUT = 15
+# ETag/Last-Modified and parsed rows per chart page, so unchanged pages come back as 304s
+HTTP_CACHE_PATH = os.path.join(paths['base_dir'], 'box_office_http_cache.json')
+
+CHARTS = {
+    # Regular box office
+    'box_office_real.csv': [
+        'https://www.boxofficemojo.com/chart/ww_top_lifetime_gross/?area=XWW',
+        'https://www.boxofficemojo.com/chart/ww_top_lifetime_gross/?area=XWW&offset=200'
+    ],
+    # Inflation-adjusted box office
+    'box_office_inflated.csv': [
+        'https://www.boxofficemojo.com/chart/top_lifetime_gross_adjusted/?adjust_gross_to=2022',
+        'https://www.boxofficemojo.com/chart/top_lifetime_gross_adjusted/?adjust_gross_to=2022&offset=200'
+    ]
+}
+
 # Define a custom print function
 def print_to_csv(message: str):
     """Prints a message to the terminal and appends it to All_Outputs.csv."""
@@ -35,90 +59,143 @@ def print_to_csv(message: str):
         writer = csv.writer(file)
         writer.writerow([message])  # Write the message as a new row
 
-def scrape_movies(urls, output_filename):
-    os.makedirs(output_dir, exist_ok=True)
-    output_file = os.path.join(output_dir, output_filename)
+def create_session(workers: int) -> requests.Session:
+    """One session for every chart page, with retries and a connection per worker."""
+    session = requests.Session()
+    session.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=workers, pool_maxsize=workers)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
-    movies = []
-    movies_processed = 0
+def parse_chart_rows(html: str) -> List[List]:
+    """Parse [rank, title, year] rows from a chart page.
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    Only the chart table is parsed, and each row's cells are read once and picked out by
+    column class rather than with per-row CSS selectors.
+    """
+    table = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer('table', class_='mojo-body-table'))
+    rows = []
+    for tr in table.find_all('tr'):
+        cells = {}
+        for td in tr.find_all('td', recursive=False):
+            for css_class in td.get('class') or ():
+                if css_class.startswith('mojo-field-type-'):
+                    cells[css_class[len('mojo-field-type-'):]] = td
+        rank_cell, title_cell, year_cell = cells.get('rank'), cells.get('title'), cells.get('year')
+        if not rank_cell or not title_cell or not year_cell:
+            continue
+        title_link = title_cell.find('a')
+        # Year is usually a link, otherwise plain text
+        year = year_cell.get_text().strip()
+        try:
+            rank = int(rank_cell.get_text().strip().replace(',', ''))
+        except ValueError:
+            continue
+        if title_link and year:
+            rows.append([rank, title_link.get_text().strip(), year])
+    return rows
+
+def fetch_chart_page(session: requests.Session, url: str, cached: Optional[Dict]) -> Tuple[Optional[Dict], bool]:
+    """Fetch one chart page with a conditional GET.
+
+    Returns (entry, fetched) where entry holds the page's etag, last_modified and rows and
+    fetched is True for a 200 (False for a 304), or (None, False) if the page could not be fetched.
+    """
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+    try:
+        response = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code == 304 and cached:
+            return cached, False
+        response.raise_for_status()
+    except Exception as e:
+        print_to_csv(f"Error accessing URL {url}: {e}")
+        return None, False
+
+    entry = {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'rows': parse_chart_rows(response.text)
     }
+    return entry, True
+
+def read_existing_csv(path: str) -> Optional[List[List[str]]]:
+    try:
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            return list(csv.reader(f))
+    except OSError:
+        return None
+
+def write_chart_csv(urls: List[str], pages: Dict[str, Optional[Dict]], output_filename: str) -> None:
+    """Write a chart's top MAX_MOVIES films, unless the CSV already holds exactly those rows."""
+    output_file = os.path.join(output_dir, output_filename)
 
+    movies = []
     for url in urls:
-        page_movies = []
-        try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            movie_rows = soup.select('table.mojo-body-table tr:has(td.mojo-field-type-rank)')
-
-            for row in movie_rows:
-                if movies_processed >= 250:
-                    break
-                
-                try:
-                    rank_element = row.select_one('td.mojo-field-type-rank')
-                    title_element = row.select_one('td.mojo-field-type-title a')
-                    year_cell = row.select_one('td.mojo-field-type-year')
-                    
-                    # Try to get year from link first, if not found get direct text
-                    year = None
-                    if year_cell:
-                        year_link = year_cell.select_one('a')
-                        if year_link:
-                            year = year_link.text.strip()
-                        else:
-                            year = year_cell.text.strip()
-                    
-                    if not all([rank_element, title_element, year]):
-                        continue
-                    
-                    rank = int(rank_element.text.strip())
-                    title = title_element.text.strip()
-                    
-                    page_movies.append([rank, title, year])
-                    movies_processed += 1
-                    
-                    if movies_processed % 10 == 0:
-                        print_to_csv(f"Processed {movies_processed} movies")
-                        
-                except Exception as e:
-                    continue
-
-            movies.extend(page_movies)
-
-        except Exception as e:
-            print_to_csv(f"Error accessing URL {url}: {e}")
-            continue
+        entry = pages.get(url)
+        if entry is None:
+            # Writing the other pages alone would truncate a good file
+            print_to_csv(f"No rows for {url}, leaving {output_filename} as it is")
+            return
+        remaining = MAX_MOVIES - len(movies)
+        movies.extend(entry['rows'][:max(remaining, 0)])
 
     sorted_movies = sorted(movies, key=lambda x: x[0])  # Sort by rank
-    
+    # Rank is only used for ordering and is not written
+    csv_rows = [['Title', 'Year']] + [[str(movie[1]), str(movie[2])] for movie in sorted_movies[:MAX_MOVIES]]
+
+    if read_existing_csv(output_file) == csv_rows:
+        print_to_csv(f"{output_filename} is unchanged ({len(csv_rows) - 1} movies), not rewriting it")
+        return
+
     try:
         with open(output_file, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
-            writer.writerow(['Title', 'Year'])  # Removed Rank from header
-            # Write rows excluding the rank
-            writer.writerows([[movie[1], movie[2]] for movie in sorted_movies[:250]])  # Excluding rank
-        print_to_csv(f"\nSuccessfully wrote {len(sorted_movies[:250])} movies to {output_file}")
+            writer.writerows(csv_rows)
+        print_to_csv(f"\nSuccessfully wrote {len(csv_rows) - 1} movies to {output_file}")
     except Exception as e:
         print_to_csv(f"Error writing to CSV: {e}")
 
+def scrape_charts(charts: Dict[str, List[str]]) -> None:
+    """Fetch every chart page at once on one pooled session, then write each chart's CSV."""
+    os.makedirs(output_dir, exist_ok=True)
+    cache = TTLCache(HTTP_CACHE_PATH, ttl=float('inf'))
+    urls = [url for chart_urls in charts.values() for url in chart_urls]
+    session = create_session(len(urls))
+
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        results = list(executor.map(lambda url: fetch_chart_page(session, url, cache.get(url, None)), urls))
+
+    pages = {}
+    changed_pages = 0
+    for url, (entry, fetched) in zip(urls, results):
+        cached = cache.get(url, None)
+        if entry is None:
+            # A failed fetch falls back to the rows from the last successful one
+            pages[url] = cached
+            continue
+        pages[url] = entry
+        if fetched:
+            # New validators are kept even when the rows are the same, so the next run gets a 304
+            cache.set(url, entry)
+            if not cached or entry['rows'] != cached.get('rows'):
+                changed_pages += 1
+    cache.save()
+
+    print_to_csv(f"Fetched {len(urls)} chart pages, {changed_pages} changed")
+
+    for output_filename, chart_urls in charts.items():
+        write_chart_csv(chart_urls, pages, output_filename)
+
 if __name__ == "__main__":
-    # Run regular box office
-    urls = [
-        'https://www.boxofficemojo.com/chart/ww_top_lifetime_gross/?area=XWW',
-        'https://www.boxofficemojo.com/chart/ww_top_lifetime_gross/?area=XWW&offset=200'
-    ]
-    output_filename = 'box_office_real.csv'
-    scrape_movies(urls, output_filename)
-    
-    # Run inflation-adjusted box office
-    urls = [
-        'https://www.boxofficemojo.com/chart/top_lifetime_gross_adjusted/?adjust_gross_to=2022',
-        'https://www.boxofficemojo.com/chart/top_lifetime_gross_adjusted/?adjust_gross_to=2022&offset=200'
-    ]
-    output_filename = 'box_office_inflated.csv'
-    scrape_movies(urls, output_filename)
\ No newline at end of file
+    scrape_charts(CHARTS)
@@ -1,10 +1,18 @@
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
-import difflib
 import unicodedata
 import os
 import platform
+import sys
+import csv
+import json
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from title_index import TitleIndex
+from workbook_cache import load_cached_frame
 
 # Detect operating system and set appropriate paths
 def get_os_specific_paths():
@@ -14,23 +22,53 @@ def get_os_specific_paths():
     if system == "Windows":
         # Windows paths
         base_dir = r'C:\Users\bigba\aa Personal Projects\Letterboxd List Scraping'
-        whitelist_path = os.path.join(base_dir, 'whitelist.xlsx')
     elif system == "Darwin":  # macOS
         # macOS paths
         base_dir = '/Users/calebcollins/Documents/Letterboxd List Scraping'
-        whitelist_path = os.path.join(base_dir, 'whitelist.xlsx')
     
     return {
         'base_dir': base_dir,
-        'whitelist_path': whitelist_path
+        'whitelist_path': os.path.join(base_dir, 'whitelist.xlsx'),
+        'blacklist_path': os.path.join(base_dir, 'blacklist.xlsx'),
+        'zero_reviews_path': os.path.join(base_dir, 'Zero_Reviews.xlsx'),
+        'incomplete_stats_path': os.path.join(base_dir, 'Incomplete_Stats_Whitelist.xlsx'),
+        'whitelist_index_path': os.path.join(base_dir, 'whitelist.titles.pkl'),
+        'blacklist_index_path': os.path.join(base_dir, 'blacklist.titles.pkl'),
+        'zero_reviews_index_path': os.path.join(base_dir, 'Zero_Reviews.titles.pkl'),
+        'incomplete_stats_index_path': os.path.join(base_dir, 'Incomplete_Stats_Whitelist.titles.pkl')
     }
 
 # Get OS-specific paths
 paths = get_os_specific_paths()
 WHITELIST_PATH = paths['whitelist_path']
+BLACKLIST_PATH = paths['blacklist_path']
+WHITELIST_INDEX_PATH = paths['whitelist_index_path']
+BLACKLIST_INDEX_PATH = paths['blacklist_index_path']
+ZERO_REVIEWS_PATH = paths['zero_reviews_path']
+INCOMPLETE_STATS_PATH = paths['incomplete_stats_path']
+ZERO_REVIEWS_INDEX_PATH = paths['zero_reviews_index_path']
+INCOMPLETE_STATS_INDEX_PATH = paths['incomplete_stats_index_path']
 
-def get_movie_info(letterboxd_url):
-    response = requests.get(letterboxd_url)
+# Batch checking
+BATCH_WORKERS = 8
+REQUEST_TIMEOUT = 30
+REPORT_COLUMNS = ['URL', 'Title', 'Year', 'Whitelisted', 'Blacklisted', 'Zero Reviews', 'Incomplete Stats', 'Close Matches', 'Error']
+
+def create_session(workers=BATCH_WORKERS):
+    """A requests session with retries and one pooled connection per worker."""
+    session = requests.Session()
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=workers, pool_maxsize=workers)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def get_movie_info(letterboxd_url, session=None):
+    response = (session or requests).get(letterboxd_url, timeout=REQUEST_TIMEOUT)
     soup = BeautifulSoup(response.text, 'html.parser')
     og_title = soup.find('meta', property='og:title')
     if not og_title:
@@ -46,35 +84,119 @@ def get_movie_info(letterboxd_url):
 def normalize_text(text):
     return unicodedata.normalize('NFKC', str(text)).strip()
 
-def load_normalized_whitelist():
-    df = pd.read_excel(WHITELIST_PATH, header=0, usecols=[0,1], names=['Title', 'Year'])
+def load_normalized_list(path, has_link=True):
+    """Read Title, Year and Link from a list workbook.
+
+    Link is the fourth column of the whitelist, blacklist and Zero_Reviews workbooks;
+    the incomplete stats whitelist has no Link column.
+    """
+    if has_link:
+        df = pd.read_excel(path, header=0, usecols=[0, 1, 3], names=['Title', 'Year', 'Link'])
+        df['Link'] = df['Link'].fillna('')
+    else:
+        df = pd.read_excel(path, header=0, usecols=[0, 1], names=['Title', 'Year'])
+        df['Link'] = ''
     df['Title'] = df['Title'].apply(normalize_text)
     df['Year'] = df['Year'].astype(str).str.strip()
     return df
 
-def is_whitelisted(title, year, df, url=None):
-    title = normalize_text(title)
-    year = str(year).strip()
-    
-    # URL is king - if we have a URL, check for URL match first
-    if url:
-        match = df[df['Link'] == url]
-        if not match.empty:
-            return True
-    
-    # Only proceed with title/year matching if no URL match was found or no URL was provided
-    match = df[
-        (df['Title'].str.lower() == title.lower()) &
-        (df['Year'] == year)
-    ]
-    return not match.empty
+def load_title_index(path, index_path, has_link=True):
+    """Build the title index for a workbook once and reuse it until the workbook changes."""
+    def build():
+        df = load_normalized_list(path, has_link)
+        return TitleIndex.build(zip(df['Title'], df['Year'], df['Link']))
+    return load_cached_frame(path, index_path, build)
 
-def find_close_matches(title, whitelist_titles, n=3, cutoff=0.6):
-    return difflib.get_close_matches(title, whitelist_titles, n=n, cutoff=cutoff)
+def load_whitelist_index():
+    return load_title_index(WHITELIST_PATH, WHITELIST_INDEX_PATH)
 
-if __name__ == "__main__":
+def load_blacklist_index():
+    return load_title_index(BLACKLIST_PATH, BLACKLIST_INDEX_PATH)
+
+def load_all_indexes():
+    """Title indexes for every list a film can be on, keyed by report column."""
+    return {
+        'Whitelisted': load_whitelist_index(),
+        'Blacklisted': load_blacklist_index(),
+        'Zero Reviews': load_title_index(ZERO_REVIEWS_PATH, ZERO_REVIEWS_INDEX_PATH),
+        'Incomplete Stats': load_title_index(INCOMPLETE_STATS_PATH, INCOMPLETE_STATS_INDEX_PATH, has_link=False)
+    }
+
+def is_whitelisted(title, year, index, url=None):
+    # URL is king - if we have a URL, check for URL match first, then title and year
+    return index.contains(title, year, url)
+
+def find_close_matches(title, index, n=3, cutoff=0.6):
+    """Return up to n (title, years, score) whitelist entries with a title similar to title."""
+    return index.close_matches(title, n=n, cutoff=cutoff)
+
+def find_close_matches_batch(titles, index, n=3, cutoff=0.6):
+    return index.batch_close_matches(titles, n=n, cutoff=cutoff)
+
+def check_url(url, indexes, session):
+    """Resolve one URL and check it against every list. Errors are reported, not raised."""
+    row = dict.fromkeys(REPORT_COLUMNS, '')
+    row['URL'] = url
+    try:
+        title, year = get_movie_info(url, session)
+    except Exception as e:
+        row['Error'] = str(e)
+        return row
+
+    row['Title'] = normalize_text(title)
+    row['Year'] = year
+    for column, index in indexes.items():
+        row[column] = index.contains(title, year, url)
+    if not row['Whitelisted']:
+        row['Close Matches'] = '; '.join(
+            f"{match} ({', '.join(years)})" for match, years, _ in find_close_matches(title, indexes['Whitelisted'])
+        )
+    return row
+
+def check_urls(urls, indexes=None, workers=BATCH_WORKERS):
+    """Check many URLs concurrently through one pooled session. Rows come back in input order."""
+    indexes = indexes or load_all_indexes()
+    session = create_session(workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda url: check_url(url, indexes, session), urls))
+
+def read_urls(source):
+    """Read URLs from a file, or stdin for '-', skipping blank lines and # comments."""
+    file = sys.stdin if source == '-' else open(source, mode='r', encoding='utf-8')
+    try:
+        return [line.strip() for line in file if line.strip() and not line.lstrip().startswith('#')]
+    finally:
+        if file is not sys.stdin:
+            file.close()
+
+def write_report(rows, output=None, report_format='csv'):
+    """Write the report as CSV or JSON to output, or to stdout if no output is given."""
+    file = open(output, mode='w', newline='', encoding='utf-8') if output else sys.stdout
+    try:
+        if report_format == 'json':
+            json.dump(rows, file, ensure_ascii=False, indent=2)
+            file.write('\n')
+        else:
+            writer = csv.DictWriter(file, fieldnames=REPORT_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+    finally:
+        if output:
+            file.close()
+
+def run_batch(source, output=None, report_format='csv', workers=BATCH_WORKERS):
+    urls = read_urls(source)
+    rows = check_urls(urls, workers=workers)
+    write_report(rows, output, report_format)
+    if output:
+        flagged = sum(1 for row in rows if row['Error'] or not row['Whitelisted'] or row['Blacklisted'])
+        print(f"Checked {len(rows)} URLs, {flagged} not whitelisted, blacklisted or failed. Report saved to {output}")
+
+def run_interactive():
     print("Enter Letterboxd movie URLs one at a time. Type 'quit' to exit.")
-    df = load_normalized_whitelist()
+    whitelist_index = load_whitelist_index()
+    blacklist_index = load_blacklist_index()
+    session = create_session(1)
     while True:
         letterboxd_url = input("\nEnter Letterboxd movie URL (or 'quit' to exit): ").strip()
         if letterboxd_url.lower() == 'quit':
@@ -82,24 +204,35 @@ if __name__ == "__main__":
             break
 
         try:
-            title, year = get_movie_info(letterboxd_url)
+            title, year = get_movie_info(letterboxd_url, session)
             print(f"Movie found: {normalize_text(title)} ({year})")
             print(f"Comparing: '{normalize_text(title).lower()}' to whitelist entries")
-            if is_whitelisted(title, year, df, letterboxd_url):
+            if is_whitelisted(title, year, whitelist_index, letterboxd_url):
                 print("✅ This movie IS in the whitelist.")
             else:
                 print("❌ This movie is NOT in the whitelist.")
-                whitelist_titles = df['Title'].str.lower().tolist()
-                scraped_title = normalize_text(title).lower()
-                close_matches = find_close_matches(scraped_title, whitelist_titles)
+                close_matches = find_close_matches(title, whitelist_index)
                 if close_matches:
                     print("Did you mean one of these?")
-                    for match in close_matches:
-                        match_rows = df[df['Title'].str.lower() == match]
-                        years_for_match = match_rows['Year'].unique()
+                    for match, years_for_match, _ in close_matches:
                         years_str = ', '.join(years_for_match)
                         year_match = str(year).strip() in years_for_match
                         print(f"  - {match} (whitelist year(s): {years_str}) {'<-- year matches!' if year_match else ''}")
                     print(f"Scraped year: '{year}'")
+            if blacklist_index.contains(title, year, letterboxd_url):
+                print("⚫ This movie IS in the blacklist.")
         except Exception as e:
-            print(f"Error: {e}")
\ No newline at end of file
+            print(f"Error: {e}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check Letterboxd films against the whitelist, blacklist, zero reviews and incomplete stats lists.")
+    parser.add_argument('source', nargs='?', help="File of Letterboxd URLs, one per line, or '-' for stdin. Omit for interactive mode.")
+    parser.add_argument('-o', '--output', help="Report path (default: stdout)")
+    parser.add_argument('-f', '--format', choices=['csv', 'json'], default='csv', help="Report format")
+    parser.add_argument('-w', '--workers', type=int, default=BATCH_WORKERS, help="Concurrent page fetches")
+    args = parser.parse_args()
+
+    if args.source:
+        run_batch(args.source, args.output, args.format, args.workers)
+    else:
+        run_interactive()
\ No newline at end of file
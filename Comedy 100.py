@@ -15,6 +15,13 @@ import re
 import os
 import platform
 from tqdm import tqdm
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Set
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from listing_page import missing_fields, parse_list_entry
+from ttl_cache import MISSING, TTLCache
 
 # Detect operating system and set appropriate paths
 def get_os_specific_paths():
@@ -39,6 +46,15 @@ def get_os_specific_paths():
 paths = get_os_specific_paths()
 output_dir = paths['output_dir']
 
+# Take title, year and ID from the list page markup; film pages are then only needed for watch counts
+LISTING_ONLY = True
+
+# Configure settings
+FILM_WORKERS = 8
+FILM_WINDOW = 24  # Films being evaluated ahead of the next one to confirm, in list order
+WATCH_COUNT_CACHE_PATH = os.path.join(paths['base_dir'], 'comedy_watch_counts.json')
+WATCH_COUNT_TTL = 7 * 24 * 60 * 60  # Watch counts are refetched after a week
+
 # Define a custom print function
 def print_to_csv(message: str):
     """Prints a message to the terminal and appends it to All_Outputs.csv."""
@@ -47,139 +63,196 @@ def print_to_csv(message: str):
         writer = csv.writer(file)
         writer.writerow([message])  # Write the message as a new row
 
-def create_session():
+def create_session(workers: int = FILM_WORKERS):
     session = requests.Session()
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=workers, pool_maxsize=workers)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     session.headers.update({
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     })
     return session
 
-def process_film(session, film_url, list_number, min_watches, approved_films):
-    try:
-        if not film_url.startswith('https://'):
-            film_url = film_url.strip('/')
-            film_url = f"https://letterboxd.com/film/{film_url}/"
-            
-        response = session.get(film_url, timeout=10)
+def parse_film_page(html) -> Dict:
+    """Read title, year, film ID and watch count from a film page.
+
+    watch_count is None when the page has no usable count, with the reason in error.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    title_tag = soup.find('meta', property='og:title')
+    title_text = title_tag['content'] if title_tag else "Unknown Title"
+    
+    # Extract year and title
+    year = ''
+    if '(' in title_text and ')' in title_text:
+        year = title_text[title_text.rindex('(')+1:title_text.rindex(')')]
+        title = title_text[:title_text.rindex('(')].strip()
+    else:
+        title = title_text
+    
+    film_poster_div = soup.find('div', class_='film-poster')
+    film_id = film_poster_div.get('data-film-id') if film_poster_div else "Unknown"
+    
+    watch_count = None
+    error = None
+    json_ld = soup.find('script', type='application/ld+json')
+    if json_ld:
+        try:
+            json_text = json_ld.string.strip()
+            if '/* <![CDATA[ */' in json_text:
+                json_text = json_text.replace('/* <![CDATA[ */', '').replace('/* ]]> */', '')
+            film_data = json.loads(json_text)
+            watch_count = film_data.get('aggregateRating', {}).get('ratingCount', 0)
+        except json.JSONDecodeError:
+            error = 'Error parsing watch count'
+    else:
+        error = 'No watch count data'
+    
+    return {'title': title, 'year': year, 'id': film_id, 'watch_count': watch_count, 'error': error}
+
+def fetch_film(session, film: Dict) -> Dict:
+    response = session.get(film['url'], timeout=10)
+    response.raise_for_status()
+    return parse_film_page(response.text)
+
+def iter_list_entries(session, base_url) -> Iterator[Dict]:
+    """Yield the list's films in rank order, loading each list page only when it is reached."""
+    page = 1
+    while True:
+        print_to_csv(f"\n=== Page {page} ===")
+        try:
+            response = session.get(f'{base_url}page/{page}/', timeout=10)
+            response.raise_for_status()
+        except Exception as e:
+            print_to_csv(f"Error processing page: {str(e)}")
+            return
         soup = BeautifulSoup(response.content, 'html.parser')
         
-        # Get film details early to check for duplicates
-        title_tag = soup.find('meta', property='og:title')
-        title_text = title_tag['content'] if title_tag else "Unknown Title"
-        
-        # Extract year and title
-        year = ''
-        if '(' in title_text and ')' in title_text:
-            year = title_text[title_text.rindex('(')+1:title_text.rindex(')')]
-            title = title_text[:title_text.rindex('(')].strip()
-        else:
-            title = title_text
-            
-        # Check for duplicate using title+year combination
-        film_key = f"{title}_{year}"
-        if film_key in approved_films:
-            print_to_csv(f"❌ {title_text} - Not added (Duplicate film)")
-            return None
-            
-        # Get film ID after duplicate check
-        film_poster_div = soup.find('div', class_='film-poster')
-        film_id = film_poster_div.get('data-film-id') if film_poster_div else "Unknown"
-        
-        # Extract watch count and title first for logging
-        title_tag = soup.find('meta', property='og:title')
-        title_text = title_tag['content'] if title_tag else "Unknown Title"
+        film_grid = soup.find('ul', class_='poster-list')
+        if not film_grid:
+            return
+        for poster in film_grid.find_all('div', class_='film-poster'):
+            film = parse_list_entry(poster)
+            if film and film['slug']:
+                yield film
         
-        json_ld = soup.find('script', type='application/ld+json')
-        if json_ld:
-            try:
-                json_text = json_ld.string.strip()
-                if '/* <![CDATA[ */' in json_text:
-                    json_text = json_text.replace('/* <![CDATA[ */', '').replace('/* ]]> */', '')
-                film_data = json.loads(json_text)
-                
-                watch_count = film_data.get('aggregateRating', {}).get('ratingCount', 0)
-                if watch_count < min_watches:
-                    print_to_csv(f"❌ {title_text} - Not added (Watch count: {watch_count} < {min_watches})")
-                    return None
-            except json.JSONDecodeError:
-                print_to_csv(f"❌ {title_text} - Not added (Error parsing watch count)")
-                return None
-        else:
-            print_to_csv(f"❌ {title_text} - Not added (No watch count data)")
-            return None
+        if not soup.find('a', class_='next'):
+            return
+        page += 1
 
-        print_to_csv(f"✅ {title_text} - Added")
-        approved_films.add(film_key)  # Add the title+year combination to approved set
-        return {
-            'title': title,
-            'year': year,
-            'id': film_id,
-            'original_order': list_number  # Rename to make purpose clearer
-        }
-        
+def needs_film_page(film: Dict, cached_count) -> bool:
+    """Whether the film page must be loaded, i.e. the list entry or the cache lacks something."""
+    if not (LISTING_ONLY and not missing_fields(film)):
+        return True
+    return cached_count is MISSING
+
+def evaluate_film(film: Dict, future: Optional[Future], cached_count, list_number, min_watches, approved_films: Set[str], watch_counts: TTLCache) -> Optional[Dict]:
+    """Decide whether a film is added, given its list entry and its loaded page (if one was needed).
+
+    cached_count is the watch count read from the cache when the film was queued, so an
+    entry that expires in the meantime does not matter.
+    """
+    try:
+        page_data = future.result() if future else None
     except Exception as e:
-        print_to_csv(f"❌ {film_url} - Not added (Error: {str(e)})")
+        print_to_csv(f"❌ {film['url']} - Not added (Error: {str(e)})")
+        return None
+    
+    if LISTING_ONLY and not missing_fields(film):
+        title, year, film_id = film['title'], film['year'], film['film_id']
+    else:
+        title, year, film_id = page_data['title'], page_data['year'], page_data['id']
+    title_text = f"{title} ({year})" if year else title
+    
+    # Check for duplicate using title+year combination
+    film_key = f"{title}_{year}"
+    if film_key in approved_films:
+        print_to_csv(f"❌ {title_text} - Not added (Duplicate film)")
         return None
+    
+    if page_data is not None:
+        if page_data['watch_count'] is None:
+            print_to_csv(f"❌ {title_text} - Not added ({page_data['error']})")
+            return None
+        watch_count = page_data['watch_count']
+        watch_counts.set(film['slug'], watch_count)
+    else:
+        watch_count = cached_count
+    
+    if watch_count < min_watches:
+        print_to_csv(f"❌ {title_text} - Not added (Watch count: {watch_count} < {min_watches})")
+        return None
+
+    print_to_csv(f"✅ {title_text} - Added")
+    approved_films.add(film_key)  # Add the title+year combination to approved set
+    return {
+        'title': title,
+        'year': year,
+        'id': film_id,
+        'original_order': list_number  # Rename to make purpose clearer
+    }
 
-def process_page(session, url, max_films, min_watches, approved_films):
+def collect_films(session, base_url, max_films, min_watches, watch_counts: TTLCache) -> List[Dict]:
+    """Find the first max_films qualifying films in list order.
+
+    The next FILM_WINDOW films are always being loaded in the background, but films are
+    confirmed strictly in list order, so duplicates resolve the same way as a sequential
+    pass. Once the last film needed is confirmed, the remaining work is cancelled.
+    """
+    films = iter_list_entries(session, base_url)
+    pending = deque()
+    all_movies = []
+    approved_films = set()
+    executor = ThreadPoolExecutor(max_workers=FILM_WORKERS)
+    
+    def fill_window():
+        while len(pending) < FILM_WINDOW:
+            film = next(films, None)
+            if film is None:
+                return
+            cached_count = watch_counts.get(film['slug'])
+            future = executor.submit(fetch_film, session, film) if needs_film_page(film, cached_count) else None
+            pending.append((film, future, cached_count))
+    
     try:
-        # Check if we've already hit the max_films limit before processing the page
-        if len(approved_films) >= max_films:
-            return False, []
-            
-        response = session.get(url, timeout=10)
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        film_grid = soup.find('ul', class_='poster-list')
-        if not film_grid:
-            return False, []
-            
-        film_elements = film_grid.find_all('div', class_='film-poster')
-        film_data_list = []
+        fill_window()
+        while pending and len(all_movies) < max_films:
+            film, future, cached_count = pending.popleft()
+            movie = evaluate_film(film, future, cached_count, len(all_movies) + 1, min_watches, approved_films, watch_counts)
+            if movie:
+                all_movies.append(movie)
+                if len(all_movies) % 10 == 0:
+                    print_to_csv(f"Progress: {len(all_movies)}/{max_films} movies collected")
+            fill_window()
         
-        for i, film in enumerate(film_elements, 1):
-            # Check if we've hit the max_films limit before processing each film
-            if len(approved_films) >= max_films:
-                print_to_csv(f"\nReached maximum number of films ({max_films}). Stopping...")
-                return False, film_data_list
-                
-            film_url = film.get('data-film-slug')
-            if film_url:
-                film_data = process_film(session, film_url, len(approved_films) + 1, min_watches, approved_films)
-                if film_data:
-                    film_data_list.append(film_data)
-                    
-        has_next = bool(soup.find('a', class_='next'))
-        return has_next, film_data_list
-        
-    except Exception as e:
-        print_to_csv(f"Error processing page: {str(e)}")
-        return False, []
+        if len(all_movies) >= max_films:
+            print_to_csv(f"\nReached maximum number of films ({max_films}). Stopping...")
+    finally:
+        for _, future, _ in pending:
+            if future:
+                future.cancel()
+        executor.shutdown(wait=False)
+    
+    return all_movies
 
 def main():
     base_url = 'https://letterboxd.com/asset/list/stand-up-comedy-a-comprehensive-list/by/rating/'
     min_watches = 1000
     max_films = 100
     
+    start_time = time.time()
     session = create_session()
-    all_movies = []
-    approved_films = set()  # Changed from approved_ids to approved_films
-    page = 1
-    
-    while True:  # Changed from while len(all_movies) < max_films
-        url = f'{base_url}page/{page}/'
-        print_to_csv(f"\n=== Page {page} ===")
-        print_to_csv(f"Progress: {len(all_movies)}/{max_films} movies collected")
-        
-        has_next, page_data = process_page(session, url, max_films, min_watches, approved_films)
-        all_movies.extend(page_data)
-        
-        # Check if we've hit the max_films limit or reached the end of pages
-        if len(approved_films) >= max_films or not has_next:
-            break
-            
-        page += 1
-        time.sleep(1)
+    watch_counts = TTLCache(WATCH_COUNT_CACHE_PATH, WATCH_COUNT_TTL)
+    try:
+        all_movies = collect_films(session, base_url, max_films, min_watches, watch_counts)
+    finally:
+        watch_counts.save()
     
     # Save to CSV maintaining original order
     list_name = "stand_up_comedy"  # You can modify this based on your list
@@ -192,7 +265,7 @@ def main():
         for movie in all_movies:  # Will naturally maintain the order from processing
             writer.writerow([movie['title'], movie['year'], movie['id']])
     
-    print_to_csv(f"Scraped {len(all_movies)} movies")
+    print_to_csv(f"Scraped {len(all_movies)} movies in {time.time() - start_time:.1f} seconds")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
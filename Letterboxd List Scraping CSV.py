@@ -1,8 +1,7 @@
 import requests
 from bs4 import BeautifulSoup
-import pandas as pd
 from time import sleep
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import threading
@@ -19,6 +18,9 @@ import os
 import platform
 from tqdm import tqdm
 import csv
+from collections import deque
+from typing import Dict, List, Optional
+from listing_page import missing_fields, parse_list_entry
 
 # Detect operating system and set appropriate paths
 def get_os_specific_paths():
@@ -43,18 +45,77 @@ def get_os_specific_paths():
 paths = get_os_specific_paths()
 output_dir = paths['output_dir']
 
-# Thread-safe list for storing movie data
-class ThreadSafeList:
-    def __init__(self):
-        self.items = []
+# Configure settings
+FILM_WORKERS = 10  # Film pages fetched at once, across listing pages
+OUTPUT_COLUMNS = ['Title', 'Year']
+# Build rows from the list page markup and only load a film's page for fields it lacks
+LISTING_ONLY = True
+
+# Used for slots whose film page could not be scraped
+FAILED = object()
+
+class OrderedFilmWriter:
+    """Streams scraped films to a CSV in list order while they complete in any order.
+
+    Every film gets a slot numbered by its place in the list. Finished films fill their
+    slot, and whenever the slots from the last written one onward are filled they are
+    written out, so the CSV always holds a contiguous prefix of the list.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.slots: List[Optional[Dict]] = []
+        self.written = 0
+        self.filled = 0
+        self.scraped = 0
         self.lock = threading.Lock()
-    
-    def append(self, item):
+        self.changed = threading.Condition(self.lock)
+        self.file = open(path, mode='w', newline='', encoding='utf-8')
+        self.writer = csv.DictWriter(self.file, fieldnames=OUTPUT_COLUMNS)
+        self.writer.writeheader()
+
+    def reserve(self, count: int) -> int:
+        """Add count empty slots and return the index of the first one."""
         with self.lock:
-            self.items.append(item)
-    
+            first = len(self.slots)
+            self.slots.extend([None] * count)
+            return first
+
     def __len__(self):
-        return len(self.items)
+        with self.lock:
+            return len(self.slots)
+
+    def wait_for_room(self, max_films: int) -> int:
+        """Block until fewer than max_films films are scraped or in flight, then return the scraped count.
+
+        Failed films free their place, so the run keeps going until max_films rows are written.
+        """
+        with self.changed:
+            while self.scraped + (len(self.slots) - self.filled) >= max_films and self.filled < len(self.slots):
+                self.changed.wait()
+            return self.scraped
+
+    def fill(self, index: int, row) -> None:
+        """Store a finished film (or FAILED) and write out any newly contiguous rows."""
+        with self.lock:
+            self.slots[index] = row
+            self.filled += 1
+            self.changed.notify_all()
+            if row is not FAILED:
+                self.scraped += 1
+                if self.scraped % 10 == 0:
+                    print(f'Scraped {self.scraped} titles. Latest: {row["Title"]}')
+            while self.written < len(self.slots) and self.slots[self.written] is not None:
+                ready = self.slots[self.written]
+                if ready is not FAILED:
+                    self.writer.writerow(ready)
+                # Written rows are not needed again
+                self.slots[self.written] = FAILED
+                self.written += 1
+            self.file.flush()
+
+    def close(self) -> None:
+        self.file.close()
 
 def create_session():
     session = requests.Session()
@@ -71,7 +132,8 @@ def create_session():
     })
     return session
 
-def process_film(session, film_url, movies_data):
+def process_film(session, film_url) -> Optional[Dict]:
+    """Scrape one film page, returning its row or None if it could not be read."""
     try:
         film_response = session.get(f"https://letterboxd.com{film_url}", timeout=10)
         film_response.raise_for_status()
@@ -88,16 +150,23 @@ def process_film(session, film_url, movies_data):
             else:
                 title = title_text
             
-            movies_data.append({'Title': title, 'Year': year})
-            
-            if len(movies_data) % 10 == 0:
-                print(f'Scraped {len(movies_data)} titles. Latest: {title}')
-            
             sleep(0.05)  # Reduced sleep time
+            return {'Title': title, 'Year': year}
     except Exception as e:
         print(f"Error processing film {film_url}: {e}")
+    return None
+
+def scrape_film(session, film: Dict, writer: OrderedFilmWriter) -> None:
+    row = process_film(session, film['path'])
+    if row is None:
+        print(f"Skipping film {film['position']} on page {film['page']}: {film['url']}")
+    writer.fill(film['index'], row if row is not None else FAILED)
+
+def process_page(session, url, page):
+    """Read every film on a list page, tagged with its page and position.
 
-def process_page(session, url, movies_data, max_films):
+    Returns (films, has_next).
+    """
     try:
         response = session.get(url, timeout=10)
         response.raise_for_status()
@@ -106,27 +175,19 @@ def process_page(session, url, movies_data, max_films):
         film_list = soup.find('ul', class_='js-list-entries poster-list -p125 -grid film-list')
         
         if not film_list:
-            return False
+            return [], False
             
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = []
-            for li in film_list.find_all('li', class_='poster-container'):
-                if max_films and len(movies_data) >= max_films:
-                    return False
-                    
-                film_url = li.find('div', class_='film-poster').get('data-target-link')
-                if film_url:
-                    futures.append(
-                        executor.submit(process_film, session, film_url, movies_data)
-                    )
-            
-            for future in as_completed(futures):
-                future.result()
+        films = []
+        for position, li in enumerate(film_list.find_all('li', class_='poster-container'), start=1):
+            film = parse_list_entry(li)
+            if film:
+                film.update({'page': page, 'position': position})
+                films.append(film)
         
-        return bool(soup.find('a', class_='next'))
+        return films, bool(soup.find('a', class_='next'))
     except Exception as e:
         print(f"Error processing page {url}: {e}")
-        return False
+        return [], False
 
 def main():
     # Configure these as needed
@@ -137,22 +198,38 @@ def main():
         base_url += '/'
     
     session = create_session()
-    movies_data = ThreadSafeList()
+    output_csv = os.path.join(output_dir, 'film_titles.csv')
+    writer = OrderedFilmWriter(output_csv)
+    queue = deque()
+    has_next = True
     page = 1
     
-    while True:
-        url = f'{base_url}page/{page}/'
-        has_next = process_page(session, url, movies_data, max_films)
-        
-        if not has_next or (max_films and len(movies_data) >= max_films):
-            break
-            
-        page += 1
+    # Films are given slots one at a time in list order and never waited on, so the next
+    # page is fetched while earlier films are still being scraped
+    try:
+        with ThreadPoolExecutor(max_workers=FILM_WORKERS) as executor:
+            while True:
+                if max_films and writer.wait_for_room(max_films) >= max_films:
+                    break
+                
+                if not queue:
+                    if not has_next:
+                        break
+                    films, has_next = process_page(session, f'{base_url}page/{page}/', page)
+                    queue.extend(films)
+                    page += 1
+                    continue
+                
+                film = queue.popleft()
+                film['index'] = writer.reserve(1)
+                if LISTING_ONLY and not missing_fields(film, ('title', 'year')):
+                    writer.fill(film['index'], {'Title': film['title'], 'Year': film['year']})
+                else:
+                    executor.submit(scrape_film, session, film, writer)
+    finally:
+        writer.close()
     
-    df = pd.DataFrame(movies_data.items)
-    output_csv = os.path.join(output_dir, 'film_titles.csv')
-    df.to_csv(output_csv, index=False)
-    print(f"\nScraping complete. {len(movies_data)} films saved to {output_csv}")
+    print(f"\nScraping complete. {writer.scraped} films saved to {output_csv}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
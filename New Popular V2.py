@@ -2,8 +2,6 @@
 import time
 import random
 from selenium import webdriver
-from selenium.webdriver.firefox.service import Service
-from selenium.webdriver.firefox.options import Options
 from selenium.webdriver.common.by import By
 import pandas as pd
 import requests
@@ -15,12 +13,22 @@ from datetime import datetime
 from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
 from typing import Dict, List, Set, Tuple, Optional
-from dataclasses import dataclass
 from collections import defaultdict
 import unicodedata
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import json
+from film_record import FilmRecord
+from whitelist_journal import ChangeJournal
+from workbook_cache import load_cached_frame, store_cached_frame
+from film_page import empty_film_details, extract_film_details, mpaa_from_release_countries, parse_rating_summary
+from driver_pool import DriverPool, launch_firefox
+from data_audit import DataAuditor
+from ttl_cache import MISSING, TTLCache
+from chunked_csv import ChunkedCSVWriter
+from listing_page import POSTER_SELECTOR, ListingPage, parse_listing_page
+from page_prefetcher import PagePrefetcher
+from report_renderer import PLAIN_FOOTER, format_updated_date, render_report, write_reports
+from geography import CONTINENTS_COUNTRIES, continents_for_countries
 
 # Define a custom print function
 def print_to_csv(message: str):
@@ -43,7 +51,19 @@ MIN_RATING_COUNT = 1000
 MIN_RUNTIME = 40
 MAX_RETRIES = 25
 RETRY_DELAY = 15
+DRIVER_POOL_SIZE = 1  # Browsers kept warm for the whole run
+DRIVER_MAX_PAGES = 250  # Page loads before a browser is restarted to release memory
+# Zero-review films are re-checked once their entry is this old. Films near the top of a
+# listing gain reviews fastest, so the age grows with listing position up to the max.
+ZERO_REVIEWS_MIN_AGE = 7 * 24 * 60 * 60
+ZERO_REVIEWS_MAX_AGE = 90 * 24 * 60 * 60
+ZERO_REVIEWS_POSITION_SCALE = 5000
+DATA_AUDIT_SIZE = 25  # Stalest whitelist entries re-verified per run
+DATA_AUDIT_WORKERS = 4
+PREFETCH_WORKERS = 4  # HTTP workers loading the next listing page and its film pages
+MPAA_CACHE_TTL = 180 * 24 * 60 * 60  # Certifications rarely change, so re-read them twice a year
 CHUNK_SIZE = 1900
+LISTING_REREADS = 3  # Re-reads of a short listing page before it is refreshed once
 
 # Configure specific maxes
 MAX_180 = 75
@@ -61,6 +81,14 @@ BLACKLIST_PATH = os.path.join(LIST_DIR, 'blacklist.xlsx')
 WHITELIST_PATH = os.path.join(LIST_DIR, 'whitelist.xlsx')
 INCOMPLETE_STATS_WHITELIST_PATH = os.path.join(LIST_DIR, 'Incomplete_Stats_Whitelist.xlsx')
 ZERO_REVIEWS_PATH = os.path.join(LIST_DIR, 'Zero_Reviews.xlsx')  # Add new path
+WHITELIST_JOURNAL_PATH = os.path.join(LIST_DIR, 'whitelist_journal.jsonl')
+WHITELIST_CACHE_PATH = os.path.join(LIST_DIR, 'whitelist.cache.pkl')
+INCOMPLETE_STATS_WHITELIST_CACHE_PATH = os.path.join(LIST_DIR, 'Incomplete_Stats_Whitelist.cache.pkl')
+ZERO_REVIEWS_CACHE_PATH = os.path.join(LIST_DIR, 'Zero_Reviews.cache.pkl')
+MPAA_CACHE_PATH = os.path.join(LIST_DIR, 'mpaa_cache.json')
+ZERO_REVIEWS_CHECKED_PATH = os.path.join(LIST_DIR, 'zero_reviews_checked.json')
+WHITELIST_VERIFIED_PATH = os.path.join(LIST_DIR, 'whitelist_verified.json')
+LINK_CANDIDATES_PATH = os.path.join(LIST_DIR, 'link_candidates.json')  # Crawled URLs for whitelist entries without a Link
 
 # TMDb API key
 TMDB_API_KEY = ''
@@ -108,16 +136,6 @@ runtime_stats = {
                          'country_counts': defaultdict(int)}
 }
 
-# Define continents and their associated countries in a case-insensitive manner
-CONTINENTS_COUNTRIES = {
-    'Africa': ['Algeria', 'Angola', 'Benin', 'Botswana', 'Burkina Faso', 'Burundi', 'Cabo Verde', 'Cameroon', 'Central African Republic', 'Chad', 'Comoros', 'Congo, Democratic Republic of the', 'Congo, Republic of the', 'Djibouti', 'Egypt', 'Equatorial Guinea', 'Eritrea', 'Eswatini', 'Ethiopia', 'Gabon', 'Gambia', 'Ghana', 'Guinea', 'Guinea-Bissau', 'Kenya', 'Lesotho', 'Liberia', 'Libya', 'Madagascar', 'Malawi', 'Mali', 'Mauritania', 'Mauritius', 'Morocco', 'Mozambique', 'Namibia', 'Niger', 'Nigeria', 'Rwanda', 'Sao Tome and Principe', 'Senegal', 'Seychelles', 'Sierra Leone', 'Somalia', 'South Africa', 'South Sudan', 'Sudan', 'Tanzania', 'Togo', 'Tunisia', 'Uganda', 'Zambia', 'Zimbabwe'],
-    'Asia': ['State of Palestine', 'Hong Kong', 'Afghanistan', 'Armenia', 'Azerbaijan', 'Bahrain', 'Bangladesh', 'Bhutan', 'Brunei', 'Cambodia', 'China', 'Cyprus', 'Georgia', 'India', 'Indonesia', 'Iran', 'Iraq', 'Israel', 'Japan', 'Jordan', 'Kazakhstan', 'Kuwait', 'Kyrgyzstan', 'Laos', 'Lebanon', 'Malaysia', 'Maldives', 'Mongolia', 'Myanmar', 'Nepal', 'North Korea', 'Oman', 'Pakistan', 'Palestine', 'Philippines', 'Qatar', 'Russia', 'Saudi Arabia', 'Singapore', 'South Korea', 'Sri Lanka', 'Syrian Arab Republic', 'Taiwan', 'Tajikistan', 'Thailand', 'Timor-Leste', 'Turkey', 'Turkmenistan', 'United Arab Emirates', 'Uzbekistan', 'Vietnam', 'Yemen'],
-    'Europe': ['East Germany', 'North Macedonia', 'Yugoslavia', 'Serbia and Montenegro', 'Czechoslovakia', 'Czechia', 'USSR', 'Albania', 'Latvia', 'Andorra', 'Liechtenstein', 'Armenia', 'Lithuania', 'Austria', 'Luxembourg', 'Azerbaijan', 'Malta', 'Belarus', 'Moldova', 'Belgium', 'Monaco', 'Bosnia and Herzegovina', 'Montenegro', 'Bulgaria', 'Netherlands', 'Croatia', 'Norway', 'Cyprus', 'Poland', 'Czech Republic', 'Portugal', 'Denmark', 'Romania', 'Estonia', 'Russia', 'Finland', 'San Marino', 'Former Yugoslav Republic of Macedonia', 'Serbia', 'France', 'Slovakia', 'Georgia', 'Slovenia', 'Germany', 'Spain', 'Greece', 'Sweden', 'Hungary', 'Switzerland', 'Iceland', 'Ireland', 'Turkey', 'Italy', 'Ukraine', 'Kosovo', 'UK'],
-    'North America': ['Cuba', 'The Bahamas', 'Bermuda', 'Canada', 'The Caribbean', 'Clipperton Island', 'Greenland', 'Mexico', 'Saint Pierre and Miquelon', 'Turks and Caicos Islands', 'USA', 'Belize', 'Costa Rica', 'El Salvador', 'Guatemala', 'Honduras', 'Nicaragua', 'Panama'],
-    'Oceania': ['Australia', 'Fiji', 'Kiribati', 'Marshall Islands', 'Micronesia', 'Nauru', 'New Zealand', 'Palau', 'Papua New Guinea', 'Samoa', 'Solomon Islands', 'Tonga', 'Tuvalu', 'Vanuatu'],
-    'South America': ['Argentina', 'Bolivia', 'Brazil', 'Chile', 'Colombia', 'Ecuador', 'Guyana', 'Paraguay', 'Peru', 'Suriname', 'Uruguay', 'Bolivarian Republic of Venezuela', 'The Falkland Islands', 'South Georgia and the South Sandwich Islands', 'French Guiana'],
-}
-
 # Initialize continent stats with additional counts
 continent_stats = {
     continent: {
@@ -132,16 +150,6 @@ continent_stats = {
     } for continent in CONTINENTS_COUNTRIES.keys()
 }
 
-@dataclass
-class MovieData:
-    title: str
-    year: str
-    tmdb_id: Optional[str] = None
-    rating_count: int = 0
-    runtime: int = 0
-    keywords: List[str] = None
-    genres: List[str] = None
-
 class RequestsSession:
     def __init__(self):
         self.session = requests.Session()
@@ -160,15 +168,60 @@ class RequestsSession:
 def normalize_text(text):
     return unicodedata.normalize('NFKC', str(text)).strip()
 
+def read_whitelist_workbook() -> pd.DataFrame:
+    """Read whitelist.xlsx with normalized Title and Year columns."""
+    # Read whitelist with explicit string type for Year column and include Information and Link columns
+    whitelist = pd.read_excel(WHITELIST_PATH, header=0, names=['Title', 'Year', 'Information', 'Link'], dtype={'Year': str})
+    whitelist['Title'] = whitelist['Title'].apply(normalize_text)
+    whitelist['Year'] = whitelist['Year'].astype(str).str.strip()
+    # Fill empty links with empty string instead of None
+    whitelist['Link'] = whitelist['Link'].fillna('')
+    return whitelist
+
+def read_incomplete_stats_workbook() -> pd.DataFrame:
+    """Read Incomplete_Stats_Whitelist.xlsx with normalized Title and Year columns."""
+    incomplete_stats_whitelist = pd.read_excel(INCOMPLETE_STATS_WHITELIST_PATH, header=0, names=['Title', 'Year'], dtype={'Year': str})
+    incomplete_stats_whitelist['Title'] = incomplete_stats_whitelist['Title'].apply(normalize_text)
+    incomplete_stats_whitelist['Year'] = incomplete_stats_whitelist['Year'].astype(str).str.strip()
+    return incomplete_stats_whitelist
+
+def read_zero_reviews_workbook() -> pd.DataFrame:
+    """Read Zero_Reviews.xlsx with normalized Title and Year columns."""
+    zero_reviews = pd.read_excel(ZERO_REVIEWS_PATH, header=0, names=['Title', 'Year', 'Blank', 'Link'], dtype={'Year': str})
+    zero_reviews['Title'] = zero_reviews['Title'].apply(normalize_text)
+    zero_reviews['Year'] = zero_reviews['Year'].astype(str).str.strip()
+    zero_reviews['Link'] = zero_reviews['Link'].fillna('')
+    zero_reviews['Blank'] = ''  # Ensure Blank column is empty
+    return zero_reviews
+
+def lookup_keys(frame: pd.DataFrame) -> List[str]:
+    """Build the title_year lookup keys for every row of a list workbook."""
+    return (frame['Title'].str.lower() + '_' + frame['Year']).tolist()
+
 class MovieProcessor:
     def __init__(self):
         self.session = RequestsSession()
         self.whitelist = None
         self.whitelist_lookup = {}
+        # Link -> whitelist_lookup key, so URL matches are O(1)
+        self.whitelist_by_link: Dict[str, str] = {}
+        # Whitelist rows added this run that have not been compacted into the workbook yet
+        self.pending_whitelist_rows: Dict[int, Dict] = {}
+        self.whitelist_journal = ChangeJournal(WHITELIST_JOURNAL_PATH)
         self.incomplete_stats_whitelist = None
         self.incomplete_stats_lookup = {}
         self.zero_reviews = None
         self.zero_reviews_lookup = {}
+        # Zero-review links for O(1) checks, plus changes held until save_zero_reviews()
+        self.zero_reviews_links: Set[str] = set()
+        self.zero_reviews_checked = TTLCache(ZERO_REVIEWS_CHECKED_PATH, ZERO_REVIEWS_MAX_AGE)
+        self.zero_reviews_added: List[List[str]] = []
+        self.zero_reviews_evicted: Set[str] = set()
+        self.data_auditor = DataAuditor(self.fetch_page_html, WHITELIST_VERIFIED_PATH, DATA_AUDIT_SIZE, DATA_AUDIT_WORKERS)
+        # URLs seen for whitelist entries with a blank Link; verified and written by Backfill Links.py
+        self.link_candidates = TTLCache(LINK_CANDIDATES_PATH, ttl=float('inf'))
+        # MPAA ratings resolved from release tabs, keyed like whitelist_lookup
+        self.mpaa_cache = TTLCache(MPAA_CACHE_PATH, MPAA_CACHE_TTL)
         self.load_whitelist()
         self.load_incomplete_stats_whitelist()
         self.load_zero_reviews()
@@ -181,6 +234,7 @@ class MovieProcessor:
         self.blacklist['Year'] = self.blacklist['Year'].astype(str).str.strip()
         # Fill empty links with empty string instead of None
         self.blacklist['Link'] = self.blacklist['Link'].fillna('')
+        self.blacklist_links: Set[str] = set(filter(None, self.blacklist['Link'].tolist()))
         
         self.added_movies: Set[Tuple[str, str]] = set()
         self.film_data: List[Dict] = []
@@ -202,55 +256,106 @@ class MovieProcessor:
     def load_whitelist(self):
         """Load and initialize the whitelist data."""
         try:
-            # Read whitelist with explicit string type for Year column and include Information and Link columns
-            self.whitelist = pd.read_excel(WHITELIST_PATH, header=0, names=['Title', 'Year', 'Information', 'Link'], dtype={'Year': str})
-            
-            # Normalize the data
-            self.whitelist['Title'] = self.whitelist['Title'].apply(normalize_text)
-            self.whitelist['Year'] = self.whitelist['Year'].astype(str).str.strip()
-            # Fill empty links with empty string instead of None
-            self.whitelist['Link'] = self.whitelist['Link'].fillna('')
+            self.whitelist = load_cached_frame(WHITELIST_PATH, WHITELIST_CACHE_PATH, read_whitelist_workbook)
             
-            # Create a lookup dictionary for faster matching
-            self.whitelist_lookup = {}
-            for idx, row in self.whitelist.iterrows():
-                key = f"{row['Title'].lower()}_{row['Year']}"
-                try:
-                    # Handle null/empty Information values by treating them as empty dictionaries
-                    if pd.isna(row['Information']) or row['Information'] == '':
-                        info = {}
-                    else:
-                        info = json.loads(row['Information']) if isinstance(row['Information'], str) else row['Information']
-                    self.whitelist_lookup[key] = (info, idx, row['Link'])
-                except (json.JSONDecodeError, TypeError):
-                    # If there's any error parsing, treat it as an empty dictionary
-                    info = {}
-                    self.whitelist_lookup[key] = (info, idx, row['Link'])
-                    continue
+            # Create a lookup dictionary for faster matching. Information JSON is only parsed
+            # when an entry is actually used; blank or unparsable cells become empty records.
+            infos = map(FilmRecord.lazy, self.whitelist['Information'].tolist())
+            self.whitelist_lookup = dict(zip(
+                lookup_keys(self.whitelist),
+                zip(infos, self.whitelist.index.tolist(), self.whitelist['Link'].tolist())
+            ))
+            self.whitelist_by_link = {link: key for key, (_, _, link) in self.whitelist_lookup.items() if link}
                 
         except FileNotFoundError:
             print_to_csv("whitelist.xlsx not found. Creating new file.")
             self.whitelist = pd.DataFrame(columns=['Title', 'Year', 'Information', 'Link'])
             self.whitelist.to_excel(WHITELIST_PATH, index=False)
 
+        # Re-apply changes journaled by a run that ended before compacting them
+        self.pending_whitelist_rows = {}
+        for entry in self.whitelist_journal.read():
+            self.apply_whitelist_change(entry['Title'], entry['Year'], FilmRecord.from_json(entry['Information']), entry['Link'])
+
+    def apply_whitelist_change(self, film_title: str, release_year: str, record: FilmRecord, link: str) -> None:
+        """Apply a whitelist change to the in-memory lookup and rows without touching disk."""
+        key = f"{film_title.lower()}_{release_year}"
+        if key in self.whitelist_lookup:
+            _, row_idx, old_link = self.whitelist_lookup[key]
+            if old_link and self.whitelist_by_link.get(old_link) == key:
+                del self.whitelist_by_link[old_link]
+        else:
+            row_idx = len(self.whitelist) + len(self.pending_whitelist_rows)
+        self.whitelist_lookup[key] = (record, row_idx, link)
+        if link:
+            self.whitelist_by_link[link] = key
+
+        row = {'Title': film_title, 'Year': release_year, 'Information': record.to_json(), 'Link': link}
+        if row_idx < len(self.whitelist):
+            self.whitelist.at[row_idx, 'Information'] = row['Information']
+            self.whitelist.at[row_idx, 'Link'] = link
+        else:
+            self.pending_whitelist_rows[row_idx] = row
+
+    def compact_whitelist(self) -> None:
+        """Write journaled whitelist changes into whitelist.xlsx and clear the journal."""
+        if not self.whitelist_journal.has_changes():
+            return
+        self.whitelist_journal.flush()
+        if self.pending_whitelist_rows:
+            new_rows = pd.DataFrame([self.pending_whitelist_rows[idx] for idx in sorted(self.pending_whitelist_rows)])
+            self.whitelist = pd.concat([self.whitelist, new_rows], ignore_index=True)
+            self.pending_whitelist_rows = {}
+        self.whitelist.to_excel(WHITELIST_PATH, index=False)
+        # The frame now matches the workbook, so the next load can skip re-reading it
+        store_cached_frame(WHITELIST_PATH, WHITELIST_CACHE_PATH, self.whitelist)
+        self.whitelist_journal.clear()
+
+    def fetch_page_html(self, url: str) -> str:
+        response = self.session.get(url, timeout=30)
+        response.raise_for_status()
+        return response.text
+
+    def add_link_candidate(self, key: str, film_url: str) -> None:
+        """Remember a crawled URL for a whitelist entry whose Link is blank.
+
+        Every distinct URL is kept so the backfill can tell an ambiguous title apart.
+        """
+        urls = self.link_candidates.get(key, [])
+        if film_url not in urls:
+            self.link_candidates.set(key, urls + [film_url])
+
+    def start_data_audit(self) -> None:
+        """Queue background re-verification of the stalest whitelist entries."""
+        entries = [(key, link, record) for key, (record, _, link) in self.whitelist_lookup.items()]
+        scheduled = self.data_auditor.start(entries)
+        if scheduled:
+            print_to_csv(f"🤓 Data audit scheduled for {scheduled} whitelist entries")
+
+    def finish_data_audit(self) -> None:
+        """Wait for the data audit and update only the whitelist entries whose fields changed."""
+        changed, failed = self.data_auditor.finish()
+        for key, error in failed:
+            print_to_csv(f"Error auditing {key}: {str(error)}")
+        for key, record, changes, fresh in changed:
+            info = record.to_dict()
+            info.update(changes)
+            if fresh.get('RatingCount'):
+                info['RatingCount'] = fresh['RatingCount']
+            film_title, release_year = info.get('Title'), info.get('Year')
+            if not film_title or not release_year:
+                continue
+            _, _, link = self.whitelist_lookup.get(key, (None, None, ''))
+            self.update_whitelist(film_title, release_year, info, link or None)
+            print_to_csv(f"🤓 Data audit updated {film_title} ({release_year}): {', '.join(changes)}")
+
     def load_incomplete_stats_whitelist(self):
         """Load and initialize the incomplete stats whitelist data."""
         try:
-            # Read incomplete stats whitelist with explicit string type for Year column
-            self.incomplete_stats_whitelist = pd.read_excel(INCOMPLETE_STATS_WHITELIST_PATH, 
-                                                          header=0, 
-                                                          names=['Title', 'Year'], 
-                                                          dtype={'Year': str})
-            
-            # Normalize the data
-            self.incomplete_stats_whitelist['Title'] = self.incomplete_stats_whitelist['Title'].apply(normalize_text)
-            self.incomplete_stats_whitelist['Year'] = self.incomplete_stats_whitelist['Year'].astype(str).str.strip()
+            self.incomplete_stats_whitelist = load_cached_frame(INCOMPLETE_STATS_WHITELIST_PATH, INCOMPLETE_STATS_WHITELIST_CACHE_PATH, read_incomplete_stats_workbook)
             
             # Create a lookup dictionary for faster matching
-            self.incomplete_stats_lookup = {}
-            for _, row in self.incomplete_stats_whitelist.iterrows():
-                key = f"{row['Title'].lower()}_{row['Year']}"
-                self.incomplete_stats_lookup[key] = True
+            self.incomplete_stats_lookup = dict.fromkeys(lookup_keys(self.incomplete_stats_whitelist), True)
                 
         except FileNotFoundError:
             print_to_csv("Incomplete_Stats_Whitelist.xlsx not found. Creating new file.")
@@ -262,20 +367,20 @@ class MovieProcessor:
         try:
             # Check if file exists
             if os.path.exists(ZERO_REVIEWS_PATH):
-                # Read zero reviews with explicit string type for Year column
-                self.zero_reviews = pd.read_excel(ZERO_REVIEWS_PATH, header=0, names=['Title', 'Year', 'Blank', 'Link'], dtype={'Year': str})
-                
-                # Normalize the data
-                self.zero_reviews['Title'] = self.zero_reviews['Title'].apply(normalize_text)
-                self.zero_reviews['Year'] = self.zero_reviews['Year'].astype(str).str.strip()
-                self.zero_reviews['Link'] = self.zero_reviews['Link'].fillna('')
-                self.zero_reviews['Blank'] = ''  # Ensure Blank column is empty
+                self.zero_reviews = load_cached_frame(ZERO_REVIEWS_PATH, ZERO_REVIEWS_CACHE_PATH, read_zero_reviews_workbook)
                             
                 # Create a lookup dictionary for faster matching
-                self.zero_reviews_lookup = {}
-                for idx, row in self.zero_reviews.iterrows():
-                    key = f"{row['Title'].lower()}_{row['Year']}"
-                    self.zero_reviews_lookup[key] = (row['Link'], idx)
+                self.zero_reviews_lookup = dict(zip(
+                    lookup_keys(self.zero_reviews),
+                    zip(self.zero_reviews['Link'].tolist(), self.zero_reviews.index.tolist())
+                ))
+                self.zero_reviews_links = set(filter(None, self.zero_reviews['Link'].tolist()))
+
+                # Entries from before last_checked was tracked start their clock now
+                now = time.time()
+                for link in self.zero_reviews_links:
+                    if self.zero_reviews_checked.checked_at(link) is None:
+                        self.zero_reviews_checked.set(link, None, now)
                     
             else:
                 self.zero_reviews = pd.DataFrame(columns=['Title', 'Year', 'Blank', 'Link'])
@@ -289,7 +394,7 @@ class MovieProcessor:
 
     def process_whitelist_info(self, info: Dict):
         """Process information from whitelist and update statistics."""
-        if not isinstance(info, dict):
+        if not isinstance(info, (dict, FilmRecord)):
             print_to_csv("❌ Info is not a dictionary, skipping")
             return
 
@@ -327,13 +432,10 @@ class MovieProcessor:
                 self.update_statistics(mpaa_rating)
 
         # Process continent data if we have countries
-        countries = info.get('Countries', [])
-        for country in countries:
-            for continent, country_list in CONTINENTS_COUNTRIES.items():
-                if country in country_list:
-                    if add_to_continent_stats(continent, info.get('Title'), info.get('Year'), info.get('tmdbID')):
-                        self.update_continent_statistics(continent)
-                    break
+        continents, _ = continents_for_countries(info.get('Countries', []))
+        for continent in continents:
+            if add_to_continent_stats(continent, info.get('Title'), info.get('Year'), info.get('tmdbID')):
+                self.update_continent_statistics(continent)
 
         # Process MAX_MOVIES_2500 using centralized function
         if add_to_max_movies_2500(info.get('Title'), info.get('Year'), info.get('tmdbID')):
@@ -343,32 +445,32 @@ class MovieProcessor:
         """Update the whitelist with new movie data."""
         try:
             key = f"{film_title.lower()}_{release_year}"
+            record = FilmRecord.from_dict(movie_data)
             
             if key in self.whitelist_lookup:
                 # Update existing entry
-                _, row_idx, existing_url = self.whitelist_lookup[key]
-                self.whitelist.at[row_idx, 'Information'] = json.dumps(movie_data)
+                _, _, existing_url = self.whitelist_lookup[key]
+                link = existing_url
                 # Only update link if it's currently blank and we have a new URL
                 if film_url and (not existing_url or existing_url == ''):
-                    self.whitelist.at[row_idx, 'Link'] = film_url
+                    link = film_url
                     print_to_csv(f"🔗 Added link to whitelist for {film_title}")
-                self.whitelist_lookup[key] = (movie_data, row_idx, film_url or existing_url)
             else:
                 # Add new entry
-                new_row = pd.DataFrame([{
-                    'Title': film_title,
-                    'Year': release_year,
-                    'Information': json.dumps(movie_data),
-                    'Link': film_url or ''
-                }])
-                self.whitelist = pd.concat([self.whitelist, new_row], ignore_index=True)
-                self.whitelist_lookup[key] = (movie_data, len(self.whitelist) - 1, film_url or '')
+                link = film_url or ''
                 if film_url:
                     print_to_csv(f"🔗 Added link to whitelist for {film_title}")
             
-            # Save to Excel
-            self.whitelist.to_excel(WHITELIST_PATH, index=False)
-            self.load_whitelist()  # Reload to ensure consistency
+            # Update the lookup in place and journal the change; the workbook is rewritten on compaction
+            self.apply_whitelist_change(film_title, release_year, record, link)
+            self.whitelist_journal.append({
+                'Title': film_title,
+                'Year': release_year,
+                'Information': record.to_json(),
+                'Link': link
+            })
+            if self.whitelist_journal.compaction_due():
+                self.compact_whitelist()
             return True
             
         except Exception as e:
@@ -380,11 +482,10 @@ class MovieProcessor:
         
         # If we have a URL, check for URL match first
         if film_url:
-            for key, value in self.whitelist_lookup.items():
-                if isinstance(value, tuple) and len(value) == 3:
-                    info, row_idx, url = value
-                    if url == film_url:
-                        return info, row_idx
+            key = self.whitelist_by_link.get(film_url)
+            if key is not None:
+                info, row_idx, _ = self.whitelist_lookup[key]
+                return info, row_idx
         
         # If no URL match or no URL provided, try title-only match
         matches = []
@@ -464,6 +565,8 @@ class MovieProcessor:
                                  columns=['Title', 'Year', 'Reason', 'Link'])
             # Append to existing blacklist
             self.blacklist = pd.concat([self.blacklist, new_row], ignore_index=True)
+            if film_url:
+                self.blacklist_links.add(film_url)
             # Save back to Excel
             self.blacklist.to_excel(BLACKLIST_PATH, index=False)
             print_to_csv(f"⚫ {film_title} ({release_year}) added to blacklist {reason}")
@@ -503,21 +606,9 @@ class MovieProcessor:
         if not categories:
             return  # Not in any category we care about
 
-        # Add the movie to the film_data for each category
+        # Add the movie to each category that still has room and update its statistics
         for category in categories:
-            runtime_stats[category]['film_data'].append({
-                'Title': film_title,
-                'Year': release_year,
-                'tmdbID': tmdb_id
-            })
-
-            # Now check if we should update statistics
-            max_movies_limit = (
-                MAX_180 if category == '180_Minutes_or_Greater' else
-                MAX_240 if category == '240_Minutes_or_Greater' else
-                MAX_MOVIES_RUNTIME
-            )
-            if len(runtime_stats[category]['film_data']) <= max_movies_limit:
+            if add_to_runtime_stats(category, film_title, release_year, tmdb_id):
                 self.update_runtime_statistics(film_title, release_year, tmdb_id, driver, category)
 
     def update_runtime_statistics(self, film_title: str, release_year: str, tmdb_id: str, driver, category: str):
@@ -686,10 +777,8 @@ class MovieProcessor:
     def is_blacklisted(self, film_title: str, release_year: str = None, film_url: str = None, driver = None) -> bool:
         """Check if a movie is in the blacklist using a lookup dictionary."""
         # If we have a URL, check for URL match first
-        if film_url:
-            for _, row in self.blacklist.iterrows():
-                if row['Link'] == film_url:
-                    return True
+        if film_url in self.blacklist_links:
+            return True
         
         # If no URL match or no URL provided, try title matching
         normalized_title = normalize_text(film_title).lower()
@@ -726,6 +815,7 @@ class MovieProcessor:
                     if release_year and str(row['Year']).strip() == str(release_year).strip():
                         # Update the blacklist with the link
                         self.blacklist.loc[row.name, 'Link'] = film_url
+                        self.blacklist_links.add(film_url)
                         self.blacklist.to_excel(BLACKLIST_PATH, index=False)
                         print_to_csv(f"🔗 Added link to blacklist for {film_title}")
                         return True
@@ -758,85 +848,68 @@ class MovieProcessor:
         return key in self.incomplete_stats_lookup
 
     def add_to_zero_reviews(self, film_title: str, release_year: str, film_url: str):
-        """Add a movie to the zero reviews list."""
-        try:
-            # Check if movie is already in zero_reviews by URL
-            if any(self.zero_reviews['Link'] == film_url):
-                return
-             
-            # Create a new row as a DataFrame
-            new_row = pd.DataFrame([[film_title, release_year, '', film_url]], 
-                                 columns=['Title', 'Year', 'Blank', 'Link'])
-            
-            # Append to existing zero reviews
-            self.zero_reviews = pd.concat([self.zero_reviews, new_row], ignore_index=True)
-                        
-            # Save back to Excel immediately
-            try:
-                self.zero_reviews.to_excel(ZERO_REVIEWS_PATH, index=False)
-            except Exception as excel_error:
-                print_to_csv(f"ERROR saving to Excel: {str(excel_error)}")
-                print_to_csv(f"ERROR type: {type(excel_error)}")
-                raise
-            
-        except Exception as e:
-            print_to_csv(f"ERROR adding to zero reviews: {str(e)}")
-            print_to_csv(f"ERROR type: {type(e)}")
-            print_to_csv(f"ERROR details: {e.__dict__ if hasattr(e, '__dict__') else 'No details available'}")
-            raise  # Re-raise the exception to see the full traceback
+        """Add a movie to the zero reviews list. The workbook is written by save_zero_reviews()."""
+        # Check if movie is already in zero_reviews by URL
+        if film_url in self.zero_reviews_links:
+            return
 
-    def is_zero_reviews(self, film_title: str, release_year: str, film_url: str) -> bool:
-        """Check if a movie is in the zero reviews list."""
-        try:
-            # Check if the URL exists in the zero_reviews DataFrame
-            if film_url:
-                result = any(self.zero_reviews['Link'] == film_url)
-                if result:
-                    # 1 in 15 chance to remove the entry after finding it
-                    if random.random() < (1/15):
-                        # Find the index of the row to remove
-                        idx_to_remove = self.zero_reviews[self.zero_reviews['Link'] == film_url].index[0]
-                        # Remove the row
-                        self.zero_reviews = self.zero_reviews.drop(idx_to_remove)
-                        # Save the updated DataFrame
-                        self.zero_reviews.to_excel(ZERO_REVIEWS_PATH, index=False)
-                        print_to_csv(f"🗑️ Removed {film_title} from zero reviews list")
-                return result
-            
-            return False
-        except Exception as e:
-            print_to_csv(f"ERROR checking zero reviews: {str(e)}")
+        self.zero_reviews_links.add(film_url)
+        self.zero_reviews_checked.set(film_url, None)
+        if film_url in self.zero_reviews_evicted:
+            # Re-checked and still without reviews, so the existing row stays
+            self.zero_reviews_evicted.discard(film_url)
+        else:
+            self.zero_reviews_added.append([film_title, release_year, '', film_url])
+
+    def is_zero_reviews(self, film_title: str, release_year: str, film_url: str, position: Optional[int] = None) -> bool:
+        """Check if a movie is in the zero reviews list.
+
+        Entries older than their re-check age (see ZERO_REVIEWS_MIN_AGE) are evicted and
+        reported as not listed, so the caller loads the film page again and re-adds it if
+        it still has no reviews.
+        """
+        if not film_url or film_url not in self.zero_reviews_links:
             return False
 
+        checked_at = self.zero_reviews_checked.checked_at(film_url) or 0
+        if time.time() - checked_at < zero_reviews_recheck_age(position):
+            return True
+
+        self.zero_reviews_links.discard(film_url)
+        self.zero_reviews_checked.discard(film_url)
+        self.zero_reviews_evicted.add(film_url)
+        print_to_csv(f"🔄 Re-checking {film_title}, last confirmed with zero reviews {int((time.time() - checked_at) // 86400)} days ago")
+        return False
+
+    def save_zero_reviews(self) -> None:
+        """Write this run's zero reviews additions and evictions to Zero_Reviews.xlsx in one go."""
+        if self.zero_reviews_added or self.zero_reviews_evicted:
+            zero_reviews = self.zero_reviews[~self.zero_reviews['Link'].isin(self.zero_reviews_evicted)]
+            if self.zero_reviews_added:
+                new_rows = pd.DataFrame(self.zero_reviews_added, columns=['Title', 'Year', 'Blank', 'Link'])
+                zero_reviews = pd.concat([zero_reviews, new_rows], ignore_index=True)
+            zero_reviews.to_excel(ZERO_REVIEWS_PATH, index=False)
+            store_cached_frame(ZERO_REVIEWS_PATH, ZERO_REVIEWS_CACHE_PATH, zero_reviews)
+            if self.zero_reviews_evicted:
+                print_to_csv(f"🗑️ Removed {len(self.zero_reviews_evicted)} re-checked films from zero reviews list")
+            self.zero_reviews = zero_reviews
+            self.zero_reviews_added = []
+            self.zero_reviews_evicted = set()
+        self.zero_reviews_checked.save()
+
+def zero_reviews_recheck_age(position: Optional[int] = None) -> float:
+    """Age in seconds after which a zero-review entry seen at this listing position is re-checked."""
+    if position is None:
+        return ZERO_REVIEWS_MAX_AGE
+    scale = min(max(position, 0) / ZERO_REVIEWS_POSITION_SCALE, 1)
+    return ZERO_REVIEWS_MIN_AGE + (ZERO_REVIEWS_MAX_AGE - ZERO_REVIEWS_MIN_AGE) * scale
+
 def setup_webdriver() -> webdriver.Firefox:
-    options = Options()
-    options.headless = True
-    options.set_preference("permissions.default.image", 2)  # Disable images
-    options.set_preference("dom.ipc.plugins.enabled.libflashplayer.so", "false")
-    options.set_preference("browser.display.use_document_fonts", 0)
-    options.set_preference("browser.display.document_color_use", 2)
-    
-    # Add these preferences to prevent random downloads
-    options.set_preference("browser.download.folderList", 2)  # Use custom download location
-    options.set_preference("browser.download.manager.showWhenStarting", False)  # Don't show download manager
-    options.set_preference("browser.download.dir", os.path.join(BASE_DIR, "downloads"))  # Set download directory
-    options.set_preference("browser.helperApps.neverAsk.saveToDisk", "text/html,text/plain")  # Don't ask to save HTML files
-    options.set_preference("browser.helperApps.alwaysAsk.force", False)  # Don't force asking
-    options.set_preference("browser.download.manager.alertOnEXEOpen", False)  # Don't alert on exe downloads
-    options.set_preference("browser.download.manager.focusWhenStarting", False)  # Don't focus download manager
-    options.set_preference("browser.download.manager.useWindow", False)  # Don't use window for downloads
-    options.set_preference("browser.download.manager.showAlertOnComplete", False)  # Don't show alert when complete
-    options.set_preference("browser.download.manager.closeWhenDone", True)  # Close download manager when done
-    
-    # Add these optimizations:
-    options.set_preference("javascript.enabled", True)  # Keep JS enabled but optimize
-    options.set_preference("network.http.connection-timeout", 30)  # Reduce timeout
-    options.set_preference("network.http.max-connections-per-server", 10)  # Limit connections
-    options.set_preference("browser.cache.disk.enable", True)  # Enable disk cache
-    options.set_preference("browser.cache.memory.enable", True)  # Enable memory cache
-    
-    service = Service()
-    return webdriver.Firefox(service=service, options=options)
+    return launch_firefox(download_dir=os.path.join(BASE_DIR, "downloads"))
+
+def create_driver_pool() -> DriverPool:
+    """Launch the browsers shared by every scraper in this run."""
+    return DriverPool(setup_webdriver, size=DRIVER_POOL_SIZE, max_pages=DRIVER_MAX_PAGES)
 
 def format_time(seconds):
     """Format seconds into hours, minutes, seconds string"""
@@ -870,32 +943,7 @@ def extract_mpaa_rating(driver) -> Optional[str]:
         
         country_data = driver.execute_script(js_script)
         
-        # Process the country data
-        for data in country_data:
-            name = data['name']
-            rating = data['rating']
-            
-            if name == "USA" and rating:
-                # Handle special cases
-                if rating.upper() in ['NR', 'NOT RATED', 'UNRATED']:
-                    return 'NR'
-                
-                # Map common rating formats to MPAA ratings
-                rating_map = {
-                    'R': 'R',
-                    'PG-13': 'PG-13',
-                    'PG': 'PG',
-                    'G': 'G',
-                    'NC-17': 'NC-17',
-                    'X': 'NC-17',  # Historical rating
-                    'M': 'PG',     # Historical rating
-                    'GP': 'PG',    # Historical rating
-                }
-                
-                if rating in rating_map:
-                    return rating_map[rating]
-        
-        return None
+        return mpaa_from_release_countries(country_data)
         
     except Exception as e:
         print_to_csv(f"Error extracting MPAA rating: {str(e)}")
@@ -913,119 +961,126 @@ max_movies_2500_stats = {
     'country_counts': defaultdict(int)
 }
 
-def add_to_max_movies_2500(film_title: str, release_year: str, tmdb_id: str) -> bool:
+# (Title, Year) keys of the films already in each bucket, kept beside film_data so
+# duplicate checks are O(1) while film_data keeps the insertion order for output
+max_movies_2500_keys: Set[Tuple[str, str]] = set()
+mpaa_keys: Dict[str, Set[Tuple[str, str]]] = {rating: set() for rating in MPAA_RATINGS}
+runtime_keys: Dict[str, Set[Tuple[str, str]]] = {category: set() for category in RUNTIME_CATEGORIES}
+continent_keys: Dict[str, Set[Tuple[str, str]]] = {continent: set() for continent in CONTINENTS_COUNTRIES}
+
+# Each bucket's CSV is written as films are added and moved into place by save_results
+OUTPUT_COLUMNS = ['Title', 'Year', 'tmdbID']
+max_movies_2500_writer = ChunkedCSVWriter(os.path.join(BASE_DIR, 'popular_filtered_movie_titles{index}.csv'), OUTPUT_COLUMNS, CHUNK_SIZE)
+mpaa_writers: Dict[str, ChunkedCSVWriter] = {
+    rating: ChunkedCSVWriter(os.path.join(BASE_DIR, f'{rating.upper()}_pop_movies.csv'), OUTPUT_COLUMNS)
+    for rating in MPAA_RATINGS
+}
+runtime_writers: Dict[str, ChunkedCSVWriter] = {
+    category: ChunkedCSVWriter(os.path.join(BASE_DIR, f'{category}_pop_movies.csv'), OUTPUT_COLUMNS)
+    for category in RUNTIME_CATEGORIES
+}
+continent_writers: Dict[str, ChunkedCSVWriter] = {
+    continent: ChunkedCSVWriter(os.path.join(BASE_DIR, f'{continent.replace(" ", "_").lower()}_pop_movies.csv'), OUTPUT_COLUMNS)
+    for continent in CONTINENTS_COUNTRIES
+}
+
+def add_to_bucket(film_data: List[Dict], keys: Set[Tuple[str, str]], max_limit: int, film_title: str, release_year: str, tmdb_id: str,
+                  writer: Optional[ChunkedCSVWriter] = None) -> bool:
     """
-    Centralized function to add a movie to max_movies_2500_stats if it's not already present.
-    Returns True if the movie was added, False if it was already present or if we've reached the limit.
+    Append a movie to a bucket's film_data unless it is already present or the bucket is full.
+    The movie is also streamed to the bucket's CSV writer, if given.
+    Returns True if the movie was added.
     """
-    # Check if movie already exists
-    if any(movie['Title'] == film_title and movie['Year'] == release_year 
-           for movie in max_movies_2500_stats['film_data']):
+    key = (film_title, release_year)
+    if key in keys:
         return False
-        
-    # Check if we've reached the limit
-    if len(max_movies_2500_stats['film_data']) >= MAX_MOVIES_2500:
+    if len(film_data) >= max_limit:
         return False
-        
-    # Add the movie
-    max_movies_2500_stats['film_data'].append({
+    film_data.append({
         'Title': film_title,
         'Year': release_year,
         'tmdbID': tmdb_id
     })
+    keys.add(key)
+    if writer is not None:
+        writer.append(film_data[-1])
     return True
 
+def add_to_max_movies_2500(film_title: str, release_year: str, tmdb_id: str) -> bool:
+    """
+    Centralized function to add a movie to max_movies_2500_stats if it's not already present.
+    Returns True if the movie was added, False if it was already present or if we've reached the limit.
+    """
+    return add_to_bucket(max_movies_2500_stats['film_data'], max_movies_2500_keys, MAX_MOVIES_2500, film_title, release_year, tmdb_id, max_movies_2500_writer)
+
 def add_to_continent_stats(continent: str, film_title: str, release_year: str, tmdb_id: str) -> bool:
     """
     Centralized function to add a movie to continent_stats if it's not already present.
     Returns True if the movie was added, False if it was already present or if we've reached the limit.
     """
-    # Check if movie already exists
-    if any(movie['Title'] == film_title and movie['Year'] == release_year 
-           for movie in continent_stats[continent]['film_data']):
-        return False
-        
-    # Determine the max limit based on the continent
-    max_limit = (
-        MAX_MOVIES_AFRICA if continent == 'Africa' else
-        MAX_MOVIES_OCEANIA if continent == 'Oceania' else
-        MAX_MOVIES_SOUTH_AMERICA if continent == 'South America' else
-        MAX_MOVIES_CONTINENT
-    )
-    
-    # Check if we've reached the limit
-    if len(continent_stats[continent]['film_data']) >= max_limit:
-        return False
-        
-    # Add the movie
-    continent_stats[continent]['film_data'].append({
-        'Title': film_title,
-        'Year': release_year,
-        'tmdbID': tmdb_id
-    })
-    return True
+    return add_to_bucket(continent_stats[continent]['film_data'], continent_keys[continent], continent_limit(continent), film_title, release_year, tmdb_id, continent_writers[continent])
 
 def add_to_runtime_stats(category: str, film_title: str, release_year: str, tmdb_id: str) -> bool:
     """
     Centralized function to add a movie to runtime_stats if it's not already present.
     Returns True if the movie was added, False if it was already present or if we've reached the limit.
     """
-    # Check if movie already exists
-    if any(movie['Title'] == film_title and movie['Year'] == release_year 
-           for movie in runtime_stats[category]['film_data']):
-        return False
-        
-    # Determine the max limit based on the category
-    max_limit = (
-        MAX_180 if category == '180_Minutes_or_Greater' else
-        MAX_240 if category == '240_Minutes_or_Greater' else
-        MAX_MOVIES_RUNTIME
-    )
-    
-    # Check if we've reached the limit
-    if len(runtime_stats[category]['film_data']) >= max_limit:
-        return False
-        
-    # Add the movie
-    runtime_stats[category]['film_data'].append({
-        'Title': film_title,
-        'Year': release_year,
-        'tmdbID': tmdb_id
-    })
-    return True
+    return add_to_bucket(runtime_stats[category]['film_data'], runtime_keys[category], runtime_limit(category), film_title, release_year, tmdb_id, runtime_writers[category])
 
 def add_to_mpaa_stats(rating: str, film_title: str, release_year: str, tmdb_id: str) -> bool:
     """
     Centralized function to add a movie to mpaa_stats if it's not already present.
     Returns True if the movie was added, False if it was already present or if we've reached the limit.
     """
-    # Check if movie already exists
-    if any(movie['Title'] == film_title and movie['Year'] == release_year 
-           for movie in mpaa_stats[rating]['film_data']):
-        return False
-        
-    # Determine the max limit based on the rating
-    max_limit = (
+    return add_to_bucket(mpaa_stats[rating]['film_data'], mpaa_keys[rating], mpaa_limit(rating), film_title, release_year, tmdb_id, mpaa_writers[rating])
+
+def continent_limit(continent: str) -> int:
+    """Determine the max limit based on the continent."""
+    return (
+        MAX_MOVIES_AFRICA if continent == 'Africa' else
+        MAX_MOVIES_OCEANIA if continent == 'Oceania' else
+        MAX_MOVIES_SOUTH_AMERICA if continent == 'South America' else
+        MAX_MOVIES_CONTINENT
+    )
+
+def runtime_limit(category: str) -> int:
+    """Determine the max limit based on the category."""
+    return (
+        MAX_180 if category == '180_Minutes_or_Greater' else
+        MAX_240 if category == '240_Minutes_or_Greater' else
+        MAX_MOVIES_RUNTIME
+    )
+
+def mpaa_limit(rating: str) -> int:
+    """Determine the max limit based on the rating."""
+    return (
         MAX_MOVIES_G if rating == 'G' else
         MAX_MOVIES_NC17 if rating == 'NC-17' else
         MAX_MOVIES_MPAA
     )
-    
-    # Check if we've reached the limit
-    if len(mpaa_stats[rating]['film_data']) >= max_limit:
-        return False
-        
-    # Add the movie
-    mpaa_stats[rating]['film_data'].append({
-        'Title': film_title,
-        'Year': release_year,
-        'tmdbID': tmdb_id
-    })
-    return True
+
+def mpaa_buckets_open() -> bool:
+    """True while at least one MPAA bucket can still take another film."""
+    return any(len(mpaa_stats[rating]['film_data']) < mpaa_limit(rating) for rating in MPAA_RATINGS)
+
+def remaining_demand() -> Dict[str, int]:
+    """How many more films each capped output needs, keyed by bucket name."""
+    demand = {'MAX_MOVIES_2500': MAX_MOVIES_2500 - len(max_movies_2500_stats['film_data'])}
+    for rating in MPAA_RATINGS:
+        demand[f'MPAA {rating}'] = mpaa_limit(rating) - len(mpaa_stats[rating]['film_data'])
+    for category in RUNTIME_CATEGORIES:
+        demand[category] = runtime_limit(category) - len(runtime_stats[category]['film_data'])
+    for continent in CONTINENTS_COUNTRIES:
+        demand[continent] = continent_limit(continent) - len(continent_stats[continent]['film_data'])
+    return {bucket: max(needed, 0) for bucket, needed in demand.items()}
+
+def capped_outputs_open() -> bool:
+    """False once only the main list still needs films, so stats and bucket fields can be skipped."""
+    return any(remaining_demand().values())
 
 class LetterboxdScraper:
-    def __init__(self):
-        self.driver = setup_webdriver()
+    def __init__(self, driver=None):
+        self.driver = driver if driver is not None else setup_webdriver()
         self.processor = MovieProcessor()
         self.base_url = 'https://letterboxd.com/films/by/popular/'
         self.total_titles = 0
@@ -1033,51 +1088,32 @@ class LetterboxdScraper:
         self.valid_movies_count = 0
         self.page_number = 1
         self.start_time = time.time()
+        # Loads page N+1 and its unknown films over HTTP while page N is processed
+        self.prefetcher = PagePrefetcher(self.processor.fetch_page_html, PREFETCH_WORKERS)
         self.unknown_continent_films = []  # Initialize the list for unknown continent films
         self.top_movies_count = 0  # Track the number of movies added to the top 2500 list
+        self.main_list_only = False  # Set once every capped output is full
         print_to_csv("Initialized Letterboxd Scraper.")
 
     def process_movie_data(self, info, film_title=None, film_url=None):
         """Process movie data from the whitelist."""
         try:            
             # If we have a complete info dict, process it directly without loading the page
-            if isinstance(info, dict):
+            if isinstance(info, (dict, FilmRecord)):
                 film_title = info.get('Title')
                 release_year = info.get('Year')
                 
                 # Get whitelist data to check if we have a link
                 whitelist_info, row_idx = self.processor.get_whitelist_data(film_title, release_year, film_url)
                 
-                # Check if we need to update a blank link
+                # A blank link is not confirmed here, which would cost a page load; the URL is
+                # recorded as a candidate for the offline link backfill instead
                 if film_url:
-                    # Get the current link from whitelist
                     key = f"{film_title.lower()}_{release_year}"
                     if key in self.processor.whitelist_lookup:
                         _, _, existing_url = self.processor.whitelist_lookup[key]
-                        # Only proceed with link update if current link is blank
-                        if not existing_url or existing_url == '':
-                            try:
-                                # Load the movie page to verify it's the correct movie
-                                self.driver.get(film_url)
-                                WebDriverWait(self.driver, 10).until(
-                                    EC.presence_of_element_located((By.CSS_SELECTOR, 'meta[property="og:title"]'))
-                                )
-                                time.sleep(random.uniform(1.0, 1.5))
-                                
-                                # Extract release year from the page
-                                meta_tag = self.driver.find_element(By.CSS_SELECTOR, 'meta[property="og:title"]')
-                                content = meta_tag.get_attribute('content')
-                                if content and '(' in content and ')' in content:
-                                    page_year = content.split('(')[-1].split(')')[0].strip()
-                                    # If years match, update the whitelist with the link
-                                    if page_year == release_year:
-                                        self.processor.update_whitelist(film_title, release_year, info, film_url)
-                                    else:
-                                        print_to_csv(f"⚠️ Year mismatch for {film_title}: expected {release_year}, found {page_year}")
-                                        return False
-                            except Exception as e:
-                                print_to_csv(f"Error verifying movie link: {str(e)}")
-                                return False
+                        if not existing_url:
+                            self.processor.add_link_candidate(key, film_url)
                 
                 # Check if movie is in incomplete stats whitelist
                 if self.processor.is_incomplete_stats_whitelisted(film_title, release_year):
@@ -1107,15 +1143,10 @@ class LetterboxdScraper:
                     self.valid_movies_count += 1
                     print_to_csv(f"✅ Processed whitelist data for {info.get('Title')} ({self.valid_movies_count}/{MAX_MOVIES})")
                     
-                    # 2% chance to clear the whitelist data
-                    if random.random() < 0.02:
-                        self.processor.update_whitelist(film_title, release_year, {}, film_url)
-                        print_to_csv(f"🤓 Random data audit scheduled for {film_title} ({release_year})")
-                    
                     return True
 
             # If info is incomplete, clear the Information cell and let normal scraping handle it
-            if isinstance(info, dict):
+            if isinstance(info, (dict, FilmRecord)):
                 film_title = info.get('Title')
                 release_year = info.get('Year')
                 tmdb_id = info.get('tmdbID')
@@ -1190,13 +1221,10 @@ class LetterboxdScraper:
                                         self.processor.update_statistics(mpaa_rating)
                                 
                                 # Process continent data if we have countries
-                                countries = movie_data.get('Countries', [])
-                                for country in countries:
-                                    for continent, country_list in CONTINENTS_COUNTRIES.items():
-                                        if country in country_list:
-                                            if add_to_continent_stats(continent, film_title, release_year, movie_data.get('tmdbID')):
-                                                self.processor.update_continent_statistics(continent)
-                                            break
+                                continents, _ = continents_for_countries(movie_data.get('Countries', []))
+                                for continent in continents:
+                                    if add_to_continent_stats(continent, film_title, release_year, movie_data.get('tmdbID')):
+                                        self.processor.update_continent_statistics(continent)
                                 
                                 # Process MAX_MOVIES_2500 using centralized function
                                 if add_to_max_movies_2500(film_title, release_year, movie_data.get('tmdbID')):
@@ -1261,7 +1289,7 @@ class LetterboxdScraper:
                 return False
 
             # If info is not a dictionary or we have film_url, we need to scrape the data
-            if not isinstance(info, dict):
+            if not isinstance(info, (dict, FilmRecord)):
                 if not film_url:
                     print_to_csv(f"❌ Need to scrape data for {film_title} but no URL provided")
                     return
@@ -1342,131 +1370,35 @@ class LetterboxdScraper:
                     tmdb_id = None
                     print_to_csv(f"TMDb ID not found: {e}")
 
-                # Update statistics and collect data
-                self.update_statistics_for_movie(film_title, release_year, tmdb_id, self.driver, film_url)
-                
-                # Extract runtime
-                runtime = None
-                try:
-                    runtime_element = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, 'p.text-link.text-footer'))
-                    )
-                    runtime_text = runtime_element.text
-                    match = re.search(r'(\d+)\s*min(?:s)?', runtime_text)
-                    if match:
-                        runtime = int(match.group(1))
-                except Exception as e:
-                    print_to_csv(f"Error extracting runtime: {str(e)}")
-                    runtime = None
-
-                # Extract languages
-                movie_languages = set()
-                try:                    
-                    headings = self.driver.find_elements(By.CSS_SELECTOR, '#tab-details h3')
-                    
-                    for heading in headings:
-                        span = heading.find_element(By.TAG_NAME, 'span')
-                        heading_text = span.get_attribute('textContent').strip() if span else heading.get_attribute('textContent').strip()
-                        
-                        if any(lang in heading_text for lang in ["Language", "Primary Language", "Languages", "Primary Languages"]):
-                            try:
-                                sluglist = heading.find_element(By.XPATH, "following-sibling::div[contains(@class, 'text-sluglist')]")
-                                
-                                if sluglist:
-                                    p_tag = sluglist.find_element(By.TAG_NAME, 'p')
-                                    language_elements = p_tag.find_elements(By.CSS_SELECTOR, 'a.text-slug[href*="/films/language/"]')
-                                    
-                                    for language in language_elements:
-                                        language_name = language.get_attribute('textContent').strip()
-                                        if language_name:
-                                            movie_languages.add(language_name)
-                            except Exception:
-                                pass
-                except Exception:
-                    pass
-
-                # Extract MPAA rating
-                mpaa_rating = None
+                # Read every metadata field in one round-trip and share it with the statistics update
                 try:
-                    mpaa_rating = extract_mpaa_rating(self.driver)
+                    details = extract_film_details(self.driver)
                 except Exception as e:
-                    print_to_csv(f"Error extracting MPAA rating: {str(e)}")
+                    print_to_csv(f"Error extracting film details: {str(e)}")
+                    details = empty_film_details()
 
-                # Extract directors
-                movie_directors = []
-                try:
-                    director_elements = self.driver.find_elements(By.CSS_SELECTOR, 'span.directorlist a.contributor')
-                    for director in director_elements:
-                        director_name = director.text.strip()
-                        if director_name:
-                            movie_directors.append(director_name)
-                except Exception:
-                    pass
-
-                # Extract actors
-                movie_actors = []
-                try:
-                    actor_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-cast .text-sluglist a.text-slug.tooltip')
-                    for actor in actor_elements:
-                        actor_name = actor.text.strip()
-                        if actor_name:
-                            movie_actors.append(actor_name)
-                except Exception:
-                    pass
-
-                # Extract genres
-                movie_genres = []
-                try:
-                    genre_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-genres .text-sluglist a.text-slug[href*="/films/genre/"]')
-                    for genre in genre_elements:
-                        genre_name = genre.get_attribute('textContent').strip()
-                        if genre_name and not any(char in genre_name for char in ['…', 'Show All']):
-                            movie_genres.append(genre_name)
-                except Exception:
-                    pass
-
-                # Extract studios
-                movie_studios = []
-                try:
-                    studio_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/studio/"]')
-                    for studio in studio_elements:
-                        studio_name = studio.get_attribute('textContent').strip()
-                        if studio_name:
-                            movie_studios.append(studio_name)
-                except Exception:
-                    pass
-
-                # Extract countries
-                movie_countries = []
-                try:
-                    country_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/films/country/"]')
-                    for country in country_elements:
-                        country_name = country.get_attribute('textContent').strip()
-                        if country_name:
-                            movie_countries.append(country_name)
-                except Exception as e:
-                    print_to_csv(f"Error extracting countries: {str(e)}")
-                    movie_countries = []
+                # Update statistics and collect data
+                self.update_statistics_for_movie(film_title, release_year, tmdb_id, self.driver, film_url, details)
 
                 # Create movie data dictionary
                 movie_data = {
                     'Title': film_title,
                     'Year': release_year,
                     'tmdbID': tmdb_id,
-                    'MPAA': mpaa_rating,
-                    'Runtime': runtime,
+                    'MPAA': details['MPAA'],
+                    'Runtime': details['Runtime'],
                     'RatingCount': rating_count,
-                    'Languages': list(movie_languages),
-                    'Countries': movie_countries,
+                    'Languages': details['Languages'],
+                    'Countries': details['Countries'],
                     'Decade': (int(release_year) // 10) * 10,
-                    'Directors': movie_directors,
-                    'Genres': movie_genres,
-                    'Studios': movie_studios,
-                    'Actors': movie_actors
+                    'Directors': details['Directors'],
+                    'Genres': details['Genres'],
+                    'Studios': details['Studios'],
+                    'Actors': details['Actors']
                 }
 
             # If we have valid info dict, process it normally
-            if isinstance(info, dict):
+            if isinstance(info, (dict, FilmRecord)):
                 film_title = info.get('Title')
                 release_year = info.get('Year')
                 tmdb_id = info.get('tmdbID')
@@ -1501,13 +1433,10 @@ class LetterboxdScraper:
                         self.processor.update_statistics(mpaa_rating)
                 
                 # Process continent data if we have countries
-                countries = info.get('Countries', [])
-                for country in countries:
-                    for continent, country_list in CONTINENTS_COUNTRIES.items():
-                        if country in country_list:
-                            if add_to_continent_stats(continent, film_title, release_year, tmdb_id):
-                                self.processor.update_continent_statistics(continent)
-                            break
+                continents, _ = continents_for_countries(info.get('Countries', []))
+                for continent in continents:
+                    if add_to_continent_stats(continent, film_title, release_year, tmdb_id):
+                        self.processor.update_continent_statistics(continent)
                 
                 # Process MAX_MOVIES_2500 using centralized function
                 if add_to_max_movies_2500(film_title, release_year, tmdb_id):
@@ -1526,6 +1455,115 @@ class LetterboxdScraper:
             print_to_csv(f"Error details: {e.__dict__ if hasattr(e, '__dict__') else 'No details available'}")
             # Don't raise the exception, just continue
 
+    def warm_filter(self):
+        """Return a check for which listing films are worth prefetching.
+
+        Works on a snapshot of the whitelist and zero-review links, so the prefetch thread
+        never reads the processor's dicts while this thread is updating them.
+        """
+        known_links = set(self.processor.zero_reviews_links)
+        known_titles = set()
+        for key, value in self.processor.whitelist_lookup.items():
+            known_titles.add(key.rsplit('_', 1)[0])
+            if len(value) == 3 and value[2]:
+                known_links.add(value[2])
+        return lambda film: film['url'] not in known_links and (film['title'] or '').lower() not in known_titles
+
+    def confirm_whitelist_match(self, info, film_url: str, listing_year: Optional[str]) -> Tuple[bool, Optional[str]]:
+        """Check that the whitelist row found for a listing film really is that film.
+
+        Rows matched by URL, or whose year matches the listing's, are used without a request.
+        Otherwise the film page (the prefetched copy when there is one) must show the row's
+        year, and a matching row with a blank Link gets the URL. Returns (confirmed, page HTML).
+        """
+        film_title = info.get('Title')
+        row_year = str(info.get('Year'))
+        if not film_url or film_url in self.processor.whitelist_by_link:
+            return True, None
+        key = f"{film_title.lower()}_{row_year}"
+        entry = self.processor.whitelist_lookup.get(key)
+        existing_url = entry[2] if entry and len(entry) == 3 else ''
+        if listing_year and listing_year == row_year and not existing_url:
+            return True, None
+
+        html = self.prefetcher.take_detail(film_url)
+        if html is None:
+            try:
+                html = self.processor.fetch_page_html(film_url)
+            except Exception as e:
+                print_to_csv(f"Error verifying whitelist match for {film_title}: {str(e)}")
+                return False, None
+        page_year, _ = parse_rating_summary(html)
+        if page_year != row_year:
+            print_to_csv(f"⚠️ Year mismatch for {film_title}: whitelist has {row_year}, page has {page_year}. Scraping it instead.")
+            return False, html
+        if not existing_url:
+            self.processor.update_whitelist(film_title, row_year, info, film_url)
+        return True, html
+
+    def reject_by_rating_count(self, film_title: str, film_url: str, html: str) -> bool:
+        """Apply the zero-review and minimum rating checks to a prefetched film page.
+
+        Returns True if the film was rejected, False if it still needs the full check.
+        """
+        release_year, rating_count = parse_rating_summary(html)
+        if release_year is None:
+            # Not a film page (e.g. a challenge page); let the browser load it
+            return False
+        if rating_count == 0:
+            print_to_csv(f"📊 {film_title} has no reviews. Adding to zero reviews list.")
+            self.processor.add_to_zero_reviews(film_title, release_year, film_url)
+            self.processor.rejected_data.append([film_title, release_year, None, 'Zero reviews'])
+            return True
+        if rating_count < MIN_RATING_COUNT:
+            print_to_csv(f"❌ {film_title} was not added due to insufficient ratings: {rating_count} ratings.")
+            self.processor.rejected_data.append([film_title, release_year, None, 'Insufficient ratings (< 1000)'])
+            return True
+        return False
+
+    def load_listing_page(self, url: str) -> ListingPage:
+        """Load a listing page and parse all of its posters from one read of the page source.
+
+        Pagination tells us whether the page should be full. A short last page is accepted
+        as is; a short page mid-listing is re-read a few times while posters finish
+        rendering, then refreshed once before carrying on with what loaded.
+        """
+        page_retries = 20
+        for retry in range(page_retries):
+            try:
+                self.driver.get(url)
+                # Wait for the page to load
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, POSTER_SELECTOR))
+                )
+                break
+            except Exception as e:
+                if retry == page_retries - 1:
+                    print_to_csv(f"❌ Failed to load page after {page_retries} attempts: {str(e)}")
+                    self.save_results()  # Save progress before exiting
+                    raise Exception(f"Failed to load page after {page_retries} attempts: {str(e)}")
+                print_to_csv(f"Retry {retry + 1}/{page_retries} loading page {self.page_number}: {str(e)}")
+                time.sleep(2)
+
+        time.sleep(random.uniform(1.0, 1.5))
+
+        listing = parse_listing_page(self.driver.page_source, self.page_number)
+        for attempt in range(LISTING_REREADS + 1):
+            if listing.is_complete:
+                break
+            print_to_csv(f"Found {len(listing.films)}/{listing.expected_count} posters on page {self.page_number}, waiting... (Attempt {attempt + 1}/{LISTING_REREADS + 1})")
+            if attempt == LISTING_REREADS:
+                # Last resort before moving on with a short page
+                self.driver.refresh()
+                time.sleep(2)  # Wait for refresh
+            else:
+                time.sleep(1)
+            listing = parse_listing_page(self.driver.page_source, self.page_number)
+
+        if not listing.is_complete:
+            print_to_csv(f"⚠️ Page {self.page_number} only has {len(listing.films)}/{listing.expected_count} posters. Continuing with those.")
+        return listing
+
     def scrape_movies(self):
         seen_titles = set()  # <-- Add this at the start of the method
 
@@ -1534,92 +1572,47 @@ class LetterboxdScraper:
             url = f'{self.base_url}page/{self.page_number}/'
             print_to_csv(f"\nLoading page {self.page_number}: {url}")
             
-            # Send a GET request to the URL with retry mechanism
-            page_retries = 20
-            for retry in range(page_retries):
-                try:
-                    self.driver.get(url)
-                    # Wait for the page to load
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, 'div.react-component.poster'))
-                    )
-                    break
-                except Exception as e:
-                    if retry == page_retries - 1:
-                        print_to_csv(f"❌ Failed to load page after {page_retries} attempts: {str(e)}")
-                        self.save_results()  # Save progress before exiting
-                        raise Exception(f"Failed to load page after {page_retries} attempts: {str(e)}")
-                    print_to_csv(f"Retry {retry + 1}/{page_retries} loading page {self.page_number}: {str(e)}")
-                    time.sleep(2)
-            
-            time.sleep(random.uniform(1.0, 1.5))
-                    
-            # Find all film containers with retry mechanism
-            film_containers = []
-            container_retries = 25  # Maximum number of retries
-            for retry in range(container_retries):
-                try:
-                    film_containers = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'div.react-component.poster'))
-                    )
-                    if len(film_containers) == 72:  # Check for exactly 72 containers
-                        break
-                    else:
-                        print_to_csv(f"Found only {len(film_containers)} containers, retrying... (Attempt {retry + 1}/{container_retries})")
-                        time.sleep(5)  # Wait longer between retries
-                        self.driver.refresh()  # Refresh the page
-                        time.sleep(2)  # Wait for refresh
-                except Exception as e:
-                    if retry == container_retries - 1:
-                        print_to_csv(f"❌ Failed to find all 72 film containers after {container_retries} attempts: {str(e)}")
-                        self.save_results()  # Save progress before exiting
-                        raise Exception(f"Failed to find all 72 film containers after {container_retries} attempts: {str(e)}")
-                    print_to_csv(f"Retry {retry + 1}/{container_retries} finding film containers: {str(e)}")
-                    time.sleep(5)
-                    self.driver.refresh()
-                    time.sleep(2)
-            
-            if len(film_containers) != 72:
-                print_to_csv(f"❌ Failed to find all 72 film containers after {container_retries} attempts")
-                self.save_results()  # Save progress before exiting
-                raise Exception(f"Failed to find all 72 film containers after {container_retries} attempts")
+            listing = self.prefetcher.take_listing(self.page_number)
+            if listing is None:
+                listing = self.load_listing_page(url)
+            else:
+                print_to_csv(f"Using prefetched listing for page {self.page_number}")
+            self.prefetcher.discard_details([film['url'] for film in listing.films])
+
+            # Start on the next page while this one is processed
+            if not listing.is_last_page:
+                self.prefetcher.prefetch(self.page_number + 1, f'{self.base_url}page/{self.page_number + 1}/', self.warm_filter())
 
             print_to_csv(f"\n{f' Page {self.page_number} ':=^100}")
 
             # First collect all film data from the page
             film_data_list = []
-            for container in film_containers:
-                try:
-                    # Get the anchor element first
-                    anchor = container.find_element(By.CSS_SELECTOR, 'a')
-                    film_url = anchor.get_attribute('href')
-                    
-                    # Get the film name from the data attribute
-                    film_title = container.get_attribute('data-film-name')
+            for film in listing.films:
+                film_title = film['title']
+                film_url = film['url']
+                if film_title and film_url:
+                    # Extract year from title if possible
+                    release_year = None
+                    if '(' in film_title and ')' in film_title:
+                        release_year = film_title.split('(')[-1].split(')')[0].strip()
                     
-                    if film_title and film_url:
-                        # Extract year from title if possible
-                        release_year = None
-                        if '(' in film_title and ')' in film_title:
-                            release_year = film_title.split('(')[-1].split(')')[0].strip()
-                        
-                        # Just check if title exists in blacklist, don't try to get release year yet
-                        is_blacklisted = self.processor.is_blacklisted(film_title, release_year, film_url, None)  # Pass None as driver
-                        film_data_list.append({
-                            'title': film_title,
-                            'url': film_url,
-                            'is_blacklisted': is_blacklisted,
-                            'release_year': release_year
-                        })
-                    else:
-                        print_to_csv(f"Missing data for movie - Title: {film_title}, URL: {film_url}")
-                except Exception as e:
-                    print_to_csv(f"Error collecting film data: {str(e)}")
-                    continue
+                    # Just check if title exists in blacklist, don't try to get release year yet
+                    is_blacklisted = self.processor.is_blacklisted(film_title, release_year, film_url, None)  # Pass None as driver
+                    film_data_list.append({
+                        'title': film_title,
+                        'url': film_url,
+                        'is_blacklisted': is_blacklisted,
+                        'release_year': release_year
+                    })
+                else:
+                    print_to_csv(f"Missing data for movie - Title: {film_title}, URL: {film_url}")
 
             print_to_csv(f"Collected {len(film_data_list)} movies from page {self.page_number}")
             
             if not film_data_list:
+                if listing.is_last_page:
+                    print_to_csv("No valid film data on the last listing page. Stopping scraping.")
+                    return
                 print_to_csv("No valid film data collected. Moving to next page...")
                 self.page_number += 1
                 continue
@@ -1647,7 +1640,7 @@ class LetterboxdScraper:
                 self.total_titles += 1
                 
                 # Check if movie is in zero reviews list
-                if self.processor.is_zero_reviews(film_title, release_year, film_url):
+                if self.processor.is_zero_reviews(film_title, release_year, film_url, self.total_titles):
                     print_to_csv(f"📊 {film_title} is in zero reviews list. Skipping.")
                     continue
                 
@@ -1657,11 +1650,20 @@ class LetterboxdScraper:
                     self.processor.rejected_data.append([film_title, release_year, None, 'Blacklisted'])
                     continue
                 
-                # First check for exact matches in whitelist
+                # First check for exact matches in whitelist; a title-only match has to be confirmed
+                warmed_html = None
                 if whitelist_info:
-                    self.process_movie_data(whitelist_info, film_title, film_url)
-                    continue
+                    confirmed, warmed_html = self.confirm_whitelist_match(whitelist_info, film_url, release_year)
+                    if confirmed:
+                        self.process_movie_data(whitelist_info, film_title, film_url)
+                        continue
                                 
+                # A prefetched copy of the film page can settle the rating-count checks without the browser
+                if warmed_html is None:
+                    warmed_html = self.prefetcher.take_detail(film_url)
+                if warmed_html is not None and self.reject_by_rating_count(film_title, film_url, warmed_html):
+                    continue
+
                 # Get initial movie data without full scrape
                 movie_retries = 20  # Maximum number of retries for individual movie pages
                 for retry in range(movie_retries):
@@ -1708,20 +1710,15 @@ class LetterboxdScraper:
                             self.processor.rejected_data.append([film_title, release_year, None, 'Blacklisted'])
                             break  # Break out of retry loop since this is a permanent rejection
                         
-                        # Check 3: Runtime
+                        # Read every field the remaining checks and the stats need in one round-trip
                         try:
-                            runtime_element = WebDriverWait(self.driver, 10).until(
-                                EC.presence_of_element_located((By.CSS_SELECTOR, 'p.text-link.text-footer'))
-                            )
-                            runtime_text = runtime_element.text
-                            match = re.search(r'(\d+)\s*min(?:s)?', runtime_text)
-                            if match:
-                                runtime = int(match.group(1))
-                            else:
-                                runtime = None
+                            page_details = extract_film_details(self.driver)
                         except Exception as e:
-                            runtime = None
-                            print_to_csv(f"Error extracting runtime for {film_title}: {str(e)}")
+                            print_to_csv(f"Error extracting film details for {film_title}: {str(e)}")
+                            page_details = empty_film_details()
+                        
+                        # Check 3: Runtime
+                        runtime = page_details['Runtime']
 
                         if runtime is None:
                             print_to_csv(f"⚠️ {film_title} skipped due to missing runtime")
@@ -1738,15 +1735,7 @@ class LetterboxdScraper:
                             break  # Break out of retry loop since this is a permanent rejection
                         
                         # Check 4: TMDB ID
-                        try:
-                            body_tag = WebDriverWait(self.driver, 10).until(
-                                EC.presence_of_element_located((By.TAG_NAME, 'body'))
-                            )
-                            tmdb_id = body_tag.get_attribute('data-tmdb-id')
-                        except Exception as e:
-                            tmdb_id = None
-                            print_to_csv(f"Error extracting TMDB ID for {film_title}: {str(e)}")
-                        
+                        tmdb_id = page_details['tmdbID']
                         if not tmdb_id:
                             print_to_csv(f"❌ {film_title} was not added due to missing TMDB ID.")
                             self.processor.rejected_data.append([film_title, release_year, None, 'Missing TMDB ID'])
@@ -1774,84 +1763,21 @@ class LetterboxdScraper:
                             self.processor.add_to_blacklist(film_title, release_year, rejection_reason)
                             break  # Break out of retry loop since this is a permanent rejection
                         
-                        # Now do the full scrape and process the movie
+                        # Past the point where only the main list needs films, skip the metadata
+                        # that only feeds the capped outputs and their stats
+                        details = page_details if self.plan_stats_extraction() else None
+
                         movie_data = {
                             'Title': film_title,
                             'Year': release_year,
                             'tmdbID': tmdb_id,
                             'Runtime': runtime,
-                            'RatingCount': rating_count
+                            'RatingCount': rating_count,
+                            'Decade': (int(release_year) // 10) * 10
                         }
-
-                        # Extract directors
-                        try:
-                            director_elements = self.driver.find_elements(By.CSS_SELECTOR, 'span.directorlist a.contributor')
-                            movie_data['Directors'] = [director.text.strip() for director in director_elements if director.text.strip()]
-                        except Exception as e:
-                            print_to_csv(f"Error extracting directors: {str(e)}")
-                            movie_data['Directors'] = []
-
-                        # Extract actors
-                        try:
-                            actor_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-cast .text-sluglist a.text-slug.tooltip')
-                            movie_data['Actors'] = [actor.text.strip() for actor in actor_elements if actor.text.strip()]
-                        except Exception as e:
-                            print_to_csv(f"Error extracting actors: {str(e)}")
-                            movie_data['Actors'] = []
-
-                        # Extract genres
-                        try:
-                            genre_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-genres .text-sluglist a.text-slug[href*="/films/genre/"]')
-                            movie_data['Genres'] = [genre.get_attribute('textContent').strip() for genre in genre_elements 
-                                                  if genre.get_attribute('textContent').strip() and 
-                                                  not any(char in genre.get_attribute('textContent').strip() for char in ['…', 'Show All'])]
-                        except Exception as e:
-                            print_to_csv(f"Error extracting genres: {str(e)}")
-                            movie_data['Genres'] = []
-
-                        # Extract studios
-                        try:
-                            studio_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/studio/"]')
-                            movie_data['Studios'] = [studio.get_attribute('textContent').strip() for studio in studio_elements if studio.get_attribute('textContent').strip()]
-                        except Exception as e:
-                            print_to_csv(f"Error extracting studios: {str(e)}")
-                            movie_data['Studios'] = []
-
-                        # Extract languages
-                        movie_languages = set()
-                        try:
-                            headings = self.driver.find_elements(By.CSS_SELECTOR, '#tab-details h3')
-                            for heading in headings:
-                                span = heading.find_element(By.TAG_NAME, 'span')
-                                heading_text = span.get_attribute('textContent').strip() if span else heading.get_attribute('textContent').strip()
-                                
-                                if any(lang in heading_text for lang in ["Language", "Primary Language", "Languages", "Primary Languages"]):
-                                    try:
-                                        sluglist = heading.find_element(By.XPATH, "following-sibling::div[contains(@class, 'text-sluglist')]")
-                                        if sluglist:
-                                            p_tag = sluglist.find_element(By.TAG_NAME, 'p')
-                                            language_elements = p_tag.find_elements(By.CSS_SELECTOR, 'a.text-slug[href*="/films/language/"]')
-                                            for language in language_elements:
-                                                language_name = language.get_attribute('textContent').strip()
-                                                if language_name:
-                                                    movie_languages.add(language_name)
-                                                    self.processor.language_counts[language_name] = self.processor.language_counts.get(language_name, 0) + 1
-                                    except Exception:
-                                        pass
-                        except Exception as e:
-                            print_to_csv(f"Error extracting languages: {str(e)}")
-                        movie_data['Languages'] = list(movie_languages)
-
-                        # Extract countries
-                        try:
-                            country_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/films/country/"]')
-                            movie_data['Countries'] = [country.get_attribute('textContent').strip() for country in country_elements if country.get_attribute('textContent').strip()]
-                        except Exception as e:
-                            print_to_csv(f"Error extracting countries: {str(e)}")
-                            movie_data['Countries'] = []
-
-                        # Add decade
-                        movie_data['Decade'] = (int(release_year) // 10) * 10
+                        if details is not None:
+                            for field in ('Directors', 'Actors', 'Genres', 'Studios', 'Languages', 'Countries'):
+                                movie_data[field] = details[field]
 
                         # Add to unfiltered_approved
                         if not any(film_title.lower() == movie[0].lower() and release_year == movie[1] for movie in self.processor.unfiltered_approved):
@@ -1861,30 +1787,30 @@ class LetterboxdScraper:
                                 self.valid_movies_count += 1  # Increment the count since it's an approved movie
                                 print_to_csv(f"✅ Successfully approved {film_title} ({self.valid_movies_count}/{MAX_MOVIES})")
                                 
-                                # Process runtime category
-                                if runtime:
-                                    self.processor.process_runtime_category(film_title, release_year, tmdb_id, runtime, self.driver)
-                                
-                                # Process MPAA rating
-                                mpaa_rating = extract_mpaa_rating(self.driver)
-                                if mpaa_rating and mpaa_rating in MPAA_RATINGS:
-                                    if add_to_mpaa_stats(mpaa_rating, film_title, release_year, tmdb_id):
-                                        self.processor.update_statistics(mpaa_rating)
-                                
-                                # Process continent data
-                                for country in movie_data['Countries']:
-                                    for continent, country_list in CONTINENTS_COUNTRIES.items():
-                                        if country in country_list:
-                                            if add_to_continent_stats(continent, film_title, release_year, tmdb_id):
-                                                self.processor.update_continent_statistics(continent)
-                                            break
-                                
-                                # Process MAX_MOVIES_2500
-                                if add_to_max_movies_2500(film_title, release_year, tmdb_id):
-                                    self.processor.update_max_movies_2500_statistics(film_title, release_year, tmdb_id)
+                                if details is not None:
+                                    # Process runtime category
+                                    if runtime:
+                                        self.processor.process_runtime_category(film_title, release_year, tmdb_id, runtime, self.driver)
+                                    
+                                    # Process MPAA rating
+                                    mpaa_rating = self.resolve_mpaa_rating(film_title, release_year, details)
+                                    if mpaa_rating and mpaa_rating in MPAA_RATINGS:
+                                        if add_to_mpaa_stats(mpaa_rating, film_title, release_year, tmdb_id):
+                                            self.processor.update_statistics(mpaa_rating)
+                                    
+                                    # Process continent data
+                                    continents, _ = continents_for_countries(movie_data['Countries'])
+                                    for continent in continents:
+                                        if add_to_continent_stats(continent, film_title, release_year, tmdb_id):
+                                            self.processor.update_continent_statistics(continent)
+                                    
+                                    # Process MAX_MOVIES_2500
+                                    if add_to_max_movies_2500(film_title, release_year, tmdb_id):
+                                        self.processor.update_max_movies_2500_statistics(film_title, release_year, tmdb_id)
 
                         # Update statistics
-                        self.update_statistics_for_movie(film_title, release_year, tmdb_id, self.driver, film_url)
+                        if details is not None:
+                            self.update_statistics_for_movie(film_title, release_year, tmdb_id, self.driver, film_url, details)
                         break  # Successfully processed the movie, break out of retry loop
 
                     except Exception as e:
@@ -1895,12 +1821,49 @@ class LetterboxdScraper:
                             continue
                         raise Exception(f"Failed to process {film_title} after {movie_retries} attempts")
 
+            if listing.is_last_page:
+                print_to_csv(f"\nReached the last listing page ({self.page_number}). Stopping scraping.")
+                return
+
             self.page_number += 1
             time.sleep(random.uniform(1.0, 1.5))
 
         # If we reach here, we've successfully completed scraping
         return
 
+    def plan_stats_extraction(self) -> bool:
+        """Return True while any capped output still needs films and so needs full film metadata."""
+        if self.main_list_only:
+            return False
+        if capped_outputs_open():
+            return True
+        # Buckets only ever fill up, so this holds for the rest of the crawl
+        self.main_list_only = True
+        print_to_csv(f"📉 Every capped list is full. Fetching only main-list fields for the remaining {MAX_MOVIES - self.valid_movies_count} films.")
+        return False
+
+    def resolve_mpaa_rating(self, film_title: str, release_year: str, details: Optional[Dict] = None) -> Optional[str]:
+        """Return the film's MPAA rating, waiting on the release tab only when it is needed and not known.
+
+        The rating read by extract_film_details is used first, then the cache; the release tab
+        is only waited on when neither has one.
+        """
+        # Once every MPAA bucket is full the rating can't change any output
+        if not mpaa_buckets_open():
+            return None
+
+        key = f"{film_title.lower()}_{release_year}"
+        mpaa_rating = details.get('MPAA') if details else None
+        if mpaa_rating is None:
+            mpaa_rating = self.processor.mpaa_cache.get(key)
+            if mpaa_rating is not MISSING:
+                return mpaa_rating
+            mpaa_rating = extract_mpaa_rating(self.driver)
+        # None also covers timeouts and read errors, so only real ratings (including NR) are cached
+        if mpaa_rating is not None:
+            self.processor.mpaa_cache.set(key, mpaa_rating)
+        return mpaa_rating
+
     def process_approved_movie(self, film_title: str, release_year: str, tmdb_id: str, film_url: str, approval_type: str):
         if self.valid_movies_count >= MAX_MOVIES:
             return
@@ -2034,141 +1997,33 @@ class LetterboxdScraper:
         except Exception:
             pass
 
-    def save_max_movies_2500_results(self):
-        """Save results for MAX_MOVIES_2500."""
-        
-        # Save movie data in chunks
-        num_chunks = (len(max_movies_2500_stats['film_data']) + CHUNK_SIZE - 1) // CHUNK_SIZE
-        for i in range(num_chunks):
-            start_idx = i * CHUNK_SIZE
-            end_idx = min((i + 1) * CHUNK_SIZE, len(max_movies_2500_stats['film_data']))
-            chunk_df = pd.DataFrame(max_movies_2500_stats['film_data'][start_idx:end_idx])
-            # Only include Title, Year, and tmdbID in the output
-            chunk_df = chunk_df[['Title', 'Year', 'tmdbID']]
-            output_path = os.path.join(BASE_DIR, f'popular_filtered_movie_titles{i+1}.csv')
-            chunk_df.to_csv(output_path, index=False, encoding='utf-8')
-
-        def get_ordinal(n):
-            if 10 <= n % 100 <= 20:
-                suffix = 'th'
-            else:
-                suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
-            return str(n) + suffix
-
-        current_date = datetime.now()
-        formatted_date = current_date.strftime('%B ') + get_ordinal(current_date.day) + f", {current_date.year}"
-
-        # Save statistics for this rating
-        stats_path = os.path.join(BASE_DIR, f'popular_filtered_titles.txt')
-        with open(stats_path, mode='w', encoding='utf-8') as file:
-            file.write(f"<strong>The Top {len(max_movies_2500_stats['film_data'])} Most Popular Narrative Feature Films on Letterboxd.</strong>\n\n")
-            file.write(f"<strong>Last updated: {formatted_date}</strong>\n\n")
-            file.write("<a href=https://letterboxd.com/bigbadraj/list/the-official-list-index/> Check out more of the lists I update regularly!</a>\n\n")
-            file.write("<strong>Film eligibility criteria:</strong>\n")
-            file.write("-- Must have a minimum of 1,000 reviews on Letterboxd.\n")
-            file.write("-- Cannot be a short film (minimum 40 minutes).\n")
-            file.write("-- Cannot be a television miniseries.\n")
-            file.write("-- Cannot be a compilation of short serials.\n")
-            file.write("-- Cannot be a documentary.\n")
-            file.write("-- Cannot be a non-narrative project (paint drying for 10 hours, a timelapse of the construction of a building, abstract images, etc).\n")
-            file.write("-- Cannot be a recording of a live performance (stand-up specials, recordings of live theater, concert films, etc).\n")
-            file.write("-- Cannot be a television special episode, though feature film spin-offs from television shows are allowed.\n")
-            file.write("-- Feature film spin-offs from television shows must contain original material, not just recap or compilation of existing material.\n")
-            file.write("-- Entries that have scores inflated because they share a name with a popular television show are removed, as I notice them.\n\n")
-
-            # Mapping for display names
-            category_display_names = {
-                'director_counts': 'directors',
-                'actor_counts': 'actors',
-                'decade_counts': 'decades',
-                'genre_counts': 'genres',
-                'studio_counts': 'studios',
-                'language_counts': 'languages',
-                'country_counts': 'countries'
-            }
-
-            # Write top 10 statistics for this category
-            for category_name, counts in max_movies_2500_stats.items():
-                if category_name != 'film_data':
-                    display_name = category_display_names.get(category_name, category_name.replace('_counts', ''))
-                    file.write(f"<strong>The ten most appearing {display_name}:</strong>\n")
-                    for item, count in sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10]:
-                        file.write(f"{item}: {count}\n")
-                    file.write("\n")
-            file.write("If you notice any movies you believe should/should not be included just let me know!")
-        
-    def save_continent_results(self):
-        """Save results for each continent."""
-        category_display_names = {
-            'director_counts': 'directors',
-            'actor_counts': 'actors',
-            'decade_counts': 'decades',
-            'genre_counts': 'genres',
-            'studio_counts': 'studios',
-            'language_counts': 'languages',
-            'country_counts': 'countries'
-        }
-
-        def get_ordinal(n):
-            if 10 <= n % 100 <= 20:
-                suffix = 'th'
-            else:
-                suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
-            return str(n) + suffix
+    def save_max_movies_2500_results(self, reports: Dict[str, str], updated: str):
+        """Finalize the MAX_MOVIES_2500 CSVs and render its report into reports."""
+        # Movie data was streamed in chunks as films were added; move the last one into place
+        max_movies_2500_writer.finalize()
 
-        current_date = datetime.now()
-        formatted_date = current_date.strftime('%B ') + get_ordinal(current_date.day) + f", {current_date.year}"
+        stats_path = os.path.join(BASE_DIR, 'popular_filtered_titles.txt')
+        reports[stats_path] = render_report(
+            f"The Top {len(max_movies_2500_stats['film_data'])} Most Popular Narrative Feature Films on Letterboxd.",
+            max_movies_2500_stats, updated, footer=PLAIN_FOOTER
+        )
 
+    def save_continent_results(self, reports: Dict[str, str], updated: str):
+        """Finalize each continent's CSV and render its report into reports."""
         for continent in CONTINENTS_COUNTRIES.keys():
             continent_data = continent_stats[continent]['film_data']
             if continent_data:
-                # Determine the max limit based on the continent
-                max_limit = (
-                    MAX_MOVIES_AFRICA if continent == 'Africa' else
-                    MAX_MOVIES_OCEANIA if continent == 'Oceania' else
-                    MAX_MOVIES_SOUTH_AMERICA if continent == 'South America' else
-                    MAX_MOVIES_CONTINENT
-                )
                 # Limit to top results
-                top_data = continent_data[:int(max_limit)]  # Ensure it does not exceed the max
+                top_data = continent_data[:continent_limit(continent)]  # Ensure it does not exceed the max
                 if top_data:
-                    # Save movie data in chunks
-                    num_chunks = (len(top_data) + CHUNK_SIZE - 1) // CHUNK_SIZE
-                    for i in range(num_chunks):
-                        start_idx = i * CHUNK_SIZE
-                        end_idx = min((i + 1) * CHUNK_SIZE, len(top_data))
-                        chunk_df = pd.DataFrame(top_data[start_idx:end_idx])
-                        chunk_df = chunk_df[['Title', 'Year', 'tmdbID']]
-                        output_path = os.path.join(BASE_DIR, f'{continent.replace(" ", "_").lower()}_pop_movies.csv')
-                        chunk_df.to_csv(output_path, index=False, encoding='utf-8')
-
-                    # Save statistics for this continent
+                    # Movie data was streamed as films were added
+                    continent_writers[continent].finalize()
+
                     stats_path = os.path.join(BASE_DIR, f'stats_{continent.replace(" ", "_").lower()}_pop_movies.txt')
-                    with open(stats_path, mode='w', encoding='utf-8') as file:
-                        file.write(f"<strong>The Top {len(top_data)} Most Popular Films from {'Australia' if continent == 'Oceania' else continent}</strong>\n\n")
-                        file.write(f"<strong>Last updated: {formatted_date}</strong>\n\n")
-                        file.write("<a href=https://letterboxd.com/bigbadraj/list/the-official-list-index/> Check out more of the lists I update regularly! </a>\n\n")
-                        file.write("<strong>Film eligibility criteria:</strong>\n")
-                        file.write("-- Must have a minimum of 1,000 reviews on Letterboxd.\n")
-                        file.write("-- Cannot be a short film (minimum 40 minutes).\n")
-                        file.write("-- Cannot be a television miniseries.\n")
-                        file.write("-- Cannot be a compilation of short serials.\n")
-                        file.write("-- Cannot be a documentary.\n")
-                        file.write("-- Cannot be a non-narrative project (paint drying for 10 hours, a timelapse of the construction of a building, abstract images, etc).\n")
-                        file.write("-- Cannot be a recording of a live performance (stand-up specials, recordings of live theater, concert films, etc).\n")
-                        file.write("-- Cannot be a television special episode, though feature film spin-offs from television shows are allowed.\n")
-                        file.write("-- Feature film spin-offs from television shows must contain original material, not just recap or compilation of existing material.\n")
-                        file.write("-- Entries that have scores inflated because they share a name with a popular television show are removed, as I notice them.\n\n")
-
-                        # Write top 10 statistics for this continent
-                        for category_name, counts in continent_stats[continent].items():
-                            if category_name != 'film_data':
-                                display_name = category_display_names.get(category_name, category_name.replace('_', ' '))
-                                file.write(f"<strong>The ten most appearing {display_name}:</strong>\n")
-                                for item, count in sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10]:
-                                    file.write(f"{item}: {count}\n")
-                                file.write("\n")
-                        file.write("<strong>If you notice any movies you believe should/should not be included just let me know!</strong>")
+                    reports[stats_path] = render_report(
+                        f"The Top {len(top_data)} Most Popular Films from {'Australia' if continent == 'Oceania' else continent}",
+                        continent_stats[continent], updated
+                    )
 
                     # Ensure we only save up to MAX_MOVIES_CONTINENT in the film data
                     continent_stats[continent]['film_data'] = continent_stats[continent]['film_data'][:MAX_MOVIES_CONTINENT]
@@ -2216,169 +2071,62 @@ class LetterboxdScraper:
             for movie in self.processor.unfiltered_denied:
                 writer.writerow(movie + ["2500 Top"])
 
+        # Render every report first, then write only the ones whose content changed
+        reports: Dict[str, str] = {}
+        updated = format_updated_date()
+
         # Save MPAA results
-        self.save_mpaa_results()
+        self.save_mpaa_results(reports, updated)
 
         # Save runtime results
-        self.save_runtime_results()
+        self.save_runtime_results(reports, updated)
 
         # Save continent results
-        self.save_continent_results()
+        self.save_continent_results(reports, updated)
 
         # Save unknown continent films
         self.save_unknown_continent_films()
 
         # Save MAX_MOVIES_2500 results
-        self.save_max_movies_2500_results()
+        self.save_max_movies_2500_results(reports, updated)
 
-    def save_mpaa_results(self):
-        """Save results for each MPAA rating."""
-        
-        # Add this mapping at the beginning of the save_mpaa_results and save_runtime_results methods
-        category_display_names = {
-            'director_counts': 'directors',
-            'actor_counts': 'actors',
-            'decade_counts': 'decades',
-            'genre_counts': 'genres',
-            'studio_counts': 'studios',
-            'language_counts': 'languages',
-            'country_counts': 'countries'
-        }
+        written, unchanged = write_reports(reports)
+        print_to_csv(f"Saved {written} reports ({unchanged} unchanged).")
 
+    def save_mpaa_results(self, reports: Dict[str, str], updated: str):
+        """Finalize each MPAA rating's CSV and render its report into reports."""
         for rating in MPAA_RATINGS:
             rating_data = mpaa_stats[rating]['film_data']
             
             if rating_data:
-                # Determine the max limit based on the MPAA rating
-                max_limit = (
-                    MAX_MOVIES_G if rating == 'G' else
-                    MAX_MOVIES_NC17 if rating == 'NC-17' else
-                    MAX_MOVIES_MPAA
-                )
                 # Limit to top results
-                top_data = rating_data[:int(max_limit)]  # Ensure it does not exceed the max
+                top_data = rating_data[:mpaa_limit(rating)]  # Ensure it does not exceed the max
                 
-                # Save movie data in chunks
-                num_chunks = (len(top_data) + CHUNK_SIZE - 1) // CHUNK_SIZE
-                for i in range(num_chunks):
-                    start_idx = i * CHUNK_SIZE
-                    end_idx = min((i + 1) * CHUNK_SIZE, len(top_data))
-                    chunk_df = pd.DataFrame(top_data[start_idx:end_idx])
-                    chunk_df = chunk_df[['Title', 'Year', 'tmdbID']]
-                    output_path = os.path.join(BASE_DIR, f'{rating.upper()}_pop_movies.csv')
-                    chunk_df.to_csv(output_path, index=False, encoding='utf-8')
-
-                def get_ordinal(n):
-                    if 10 <= n % 100 <= 20:
-                        suffix = 'th'
-                    else:
-                        suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
-                    return str(n) + suffix
-
-                current_date = datetime.now()
-                formatted_date = current_date.strftime('%B ') + get_ordinal(current_date.day) + f", {current_date.year}"
+                # Movie data was streamed as films were added
+                mpaa_writers[rating].finalize()
 
-                # Save statistics for this rating
                 stats_path = os.path.join(BASE_DIR, f'stats_{rating.upper()}_pop_movies.txt')
-                with open(stats_path, mode='w', encoding='utf-8') as file:
-                    file.write(f"<strong>The Top {len(top_data)} Most Popular {rating} Rated Movies On Letterboxd</strong>\n\n")
-                    file.write("<strong>Rating defined by MPAA. Films released before November 1, 1968 are not eligible as they predate the current MPAA rating system. (Unless there was a subsequent re-rating.)</strong>\n\n")
-                    file.write(f"<strong>Last updated: {formatted_date}</strong>\n\n")
-                    file.write("<a href=https://letterboxd.com/bigbadraj/list/the-official-list-index/> Check out more of the lists I update regularly! </a>\n\n")
-                    file.write("<strong>Film eligibility criteria:</strong>\n")
-                    file.write("-- Must have a minimum of 1,000 reviews on Letterboxd.\n")
-                    file.write("-- Cannot be a short film (minimum 40 minutes).\n")
-                    file.write("-- Cannot be a television miniseries.\n")
-                    file.write("-- Cannot be a compilation of short serials.\n")
-                    file.write("-- Cannot be a documentary.\n")
-                    file.write("-- Cannot be a non-narrative project (paint drying for 10 hours, a timelapse of the construction of a building, abstract images, etc).\n")
-                    file.write("-- Cannot be a recording of a live performance (stand-up specials, recordings of live theater, concert films, etc).\n")
-                    file.write("-- Cannot be a television special episode, though feature film spin-offs from television shows are allowed.\n")
-                    file.write("-- Feature film spin-offs from television shows must contain original material, not just recap or compilation of existing material.\n")
-                    file.write("-- Entries that have scores inflated because they share a name with a popular television show are removed, as I notice them.\n\n")
-                    
-                    for category_name, counts in mpaa_stats[rating].items():
-                        if category_name != 'film_data':
-                            # Use the mapping for display names
-                            display_name = category_display_names.get(category_name, category_name.replace('_', ' '))
-                            file.write(f"<strong>The ten most appearing {display_name}:</strong>\n")
-                            for item, count in sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10]:
-                                file.write(f"{item}: {count}\n")
-                            file.write("\n")
-                    file.write("<strong>If you notice any movies you believe should/should not be included just let me know!</strong>")
+                reports[stats_path] = render_report(
+                    f"The Top {len(top_data)} Most Popular {rating} Rated Movies On Letterboxd",
+                    mpaa_stats[rating], updated,
+                    preamble="<strong>Rating defined by MPAA. Films released before November 1, 1968 are not eligible as they predate the current MPAA rating system. (Unless there was a subsequent re-rating.)</strong>\n\n"
+                )
             
-    def save_runtime_results(self):
-        """Save results for each runtime category."""
-        # Add this mapping at the beginning of the save_mpaa_results and save_runtime_results methods
-        category_display_names = {
-            'director_counts': 'directors',
-            'actor_counts': 'actors',
-            'decade_counts': 'decades',
-            'genre_counts': 'genres',
-            'studio_counts': 'studios',
-            'language_counts': 'languages',
-            'country_counts': 'countries'
-        }
-
+    def save_runtime_results(self, reports: Dict[str, str], updated: str):
+        """Finalize each runtime category's CSV and render its report into reports."""
         for category in RUNTIME_CATEGORIES.keys():
             category_data = runtime_stats[category]['film_data']
             if category_data:
-                # Determine the max limit based on the category
-                max_limit = (
-                    MAX_180 if category == '180_Minutes_or_Greater' else
-                    MAX_240 if category == '240_Minutes_or_Greater' else
-                    MAX_MOVIES_RUNTIME
-                )
                 # Limit to top results
-                top_data = category_data[:int(max_limit)]  # Ensure it does not exceed the max
-                # Save movie data in chunks
-                num_chunks = (len(top_data) + CHUNK_SIZE - 1) // CHUNK_SIZE
-                for i in range(num_chunks):
-                    start_idx = i * CHUNK_SIZE
-                    end_idx = min((i + 1) * CHUNK_SIZE, len(top_data))
-                    chunk_df = pd.DataFrame(top_data[start_idx:end_idx])
-                    chunk_df = chunk_df[['Title', 'Year', 'tmdbID']]
-                    output_path = os.path.join(BASE_DIR, f'{category}_pop_movies.csv')
-                    chunk_df.to_csv(output_path, index=False, encoding='utf-8')
-
-                def get_ordinal(n):
-                    if 10 <= n % 100 <= 20:
-                        suffix = 'th'
-                    else:
-                        suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
-                    return str(n) + suffix
+                top_data = category_data[:runtime_limit(category)]  # Ensure it does not exceed the max
+                # Movie data was streamed as films were added
+                runtime_writers[category].finalize()
 
-                current_date = datetime.now()
-                formatted_date = current_date.strftime('%B ') + get_ordinal(current_date.day) + f", {current_date.year}"
-
-                # Save statistics for this category
                 stats_path = os.path.join(BASE_DIR, f'stats_{category}_pop_movies.txt')
-                with open(stats_path, mode='w', encoding='utf-8') as file:
-                    file.write(f"<strong>The Top {len(top_data)} Most Popular Films With a Runtime of {category.replace('_', ' ')}.</strong>\n\n")
-                    file.write(f"<strong>Last updated: {formatted_date}</strong>\n\n")
-                    file.write("<a href=https://letterboxd.com/bigbadraj/list/the-official-list-index/> Check out more of the lists I update regularly! </a>\n\n")
-                    file.write("<strong>Film eligibility criteria:</strong>\n")
-                    file.write("-- Must have a minimum of 1,000 reviews on Letterboxd.\n")
-                    file.write("-- Cannot be a short film (minimum 40 minutes).\n")
-                    file.write("-- Cannot be a television miniseries.\n")
-                    file.write("-- Cannot be a compilation of short serials.\n")
-                    file.write("-- Cannot be a documentary.\n")
-                    file.write("-- Cannot be a non-narrative project (paint drying for 10 hours, a timelapse of the construction of a building, abstract images, etc).\n")
-                    file.write("-- Cannot be a recording of a live performance (stand-up specials, recordings of live theater, concert films, etc).\n")
-                    file.write("-- Cannot be a television special episode, though feature film spin-offs from television shows are allowed.\n")
-                    file.write("-- Feature film spin-offs from television shows must contain original material, not just recap or compilation of existing material.\n")
-                    file.write("-- Entries that have scores inflated because they share a name with a popular television show are removed, as I notice them.\n\n")
-                    
-                    # Ensure to limit to top 10 for each category
-                    for category_name, counts in runtime_stats[category].items():
-                        if category_name != 'film_data':
-                            # Use the mapping for display names
-                            display_name = category_display_names.get(category_name, category_name.replace('_', ' '))
-                            file.write(f"<strong>The ten most appearing {display_name}:</strong>\n")
-                            for item, count in sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10]:  # Limit to top 10
-                                file.write(f"{item}: {count}\n")
-                            file.write("\n")
-                    file.write("<strong>If you notice any movies you believe should/should not be included just let me know!</strong>")
+                reports[stats_path] = render_report(
+                    f"The Top {len(top_data)} Most Popular Films With a Runtime of {category.replace('_', ' ')}.",
+                    runtime_stats[category], updated
+                )
 
     def save_unknown_continent_films(self):
         """Save films from unknown continents to a CSV file."""
@@ -2396,32 +2144,31 @@ class LetterboxdScraper:
             writer.writerow(['Error Type', 'Error Message'])
             writer.writerow([type(error_message).__name__, error_message])  # Write the error type and message
 
-    def update_statistics_for_movie(self, film_title: str, release_year: str, tmdb_id: str, driver, film_url: str = None):
+    def update_statistics_for_movie(self, film_title: str, release_year: str, tmdb_id: str, driver, film_url: str = None, details: Optional[Dict] = None):
         """Update statistics for the given movie."""
         try:
-            # Extract directors
-            movie_directors = []
-            try:
-                director_elements = driver.find_elements(By.CSS_SELECTOR, 'span.directorlist a.contributor')
-                for director in director_elements:
-                    director_name = director.text.strip()
-                    if director_name:
-                        movie_directors.append(director_name)
-                        self.processor.director_counts[director_name] = self.processor.director_counts.get(director_name, 0) + 1
-            except Exception as e:
-                print_to_csv(f"Error extracting directors: {str(e)}")
-
-            # Extract actors
-            movie_actors = []
-            try:
-                actor_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-cast .text-sluglist a.text-slug.tooltip')
-                for actor in actor_elements:
-                    actor_name = actor.text.strip()
-                    if actor_name:
-                        movie_actors.append(actor_name)
-                        self.processor.actor_counts[actor_name] = self.processor.actor_counts.get(actor_name, 0) + 1
-            except Exception as e:
-                print_to_csv(f"Error extracting actors: {str(e)}")
+            # Read every metadata field in one round-trip unless the caller already did
+            if details is None:
+                try:
+                    details = extract_film_details(driver)
+                except Exception as e:
+                    print_to_csv(f"Error extracting film details: {str(e)}")
+                    details = empty_film_details()
+
+            movie_directors = details['Directors']
+            movie_actors = details['Actors']
+            movie_genres = details['Genres']
+            movie_studios = details['Studios']
+            movie_languages = details['Languages']
+            movie_countries = details['Countries']
+            mpaa_rating = details['MPAA']
+            runtime = details['Runtime']
+            rating_count = details['RatingCount']
+
+            for director_name in movie_directors:
+                self.processor.director_counts[director_name] = self.processor.director_counts.get(director_name, 0) + 1
+            for actor_name in movie_actors:
+                self.processor.actor_counts[actor_name] = self.processor.actor_counts.get(actor_name, 0) + 1
 
             # Extract decade
             try:
@@ -2430,96 +2177,14 @@ class LetterboxdScraper:
             except Exception as e:
                 print_to_csv(f"Error extracting decade: {str(e)}")
 
-            # Extract genres
-            movie_genres = []
-            try:
-                genre_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-genres .text-sluglist a.text-slug[href*="/films/genre/"]')
-                for genre in genre_elements:
-                    genre_name = genre.get_attribute('textContent').strip()
-                    if genre_name and not any(char in genre_name for char in ['…', 'Show All']):
-                        movie_genres.append(genre_name)
-                        self.processor.genre_counts[genre_name] = self.processor.genre_counts.get(genre_name, 0) + 1
-            except Exception as e:
-                print_to_csv(f"Error extracting genres: {str(e)}")
-
-            # Extract studios
-            movie_studios = []
-            try:
-                studio_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/studio/"]')
-                for studio in studio_elements:
-                    studio_name = studio.get_attribute('textContent').strip()
-                    if studio_name:
-                        movie_studios.append(studio_name)
-                        self.processor.studio_counts[studio_name] = self.processor.studio_counts.get(studio_name, 0) + 1
-            except Exception as e:
-                print_to_csv(f"Error extracting studios: {str(e)}")
-
-            # Extract languages
-            movie_languages = set()
-            try:
-                headings = driver.find_elements(By.CSS_SELECTOR, '#tab-details h3')
-                for heading in headings:
-                    span = heading.find_element(By.TAG_NAME, 'span')
-                    heading_text = span.get_attribute('textContent').strip() if span else heading.get_attribute('textContent').strip()
-                    
-                    if any(lang in heading_text for lang in ["Language", "Primary Language", "Languages", "Primary Languages"]):
-                        try:
-                            sluglist = heading.find_element(By.XPATH, "following-sibling::div[contains(@class, 'text-sluglist')]")
-                            if sluglist:
-                                p_tag = sluglist.find_element(By.TAG_NAME, 'p')
-                                language_elements = p_tag.find_elements(By.CSS_SELECTOR, 'a.text-slug[href*="/films/language/"]')
-                                for language in language_elements:
-                                    language_name = language.get_attribute('textContent').strip()
-                                    if language_name:
-                                        movie_languages.add(language_name)
-                                        self.processor.language_counts[language_name] = self.processor.language_counts.get(language_name, 0) + 1
-                        except Exception:
-                            pass
-            except Exception as e:
-                print_to_csv(f"Error extracting languages: {str(e)}")
-
-            # Extract MPAA rating
-            mpaa_rating = None
-            try:
-                mpaa_rating = extract_mpaa_rating(self.driver)
-            except Exception as e:
-                print_to_csv(f"Error extracting MPAA rating: {str(e)}")
-
-            # Extract runtime
-            runtime = None
-            try:
-                runtime_element = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 'p.text-link.text-footer'))
-                )
-                runtime_text = runtime_element.text
-                match = re.search(r'(\d+)\s*min(?:s)?', runtime_text)
-                if match:
-                    runtime = int(match.group(1))
-            except Exception as e:
-                print_to_csv(f"Error extracting runtime: {str(e)}")
-                runtime = None
-
-            # Extract rating count
-            rating_count = 0
-            try:
-                page_source = self.driver.page_source
-                match = re.search(r'ratingCount":(\d+)', page_source)
-                if match:
-                    rating_count = int(match.group(1))
-            except Exception as e:
-                print_to_csv(f"Error extracting rating count: {str(e)}")
-
-            # Extract countries
-            movie_countries = []
-            try:
-                country_elements = driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/films/country/"]')
-                for country in country_elements:
-                    country_name = country.get_attribute('textContent').strip()
-                    if country_name:
-                        movie_countries.append(country_name)
-                        self.processor.country_counts[country_name] = self.processor.country_counts.get(country_name, 0) + 1
-            except Exception as e:
-                print_to_csv(f"Error extracting countries: {str(e)}")
+            for genre_name in movie_genres:
+                self.processor.genre_counts[genre_name] = self.processor.genre_counts.get(genre_name, 0) + 1
+            for studio_name in movie_studios:
+                self.processor.studio_counts[studio_name] = self.processor.studio_counts.get(studio_name, 0) + 1
+            for language_name in movie_languages:
+                self.processor.language_counts[language_name] = self.processor.language_counts.get(language_name, 0) + 1
+            for country_name in movie_countries:
+                self.processor.country_counts[country_name] = self.processor.country_counts.get(country_name, 0) + 1
 
             # Create movie data dictionary
             movie_data = {
@@ -2567,12 +2232,10 @@ class LetterboxdScraper:
                             self.processor.update_statistics(mpaa_rating)
                     
                     # Process continent data if we have countries
-                    for country in movie_countries:
-                        for continent, country_list in CONTINENTS_COUNTRIES.items():
-                            if country in country_list:
-                                if add_to_continent_stats(continent, film_title, release_year, tmdb_id):
-                                    self.processor.update_continent_statistics(continent)
-                                break
+                    continents, _ = continents_for_countries(movie_countries)
+                    for continent in continents:
+                        if add_to_continent_stats(continent, film_title, release_year, tmdb_id):
+                            self.processor.update_continent_statistics(continent)
                     
                     # Process MAX_MOVIES_2500 using centralized function
                     if add_to_max_movies_2500(film_title, release_year, tmdb_id):
@@ -2588,8 +2251,10 @@ class LetterboxdScraper:
     
 def main():
     start_time = time.time()
+    driver_pool = create_driver_pool()
     try:
-        scraper = LetterboxdScraper()
+        scraper = LetterboxdScraper(driver=driver_pool.acquire())
+        scraper.processor.start_data_audit()
         scraper.scrape_movies()
         scraper.save_results()
 
@@ -2612,10 +2277,28 @@ def main():
         print_to_csv(f"❌ An error occurred during execution: {e}")
     finally:
         if 'scraper' in locals():
+            scraper.prefetcher.close()
+            try:
+                scraper.processor.finish_data_audit()
+            except Exception as e:
+                print_to_csv(f"Error finishing data audit: {str(e)}")
+            try:
+                scraper.processor.compact_whitelist()
+            except Exception as e:
+                print_to_csv(f"Error compacting whitelist: {str(e)}")
             try:
-                scraper.driver.quit()
-            except:
-                pass
+                scraper.processor.mpaa_cache.save()
+            except Exception as e:
+                print_to_csv(f"Error saving MPAA cache: {str(e)}")
+            try:
+                scraper.processor.save_zero_reviews()
+            except Exception as e:
+                print_to_csv(f"Error saving zero reviews: {str(e)}")
+            try:
+                scraper.processor.link_candidates.save()
+            except Exception as e:
+                print_to_csv(f"Error saving link candidates: {str(e)}")
+        driver_pool.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
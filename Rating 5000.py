@@ -22,8 +22,10 @@ import unicodedata
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import json
+from geography import CONTINENTS_COUNTRIES, continents_for_countries, get_continents
 from selenium.common.exceptions import NoSuchElementException
 from credentials_loader import load_credentials
+from chunked_csv import ChunkedCSVWriter
 
 # Detect operating system and set appropriate paths
 def get_os_specific_paths():
@@ -134,16 +136,6 @@ runtime_stats = {
                          'country_counts': defaultdict(int)}  # Each entry will have Title, Year, tmdbID, and URL fields
 }
 
-# Define continents and their associated countries in a case-insensitive manner
-CONTINENTS_COUNTRIES = {
-    'Africa': ['Ivory Coast', 'Algeria', 'Angola', 'Benin', 'Botswana', 'Burkina Faso', 'Burundi', 'Cabo Verde', 'Cameroon', 'Central African Republic', 'Chad', 'Comoros', 'Congo, Democratic Republic of the', 'Congo, Republic of the', 'Djibouti', 'Egypt', 'Equatorial Guinea', 'Eritrea', 'Eswatini', 'Ethiopia', 'Gabon', 'Gambia', 'Ghana', 'Guinea', 'Guinea-Bissau', 'Kenya', 'Lesotho', 'Liberia', 'Libya', 'Madagascar', 'Malawi', 'Mali', 'Mauritania', 'Mauritius', 'Morocco', 'Mozambique', 'Namibia', 'Niger', 'Nigeria', 'Rwanda', 'Sao Tome and Principe', 'Senegal', 'Seychelles', 'Sierra Leone', 'Somalia', 'South Africa', 'South Sudan', 'Sudan', 'Tanzania', 'Togo', 'Tunisia', 'Uganda', 'Zambia', 'Zimbabwe', 'Congo'],
-    'Asia': ['State of Palestine', 'Hong Kong', 'Afghanistan', 'Armenia', 'Azerbaijan', 'Bahrain', 'Bangladesh', 'Bhutan', 'Brunei', 'Cambodia', 'China', 'Cyprus', 'Georgia', 'India', 'Indonesia', 'Iran', 'Iraq', 'Israel', 'Japan', 'Jordan', 'Kazakhstan', 'Kuwait', 'Kyrgyzstan', 'Laos', 'Lebanon', 'Malaysia', 'Maldives', 'Mongolia', 'Myanmar', 'Nepal', 'North Korea', 'Oman', 'Pakistan', 'Palestine', 'Philippines', 'Qatar', 'Russia', 'Saudi Arabia', 'Singapore', 'South Korea', 'Sri Lanka', 'Syrian Arab Republic', 'Taiwan', 'Tajikistan', 'Thailand', 'Timor-Leste', 'Turkey', 'Turkmenistan', 'United Arab Emirates', 'Uzbekistan', 'Vietnam', 'Yemen', 'Syria'],
-    'Europe': ['East Germany', 'North Macedonia', 'Yugoslavia', 'Serbia and Montenegro', 'Czechoslovakia', 'Czechia', 'USSR', 'Albania', 'Latvia', 'Andorra', 'Liechtenstein', 'Armenia', 'Lithuania', 'Austria', 'Luxembourg', 'Azerbaijan', 'Malta', 'Belarus', 'Moldova', 'Belgium', 'Monaco', 'Bosnia and Herzegovina', 'Montenegro', 'Bulgaria', 'Netherlands', 'Croatia', 'Norway', 'Cyprus', 'Poland', 'Czech Republic', 'Portugal', 'Denmark', 'Romania', 'Estonia', 'Russia', 'Finland', 'San Marino', 'Former Yugoslav Republic of Macedonia', 'Serbia', 'France', 'Slovakia', 'Georgia', 'Slovenia', 'Germany', 'Spain', 'Greece', 'Sweden', 'Hungary', 'Switzerland', 'Iceland', 'Ireland', 'Turkey', 'Italy', 'Ukraine', 'Kosovo', 'UK'],
-    'North America': ['Bahamas', 'Guadeloupe', 'Cuba', 'The Bahamas', 'Bermuda', 'Canada', 'The Caribbean', 'Clipperton Island', 'Greenland', 'Mexico', 'Saint Pierre and Miquelon', 'Turks and Caicos Islands', 'USA', 'United States', 'Belize', 'Costa Rica', 'El Salvador', 'Guatemala', 'Honduras', 'Nicaragua', 'Panama', 'Dominican Republic', 'Haiti', 'Jamaica', 'Martinique', 'Netherlands Antilles', 'Puerto Rico'],
-    'Oceania': ['Australia', 'Fiji', 'Kiribati', 'Marshall Islands', 'Micronesia', 'Nauru', 'New Zealand', 'Palau', 'Papua New Guinea', 'Samoa', 'Solomon Islands', 'Tonga', 'Tuvalu', 'Vanuatu', 'French Polynesia'],
-    'South America': ['Argentina', 'Bolivia', 'Brazil', 'Chile', 'Colombia', 'Ecuador', 'Guyana', 'Paraguay', 'Peru', 'Suriname', 'Uruguay', 'Bolivarian Republic of Venezuela', 'The Falkland Islands', 'South Georgia and the South Sandwich Islands', 'French Guiana', 'Venezuela'],
-}
-
 # Initialize continent stats with additional counts
 continent_stats = {
     continent: {
@@ -401,17 +393,13 @@ class MovieProcessor:
         # Process continent data if we have countries
         countries = info.get('Countries', [])
         if countries:
-            for country in countries:
-                country_mapped = False
-                for continent, country_list in CONTINENTS_COUNTRIES.items():
-                    if country in country_list:
-                        if add_to_continent_stats(continent, info.get('Title'), info.get('Year'), info.get('tmdbID'), film_url):
-                            self.update_continent_statistics(continent, film_url)
-                        country_mapped = True
-                        break
-                if not country_mapped:
-                    unmapped_countries.add(country)
-                    print_to_csv(f"DEBUG: {info.get('Title')} has unmapped country: {country}")
+            continents, unmapped = continents_for_countries(countries)
+            for continent in continents:
+                if add_to_continent_stats(continent, info.get('Title'), info.get('Year'), info.get('tmdbID'), film_url):
+                    self.update_continent_statistics(continent, film_url)
+            for country in unmapped:
+                unmapped_countries.add(country)
+                print_to_csv(f"DEBUG: {info.get('Title')} has unmapped country: {country}")
 
 
             
@@ -992,6 +980,8 @@ max_movies_5000_stats = {
     'language_counts': defaultdict(int),
     'country_counts': defaultdict(int)
 }
+# Approved films are streamed to the chunked output files as they are added
+max_movies_5000_writer = ChunkedCSVWriter(os.path.join(output_dir, 'rating_filtered_movie_titles{index}.csv'), ['Title', 'Year', 'tmdbID', 'Link'], CHUNK_SIZE)
 
 def add_to_max_movies_5000(film_title: str, release_year: str, tmdb_id: str, film_url: str) -> bool:
     """
@@ -1011,12 +1001,14 @@ def add_to_max_movies_5000(film_title: str, release_year: str, tmdb_id: str, fil
         return False
 
     # Add the movie
-    max_movies_5000_stats['film_data'].append({
+    movie = {
         'Title': film_title,  # For reference only
         'Year': release_year,  # For reference only
         'tmdbID': tmdb_id,
         'Link': film_url  # Primary identifier
-    })
+    }
+    max_movies_5000_stats['film_data'].append(movie)
+    max_movies_5000_writer.append(movie)
     return True
 
 def add_to_continent_stats(continent: str, film_title: str, release_year: str, tmdb_id: str, film_url: str) -> bool:
@@ -1731,12 +1723,14 @@ class LetterboxdScraper:
 
             # Add to max_movies_5000_stats only if we haven't reached the limit
             if len(max_movies_5000_stats['film_data']) < MAX_MOVIES_5000:
-                max_movies_5000_stats['film_data'].append({
+                movie = {
                     'Title': film_title,
                     'Year': release_year,
                     'tmdbID': tmdb_id,
                     'Link': film_url
-                })
+                }
+                max_movies_5000_stats['film_data'].append(movie)
+                max_movies_5000_writer.append(movie)
                 # Update statistics for this movie
                 self.update_max_movies_5000_statistics(film_title, release_year, tmdb_id, self.driver, film_url)
             else:
@@ -1797,9 +1791,9 @@ class LetterboxdScraper:
                 for country in country_elements:
                     country_name = country.get_attribute('textContent').strip()
                     if country_name:
-                        # Check if the country belongs to any continent
-                        for continent, countries in CONTINENTS_COUNTRIES.items():
-                            if country_name in countries and continent not in added_to_continent:
+                        # Route the country to every continent it belongs to
+                        for continent in get_continents(country_name):
+                            if continent not in added_to_continent:
                                 # Check if we've reached the limit for this continent
                                 max_limit = (
                                     MAX_MOVIES_AFRICA if continent == 'Africa' else
@@ -1817,7 +1811,6 @@ class LetterboxdScraper:
                                     # Update continent statistics
                                     self.processor.update_continent_statistics(continent, film_url)
                                     added_to_continent.add(continent)  # Mark the continent as processed
-                                break
             except Exception:
                 pass
 
@@ -1925,15 +1918,8 @@ class LetterboxdScraper:
     def save_max_movies_5000_results(self):
         """Save results for MAX_MOVIES_5000."""
         
-        # Save movie data in chunks
-        num_chunks = (len(max_movies_5000_stats['film_data']) + CHUNK_SIZE - 1) // CHUNK_SIZE
-        for i in range(num_chunks):
-            start_idx = i * CHUNK_SIZE
-            end_idx = min((i + 1) * CHUNK_SIZE, len(max_movies_5000_stats['film_data']))
-            chunk_df = pd.DataFrame(max_movies_5000_stats['film_data'][start_idx:end_idx])
-            chunk_df = chunk_df[['Title', 'Year', 'tmdbID', 'Link']]
-            output_path = os.path.join(output_dir, f'rating_filtered_movie_titles{i+1}.csv')
-            chunk_df.to_csv(output_path, index=False, encoding='utf-8')
+        # The chunk files were written as films were approved; publish the one still open
+        max_movies_5000_writer.finalize()
 
         def get_ordinal(n):
             if 10 <= n % 100 <= 20:
@@ -1,17 +1,22 @@
 import time
 import random
-from selenium import webdriver
-from selenium.webdriver.firefox.service import Service
-from selenium.webdriver.firefox.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import pandas as pd
-import re
 import os
 import platform
 from tqdm import tqdm
 import csv
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from typing import Dict, List, Optional
+from driver_pool import DriverPool, launch_firefox
+from film_cache import FilmCache
+from film_page import parse_film_summary
+from listing_page import LISTING_PAGE_SIZE, POSTER_SELECTOR, ListingPage, parse_listing_page
 
 # Detect operating system and set appropriate paths
 def get_os_specific_paths():
@@ -38,8 +43,25 @@ def get_os_specific_paths():
 # Get OS-specific paths
 paths = get_os_specific_paths()
 EXCEL_PATH = paths['excel_path']
+FILM_CACHE_PATH = os.path.join(paths['base_dir'], 'top_250_cache.jsonl')
 output_dir = paths['output_dir']
 
+# Cached rating counts at least this far from MIN_RATING_COUNT (as a fraction of it) are trusted
+# without loading the film's page, as long as they were checked within RATING_COUNT_MAX_AGE
+RATING_COUNT_MARGIN = 0.25
+RATING_COUNT_MAX_AGE = 14 * 24 * 60 * 60
+
+# Base URL of the Letterboxd films page
+BASE_URL = 'https://letterboxd.com/films/by/rating/'
+MAX_MOVIES = 250
+MIN_RATING_COUNT = 1000
+
+# 'http' reads static HTML over a pooled session; 'selenium' drives Firefox as before
+BACKEND = 'http'
+HTTP_WORKERS = 8
+REQUEST_TIMEOUT = 15
+LISTING_RETRIES = 3
+
 # Define a custom print function
 def print_to_csv(message: str):
     """Prints a message to the terminal and appends it to All_Outputs.csv."""
@@ -49,81 +71,208 @@ def print_to_csv(message: str):
         writer.writerow([message])  # Write the message as a new row
 
 class MovieCache:
+    """Film titles, years and rating counts keyed by film URL, kept in FILM_CACHE_PATH."""
+
     def __init__(self):
-        self.cache = None
-        self.cache_lookup = {}
-        self.load_cache()
+        self.cache = FilmCache(FILM_CACHE_PATH)
+        if not len(self.cache):
+            self.import_workbook()
+        print_to_csv(f"📚 Loaded {len(self.cache)} movies from cache")
     
-    def load_cache(self):
-        """Load the Excel cache file."""
-        try:
-            self.cache = pd.read_excel(EXCEL_PATH)
-            # Create lookup dictionary for faster matching
-            for idx, row in self.cache.iterrows():
-                self.cache_lookup[row['Link']] = {
-                    'Title': row['Title'],
-                    'Year': row['Year'],
-                    'index': idx
-                }
-            print_to_csv(f"📚 Loaded {len(self.cache)} movies from cache")
-        except FileNotFoundError:
-            print_to_csv("📚 Cache file not found. Creating new file.")
-            self.cache = pd.DataFrame(columns=['Title', 'Year', 'Link'])
-            self.cache.to_excel(EXCEL_PATH, index=False)
+    def import_workbook(self):
+        """Seed the cache from top_250_data.xlsx, where earlier runs kept it."""
+        if not os.path.exists(EXCEL_PATH):
+            print_to_csv("📚 Cache file not found. Starting a new cache.")
+            return
+        workbook = pd.read_excel(EXCEL_PATH, dtype={'Year': str})
+        for record in workbook[['Title', 'Year', 'Link']].to_dict('records'):
+            if isinstance(record['Link'], str) and record['Link']:
+                self.cache.set(record['Link'], {'Title': record['Title'], 'Year': record['Year']})
+        self.cache.compact()
+    
+    def cached_decision(self, film_url: str) -> Optional[bool]:
+        """Whether a cached film meets MIN_RATING_COUNT, or None if its page has to be loaded.
+        
+        Films imported from the old workbook have no rating count; they met the cutoff when
+        they were cached and are trusted as before.
+        """
+        record = self.cache.get(film_url)
+        if record is None:
+            return None
+        rating_count = record.get('RatingCount')
+        if rating_count is None:
+            return True
+        if time.time() - record.get('CheckedAt', 0) > RATING_COUNT_MAX_AGE:
+            return None
+        margin = MIN_RATING_COUNT * RATING_COUNT_MARGIN
+        if rating_count >= MIN_RATING_COUNT + margin:
+            return True
+        if rating_count < MIN_RATING_COUNT - margin:
+            return False
+        return None
     
     def is_cached(self, film_url: str) -> bool:
-        """Check if a movie is in the cache."""
-        return film_url in self.cache_lookup
+        """Check if the cache settles a movie without loading its page."""
+        return self.cached_decision(film_url) is not None
     
-    def get_cached_data(self, film_url: str) -> dict:
+    def get_cached_data(self, film_url: str) -> Dict:
         """Get cached data for a movie."""
-        return self.cache_lookup.get(film_url)
+        return self.cache.get(film_url)
     
-    def update_cache(self, film_title: str, release_year: str, film_url: str):
-        """Update the cache with new movie data."""
-        if film_url in self.cache_lookup:
-            # Update existing entry
-            idx = self.cache_lookup[film_url]['index']
-            self.cache.at[idx, 'Title'] = film_title
-            self.cache.at[idx, 'Year'] = release_year
-            print_to_csv(f"📝 Updated cache entry for {film_title} ({release_year})")
-        else:
-            # Add new entry
-            new_row = pd.DataFrame([{
-                'Title': film_title,
-                'Year': release_year,
-                'Link': film_url
-            }])
-            self.cache = pd.concat([self.cache, new_row], ignore_index=True)
-            self.cache_lookup[film_url] = {
-                'Title': film_title,
-                'Year': release_year,
-                'index': len(self.cache) - 1
-            }
-            print_to_csv(f"💾 Added new cache entry for {film_title} ({release_year})")
-        
-        # Save to Excel immediately
-        self.cache.to_excel(EXCEL_PATH, index=False)
+    def update_cache(self, film_title: str, release_year: str, film_url: str, rating_count: Optional[int] = None):
+        """Record a movie's details and rating count; written to disk with the next batch."""
+        self.cache.set(film_url, {
+            'Title': film_title,
+            'Year': release_year,
+            'RatingCount': rating_count,
+            'CheckedAt': time.time()
+        })
+    
+    def close(self):
+        self.cache.close()
 
-# Set up Firefox options and service
-options = Options()
-options.headless = False  # Set to True if you don't want the browser to open
+class HttpBackend:
+    """Reads listing and film pages as static HTML over one pooled session.
 
-# Initialize the Firefox driver with GeckoDriver in PATH
-service = Service()
-driver = webdriver.Firefox(service=service, options=options)
+    The rating listing's poster grid can be filled in client-side, so a listing page that
+    comes back without posters is loaded in Firefox instead; the browser is only started
+    the first time that happens.
+    """
 
-# Initialize movie cache
-movie_cache = MovieCache()
+    def __init__(self, workers: int = HTTP_WORKERS):
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        retry_strategy = Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=workers, pool_maxsize=workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.fallback: Optional[SeleniumBackend] = None
 
-# Base URL of the Letterboxd films page
-base_url = 'https://letterboxd.com/films/by/rating/'
-film_titles = []
-total_titles = 0  # Counter for total titles scraped
-page_number = 1  # Start at page 1
+    def fetch(self, url: str) -> str:
+        response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response.text
 
-max_movies = 250
-MIN_RATING_COUNT = 1000
+    def static_listing_page(self, page_number: int) -> Optional[ListingPage]:
+        """The listing page as served, or None if its HTML has no posters."""
+        url = f'{BASE_URL}page/{page_number}/'
+        for retry in range(LISTING_RETRIES):
+            try:
+                listing = parse_listing_page(self.fetch(url), page_number)
+                return listing if listing.films else None
+            except Exception as e:
+                print_to_csv(f"Retry {retry + 1}/{LISTING_RETRIES} loading page {page_number}: {str(e)}")
+                time.sleep(2)
+        return None
+
+    def listing_pages(self, page_numbers: List[int]) -> List[ListingPage]:
+        listings = list(self.executor.map(self.static_listing_page, page_numbers))
+        # The browser is not thread-safe, so pages without posters are loaded one at a time here
+        for index, listing in enumerate(listings):
+            if listing is None:
+                if self.fallback is None:
+                    print_to_csv(f"No posters in the HTML for page {page_numbers[index]}; loading listing pages in Firefox")
+                    self.fallback = SeleniumBackend()
+                listings[index] = self.fallback.listing_page(page_numbers[index])
+        return listings
+
+    def film_summary(self, film_url: str) -> Optional[Dict]:
+        try:
+            summary = parse_film_summary(self.fetch(film_url))
+            if summary is None:
+                print_to_csv(f"Error processing {film_url}: no og:title on the page")
+            return summary
+        except Exception as e:
+            print_to_csv(f"Error processing {film_url}: {str(e)}")
+            return None
+
+    def film_summaries(self, film_urls: List[str]) -> List[Optional[Dict]]:
+        """Fetch film pages concurrently, returning summaries in the order of film_urls."""
+        return list(self.executor.map(self.film_summary, film_urls))
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+        self.session.close()
+        if self.fallback is not None:
+            self.fallback.close()
+
+class SeleniumBackend:
+    """Loads pages in a pooled Firefox, for when static HTML is not enough."""
+
+    def __init__(self, headless: bool = False):
+        # Start a pooled Firefox (GeckoDriver in PATH) that restarts itself every few hundred pages
+        self.driver_pool = DriverPool(lambda: launch_firefox(headless=headless))
+        self.driver = self.driver_pool.acquire()
+
+    def listing_page(self, page_number: int) -> ListingPage:
+        url = f'{BASE_URL}page/{page_number}/'
+        
+        # Add retry mechanism for page loading
+        page_retries = 20
+        for retry in range(page_retries):
+            try:
+                self.driver.get(url)
+                # Wait for the page to load
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, POSTER_SELECTOR))
+                )
+                time.sleep(random.uniform(1.0, 1.5))
+                break
+            except Exception as e:
+                if retry == page_retries - 1:
+                    print_to_csv(f"❌ Failed to load page after {page_retries} attempts: {str(e)}")
+                    raise Exception(f"Failed to load page after {page_retries} attempts: {str(e)}")
+                print_to_csv(f"Retry {retry + 1}/{page_retries} loading page {page_number}: {str(e)}")
+                time.sleep(2)
+        
+        # Find all film containers with retry mechanism
+        container_retries = 25
+        for retry in range(container_retries):
+            listing = parse_listing_page(self.driver.page_source, page_number)
+            if listing.films:  # Check for any containers
+                return listing
+            print_to_csv(f"Found no containers, retrying... (Attempt {retry + 1}/{container_retries})")
+            time.sleep(5)  # Wait longer between retries
+            self.driver.refresh()  # Refresh the page
+            time.sleep(2)  # Wait for refresh
+        print_to_csv(f"❌ Failed to find film containers after {container_retries} attempts")
+        raise Exception(f"Failed to find film containers after {container_retries} attempts")
+
+    def listing_pages(self, page_numbers: List[int]) -> List[ListingPage]:
+        return [self.listing_page(page_number) for page_number in page_numbers]
+
+    def film_summary(self, film_url: str) -> Optional[Dict]:
+        # Add retry logic for fetching film details
+        max_retries = 20
+        for retry in range(max_retries):
+            try:
+                self.driver.get(film_url)
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, 'meta[property="og:title"]'))
+                )
+                time.sleep(random.uniform(1.0, 1.5))
+                summary = parse_film_summary(self.driver.page_source)
+                if summary is not None:
+                    return summary
+                raise Exception("no og:title on the page")
+            except Exception as e:
+                print_to_csv(f"Error processing {film_url} (attempt {retry + 1}/{max_retries}): {str(e)}")
+                if retry < max_retries - 1:
+                    print_to_csv(f"Retrying... (Attempt {retry + 1}/{max_retries})")
+                    time.sleep(2)
+        return None
+
+    def film_summaries(self, film_urls: List[str]) -> List[Optional[Dict]]:
+        return [self.film_summary(film_url) for film_url in film_urls]
+
+    def close(self):
+        # Close the browser
+        self.driver_pool.close()
 
 class ProgressTracker:
     def __init__(self, total_films):
@@ -162,180 +311,100 @@ def format_time(seconds):
     else:
         return f"{seconds}s"
 
-# Initialize progress tracker
-progress_tracker = ProgressTracker(max_movies)
-print_to_csv(f"\n{' Starting Film Scraping ':=^100}")
+def collect_film_urls(scraper, max_movies: int) -> List[str]:
+    """Collect the first max_movies film URLs, loading the pages they should span together."""
+    film_urls = []
+    page_numbers = list(range(1, -(-max_movies // LISTING_PAGE_SIZE) + 1))
+    while len(film_urls) < max_movies and page_numbers:
+        print_to_csv(f"Collecting URLs from pages {page_numbers[0]}-{page_numbers[-1]}")
+        listings = scraper.listing_pages(page_numbers)
+        for listing in listings:
+            film_urls.extend(film['url'] for film in listing.films)
+        if listings[-1].is_last_page:
+            break
+        # Pages came back short of a full listing; keep going one page at a time
+        page_numbers = [page_numbers[-1] + 1]
+    return film_urls[:max_movies]
 
-# First, collect all film URLs
-print_to_csv("Collecting film URLs...")
-film_urls = []
-current_page = 1
+def scrape_top_films(backend: str = BACKEND, max_movies: int = MAX_MOVIES) -> List[Dict]:
+    """Scrape the top max_movies films by rating that have at least MIN_RATING_COUNT ratings.
 
-while len(film_urls) < max_movies:
-    url = f'{base_url}page/{current_page}/'
-    print_to_csv(f'Collecting URLs from page {current_page}')
+    Writes them to film_titles.csv and returns them as {'Title', 'Year'} rows.
+    """
+    movie_cache = MovieCache()
+    scraper = HttpBackend() if backend == 'http' else SeleniumBackend()
+    film_titles = []
     
-    # Add retry mechanism for page loading
-    page_retries = 20
-    for retry in range(page_retries):
-        try:
-            driver.get(url)
-            # Wait for the page to load
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'div.react-component.poster'))
-            )
-            time.sleep(random.uniform(1.0, 1.5))
-            break
-        except Exception as e:
-            if retry == page_retries - 1:
-                print_to_csv(f"❌ Failed to load page after {page_retries} attempts: {str(e)}")
-                raise Exception(f"Failed to load page after {page_retries} attempts: {str(e)}")
-            print_to_csv(f"Retry {retry + 1}/{page_retries} loading page {current_page}: {str(e)}")
-            time.sleep(2)
+    # Initialize progress tracker
+    progress_tracker = ProgressTracker(max_movies)
+    print_to_csv(f"\n{' Starting Film Scraping ':=^100}")
     
-    # Find all film containers with retry mechanism
-    film_containers = []
-    container_retries = 25
-    for retry in range(container_retries):
-        try:
-            film_containers = WebDriverWait(driver, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'div.react-component.poster'))
-            )
-            if len(film_containers) > 0:  # Check for any containers
-                break
-            else:
-                print_to_csv(f"Found no containers, retrying... (Attempt {retry + 1}/{container_retries})")
-                time.sleep(5)  # Wait longer between retries
-                driver.refresh()  # Refresh the page
-                time.sleep(2)  # Wait for refresh
-        except Exception as e:
-            if retry == container_retries - 1:
-                print_to_csv(f"❌ Failed to find film containers after {container_retries} attempts: {str(e)}")
-                raise Exception(f"Failed to find film containers after {container_retries} attempts: {str(e)}")
-            print_to_csv(f"Retry {retry + 1}/{container_retries} finding film containers: {str(e)}")
-            time.sleep(5)
-            driver.refresh()
-            time.sleep(2)
-    
-    for container in film_containers:
-        if len(film_urls) >= max_movies:
-            break
-        film_url = container.find_element(By.CSS_SELECTOR, 'a').get_attribute('href')
-        film_urls.append(film_url)
-    
-    current_page += 1
-    time.sleep(random.uniform(1.0, 1.5))
-
-print_to_csv(f"Collected {len(film_urls)} film URLs")
-
-# Now process each film URL
-with tqdm(total=max_movies, desc="Total Progress", unit=" films") as overall_pbar:
-    for film_url in film_urls:
-        if total_titles >= max_movies:
-            break
+    try:
+        # First, collect all film URLs
+        print_to_csv("Collecting film URLs...")
+        film_urls = collect_film_urls(scraper, max_movies)
+        print_to_csv(f"Collected {len(film_urls)} film URLs")
         
-        # Check if movie is in cache
-        if movie_cache.is_cached(film_url):
-            cached_data = movie_cache.get_cached_data(film_url)
-            film_title = cached_data['Title']
-            release_year = cached_data['Year']
-            print_to_csv(f"✅ Using cached data for {film_title} ({release_year})")
-            
-            film_titles.append({
-                'Title': film_title,
-                'Year': release_year
-            })
-            total_titles += 1
-            progress_tracker.increment()
-            overall_pbar.update(1)
-            
-            # Print progress for cached movies too
-            stats = progress_tracker.get_progress_stats()
-            print_to_csv(f"\n{f'Overall Progress: {total_titles}/{max_movies} films':^100}")
-            print_to_csv(f"{'Elapsed Time: ' + format_time(stats['elapsed_time']) + ' | Estimated Time Remaining: ' + format_time(stats['time_remaining']):^100}")
-            print_to_csv(f"{'Processing Speed: {:.2f} movies/second'.format(stats['movies_per_second']):^100}")
-            continue
-            
-        # Add retry logic for fetching film details
-        max_retries = 20
-        success = False
+        # Decide from the cache once per film, then load every page it cannot settle, all at once on the HTTP backend
+        decisions = {film_url: movie_cache.cached_decision(film_url) for film_url in film_urls}
+        to_load = [film_url for film_url in film_urls if decisions[film_url] is None]
+        print_to_csv(f"Loading {len(to_load)} film pages ({len(film_urls) - len(to_load)} settled by the cache)")
+        summaries = dict(zip(to_load, scraper.film_summaries(to_load)))
         
-        for retry in range(max_retries):
-            try:
-                driver.get(film_url)
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 'meta[property="og:title"]'))
-                )
-                time.sleep(random.uniform(1.0, 1.5))
-                
-                # Get title and year in one go from the meta title
-                meta_title = driver.find_element(By.CSS_SELECTOR, 'meta[property="og:title"]')
-                title_content = meta_title.get_attribute('content')
-                film_title = title_content.split(' (')[0]
-                release_year = title_content.split('(')[-1].strip(')')
-                
-                # Extract rating count
-                rating_count = 0
-                try:
-                    page_source = driver.page_source
-                    match = re.search(r'ratingCount":(\d+)', page_source)
-                    if match:
-                        rating_count = int(match.group(1))
-                except Exception as e:
-                    print_to_csv(f"Error extracting rating count: {str(e)}")
-                    if retry < max_retries - 1:
-                        print_to_csv(f"Retrying... (Attempt {retry + 1}/{max_retries})")
-                        time.sleep(2)
+        # Now process each film URL in listing order
+        with tqdm(total=max_movies, desc="Total Progress", unit=" films") as overall_pbar:
+            for film_url in film_urls:
+                if film_url in summaries:
+                    summary = summaries[film_url]
+                    if summary is None:
+                        continue
+                    film_title, release_year = summary['Title'], summary['Year']
+                    rating_count = summary['RatingCount']
+                    # Cache the rating count either way so films far from the cutoff skip this next time
+                    if rating_count is not None:
+                        movie_cache.update_cache(film_title, release_year, film_url, rating_count)
+                    if (rating_count or 0) < MIN_RATING_COUNT:
+                        print_to_csv(f"Skipping {film_title} - insufficient ratings ({rating_count or 0})")
                         continue
-                    break
-                
-                # Only add movies with sufficient ratings
-                if rating_count >= MIN_RATING_COUNT:
-                    # Update cache with new movie data
-                    movie_cache.update_cache(film_title, release_year, film_url)
-                    
-                    film_titles.append({
-                        'Title': film_title,
-                        'Year': release_year
-                    })
-                    total_titles += 1
-                    progress_tracker.increment()
-                    
-                    # Update the overall progress bar
-                    overall_pbar.update(1)
-                    
-                    # Print progress every movie
-                    stats = progress_tracker.get_progress_stats()
-                    print_to_csv(f"\n{f'Overall Progress: {total_titles}/{max_movies} films':^100}")
-                    print_to_csv(f"{'Elapsed Time: ' + format_time(stats['elapsed_time']) + ' | Estimated Time Remaining: ' + format_time(stats['time_remaining']):^100}")
-                    print_to_csv(f"{'Processing Speed: {:.2f} movies/second'.format(stats['movies_per_second']):^100}")
-                    print_to_csv(f"Last Scraped: {film_title} ({release_year})")
-                    success = True
-                    break
                 else:
-                    print_to_csv(f"Skipping {film_title} - insufficient ratings ({rating_count})")
-                    success = True  # Mark as success since we got the data, just didn't meet criteria
-                    break
-                    
-            except Exception as e:
-                print_to_csv(f"Error processing {film_url} (attempt {retry + 1}/{max_retries}): {str(e)}")
-                if retry < max_retries - 1:
-                    print_to_csv(f"Retrying... (Attempt {retry + 1}/{max_retries})")
-                    time.sleep(2)
-                    continue
-                break
-
-# Close the browser
-driver.quit()
-
-# Check if any titles were scraped
-if film_titles:
-    print_to_csv(f'{len(film_titles)} Film titles were scraped successfully:')
-else:
-    print_to_csv("No film titles were scraped.")
+                    cached_data = movie_cache.get_cached_data(film_url)
+                    film_title = cached_data['Title']
+                    release_year = cached_data['Year']
+                    if not decisions[film_url]:
+                        print_to_csv(f"Skipping {film_title} - insufficient ratings ({cached_data['RatingCount']}, cached)")
+                        continue
+                    print_to_csv(f"✅ Using cached data for {film_title} ({release_year})")
+                
+                film_titles.append({
+                    'Title': film_title,
+                    'Year': release_year
+                })
+                progress_tracker.increment()
+                overall_pbar.update(1)
+                
+                # Print progress every movie
+                stats = progress_tracker.get_progress_stats()
+                print_to_csv(f"\n{f'Overall Progress: {len(film_titles)}/{max_movies} films':^100}")
+                print_to_csv(f"{'Elapsed Time: ' + format_time(stats['elapsed_time']) + ' | Estimated Time Remaining: ' + format_time(stats['time_remaining']):^100}")
+                print_to_csv(f"{'Processing Speed: {:.2f} movies/second'.format(stats['movies_per_second']):^100}")
+                print_to_csv(f"Last Scraped: {film_title} ({release_year})")
+    finally:
+        scraper.close()
+        movie_cache.close()
+    
+    # Check if any titles were scraped
+    if film_titles:
+        print_to_csv(f'{len(film_titles)} Film titles were scraped successfully:')
+    else:
+        print_to_csv("No film titles were scraped.")
+    
+    # Create a DataFrame and save to CSV if desired
+    df = pd.DataFrame(film_titles)
+    output_csv = os.path.join(output_dir, 'film_titles.csv')
+    df.to_csv(output_csv, index=False, encoding='utf-8')
+    print_to_csv("Film titles have been successfully saved to film_titles.csv.")
+    print_to_csv(f"Finished in {format_time(progress_tracker.get_elapsed_time())}")
+    return film_titles
 
-# Create a DataFrame and save to CSV if desired
-df = pd.DataFrame(film_titles)
-output_csv = os.path.join(output_dir, 'film_titles.csv')
-df.to_csv(output_csv, index=False, encoding='utf-8')
-print_to_csv("Film titles have been successfully saved to film_titles.csv.")
\ No newline at end of file
+if __name__ == "__main__":
+    scrape_top_films()
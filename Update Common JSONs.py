@@ -14,6 +14,7 @@ from datetime import datetime
 import csv
 import platform
 from credentials_loader import load_credentials
+from listing_page import missing_fields, parse_list_entry
 
 # Detect operating system and set appropriate paths
 def get_os_specific_paths():
@@ -42,6 +43,9 @@ paths = get_os_specific_paths()
 jsons_dir = paths['jsons_dir']
 output_dir = paths['output_dir']
 
+# Build records from the list page markup and only load a film's page for fields it lacks
+LISTING_ONLY = True
+
 # Define a custom print function
 def print_to_csv(message: str):
     """Prints a message to the terminal and appends it to All_Outputs.csv."""
@@ -110,6 +114,13 @@ def process_film(session, film_url, progress_tracker, list_number=None):
             sleep(1)
     return None
 
+def record_from_listing(film, progress_tracker, list_number=None):
+    """Build a film's record from its list entry, the same shape process_film returns."""
+    current = progress_tracker.increment()
+    print_to_csv(f"✅ {film['title']} ({film['year']}) - Added ({current}/{progress_tracker.total_films})")
+    record = {'Title': film['title'], 'Year': film['year'], 'ID': film['film_id']}
+    return {'ListNumber': list_number, **record} if list_number is not None else record
+
 def process_page(session, url, max_films, progress_tracker):
     try:
         response = session.get(url, timeout=10)
@@ -128,21 +139,21 @@ def process_page(session, url, max_films, progress_tracker):
             futures = []
             film_items = film_list.find_all('li', class_='poster-container')
             for li in film_items:
-                film_poster = li.find('div', class_='film-poster')
-                if not film_poster:
+                film = parse_list_entry(li)
+                if not film:
                     print_to_csv("Film poster not found for one item; skipping.")
                     continue
                     
-                film_url = film_poster.get('data-target-link')
-                list_number_tag = li.find('p', class_='list-number')
+                # list_number is None when the list is unranked
+                list_number = film['list_number']
+                # uncomment for more details print_to_csv(f"Processing film URL: {film['path']}, List Number: {list_number}")
                 
-                # Only get list_number if the tag exists; otherwise, it is unranked
-                list_number = int(list_number_tag.text.strip()) if list_number_tag else None
-                # uncomment for more details print_to_csv(f"Processing film URL: {film_url}, List Number: {list_number}")
+                if LISTING_ONLY and not missing_fields(film):
+                    temp_data.append(record_from_listing(film, progress_tracker, list_number))
+                    continue
                 
                 # Process film regardless of whether there's a list number
-                if film_url:
-                    futures.append(executor.submit(process_film, session, film_url, progress_tracker, list_number))
+                futures.append(executor.submit(process_film, session, film['path'], progress_tracker, list_number))
             
             for future in as_completed(futures):
                 result = future.result()
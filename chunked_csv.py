@@ -0,0 +1,78 @@
+import csv
+import os
+import shutil
+from typing import Dict, List, Optional, Sequence, TextIO
+
+class ChunkedCSVWriter:
+    """Streams rows to rotating CSV chunk files as they are produced.
+
+    path_pattern is the final file name and may contain {index} (1-based) for outputs
+    split every chunk_size rows; without it everything goes to a single file. Rows are
+    appended to a "<final>.partial" file and flushed straight away, so a crash leaves a
+    valid CSV behind. A chunk is moved into place with os.replace as soon as it fills
+    up, and finalize() does the same for the chunk still being written.
+    """
+
+    def __init__(self, path_pattern: str, columns: Sequence[str], chunk_size: Optional[int] = None):
+        self.path_pattern = path_pattern
+        self.columns = list(columns)
+        self.chunk_size = chunk_size if '{index}' in path_pattern else None
+        self.row_count = 0
+        self._file: Optional[TextIO] = None
+        self._writer = None
+        self._chunk_rows = 0
+        self._open_path: Optional[str] = None
+
+    def chunk_path(self, index: int) -> str:
+        return self.path_pattern.format(index=index)
+
+    @property
+    def chunk_index(self) -> int:
+        """1-based index of the chunk the next row goes to."""
+        if not self.chunk_size:
+            return 1
+        return self.row_count // self.chunk_size + 1
+
+    def append(self, row: Dict) -> None:
+        """Write one row (a dict keyed by column name) to the current chunk."""
+        if self._file is None:
+            self._open_chunk()
+        self._writer.writerow([row.get(column) for column in self.columns])
+        self._file.flush()
+        self.row_count += 1
+        self._chunk_rows += 1
+        if self.chunk_size and self._chunk_rows >= self.chunk_size:
+            self._publish()
+
+    def extend(self, rows: List[Dict]) -> None:
+        for row in rows:
+            self.append(row)
+
+    def finalize(self) -> None:
+        """Move the chunk being written into place. Safe to call more than once."""
+        if self._file is not None:
+            self._publish()
+
+    def _open_chunk(self) -> None:
+        index = self.chunk_index
+        final_path = self.chunk_path(index)
+        partial_path = f"{final_path}.partial"
+        self._chunk_rows = self.row_count - (index - 1) * self.chunk_size if self.chunk_size else self.row_count
+        if self._chunk_rows:
+            # Rows were added after finalize(); carry on from the published file
+            shutil.copyfile(final_path, partial_path)
+            self._file = open(partial_path, mode='a', newline='', encoding='utf-8')
+            self._writer = csv.writer(self._file)
+        else:
+            # Starting a chunk truncates anything left over from an interrupted run
+            self._file = open(partial_path, mode='w', newline='', encoding='utf-8')
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(self.columns)
+        self._open_path = final_path
+
+    def _publish(self) -> None:
+        self._file.close()
+        self._file = None
+        self._writer = None
+        os.replace(f"{self._open_path}.partial", self._open_path)
+        self._open_path = None
@@ -0,0 +1,97 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from film_page import parse_film_details
+from ttl_cache import TTLCache
+
+# Fields compared when re-verifying a whitelist entry. RatingCount is left out because it
+# drifts constantly and would turn every audit into a write.
+AUDIT_FIELDS = ('Runtime', 'MPAA', 'Languages', 'Countries', 'Directors', 'Genres', 'Studios', 'Actors')
+MULTI_VALUE_FIELDS = ('Languages', 'Countries', 'Directors', 'Genres', 'Studios', 'Actors')
+
+def diff_fields(stored, fresh: Dict) -> Dict:
+    """Return the audited fields whose fresh value differs from the stored record.
+
+    Multi-valued fields are compared as sets since page order is not meaningful, and
+    fields missing from the fresh page are never reported as changes.
+    """
+    changes = {}
+    for field in AUDIT_FIELDS:
+        new_value = fresh.get(field)
+        if new_value in (None, [], ()):
+            continue
+        old_value = stored.get(field)
+        if field in MULTI_VALUE_FIELDS:
+            if set(new_value) != set(old_value or ()):
+                changes[field] = list(new_value)
+        elif new_value != old_value:
+            changes[field] = new_value
+    return changes
+
+class DataAuditor:
+    """Re-verifies a bounded number of the stalest whitelist entries in the background.
+
+    Each run picks the max_audits entries with the oldest last_verified time (entries
+    never verified come first), fetches their pages over HTTP in a small thread pool and
+    diffs the parsed fields against the stored record. The crawl's browser is never used.
+    """
+
+    def __init__(self, fetch: Callable[[str], str], verified_path: str, max_audits: int = 25, workers: int = 4):
+        self.fetch = fetch
+        self.max_audits = max_audits
+        self.workers = workers
+        self.verified = TTLCache(verified_path, ttl=float('inf'))
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.jobs: List[Tuple[str, str, object, Future]] = []
+
+    def select(self, entries: Iterable[Tuple[str, str, object]]) -> List[Tuple[str, str, object]]:
+        """Pick the stalest (key, link, record) entries that have a link and stored data to audit."""
+        candidates = [entry for entry in entries if entry[1]]
+        candidates.sort(key=lambda entry: self.verified.checked_at(entry[0]) or 0)
+        selected = []
+        for entry in candidates:
+            if len(selected) >= self.max_audits:
+                break
+            # Blank records are re-scraped by the crawl itself
+            if entry[2]:
+                selected.append(entry)
+        return selected
+
+    def start(self, entries: Iterable[Tuple[str, str, object]]) -> int:
+        """Queue the audit for this run and return how many entries were scheduled."""
+        selected = self.select(entries)
+        if not selected:
+            return 0
+        self.executor = ThreadPoolExecutor(max_workers=self.workers)
+        self.jobs = [(key, link, record, self.executor.submit(self._audit_page, link)) for key, link, record in selected]
+        return len(self.jobs)
+
+    def _audit_page(self, link: str) -> Dict:
+        return parse_film_details(self.fetch(link))
+
+    def finish(self) -> Tuple[List[Tuple[str, object, Dict, Dict]], List[Tuple[str, Exception]]]:
+        """Wait for the queued audits.
+
+        Returns (changed, failed): changed holds (key, record, changes, fresh) for entries
+        with at least one differing field, failed holds (key, error). Every entry that was
+        fetched successfully is stamped as verified, changed or not.
+        """
+        changed, failed = [], []
+        now = time.time()
+        for key, link, record, future in self.jobs:
+            try:
+                fresh = future.result()
+            except Exception as e:
+                failed.append((key, e))
+                continue
+            self.verified.set(key, None, now)
+            changes = diff_fields(record, fresh)
+            if changes:
+                changed.append((key, record, changes, fresh))
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+        self.jobs = []
+        self.verified.save()
+        return changed, failed
@@ -0,0 +1,140 @@
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Callable, List, Optional
+
+from selenium import webdriver
+from selenium.webdriver.firefox.options import Options
+from selenium.webdriver.firefox.service import Service
+
+# Page loads before a pooled browser is restarted, which bounds Firefox's memory growth
+DEFAULT_MAX_PAGES = 250
+
+def firefox_options(headless: bool = True, download_dir: Optional[str] = None) -> Options:
+    """Firefox options tuned for scraping: no images or web fonts, eager page loads."""
+    options = Options()
+    if headless:
+        options.add_argument("-headless")
+    # Return from get() once the DOM is ready instead of waiting for every subresource
+    options.page_load_strategy = "eager"
+    options.set_preference("permissions.default.image", 2)  # Disable images
+    options.set_preference("dom.ipc.plugins.enabled.libflashplayer.so", "false")
+    options.set_preference("browser.display.use_document_fonts", 0)
+    options.set_preference("gfx.downloadable_fonts.enabled", False)  # Don't fetch web fonts
+    options.set_preference("browser.display.document_color_use", 2)
+
+    if download_dir:
+        # Prevent random downloads
+        options.set_preference("browser.download.folderList", 2)  # Use custom download location
+        options.set_preference("browser.download.manager.showWhenStarting", False)  # Don't show download manager
+        options.set_preference("browser.download.dir", download_dir)  # Set download directory
+        options.set_preference("browser.helperApps.neverAsk.saveToDisk", "text/html,text/plain")  # Don't ask to save HTML files
+        options.set_preference("browser.helperApps.alwaysAsk.force", False)  # Don't force asking
+        options.set_preference("browser.download.manager.alertOnEXEOpen", False)  # Don't alert on exe downloads
+        options.set_preference("browser.download.manager.focusWhenStarting", False)  # Don't focus download manager
+        options.set_preference("browser.download.manager.useWindow", False)  # Don't use window for downloads
+        options.set_preference("browser.download.manager.showAlertOnComplete", False)  # Don't show alert when complete
+        options.set_preference("browser.download.manager.closeWhenDone", True)  # Close download manager when done
+
+    options.set_preference("javascript.enabled", True)  # Keep JS enabled but optimize
+    options.set_preference("network.http.connection-timeout", 30)  # Reduce timeout
+    options.set_preference("network.http.max-connections-per-server", 10)  # Limit connections
+    options.set_preference("browser.cache.disk.enable", True)  # Enable disk cache
+    options.set_preference("browser.cache.memory.enable", True)  # Enable memory cache
+    return options
+
+def launch_firefox(headless: bool = True, download_dir: Optional[str] = None) -> webdriver.Firefox:
+    """Start a Firefox instance with the scraping options."""
+    return webdriver.Firefox(service=Service(), options=firefox_options(headless, download_dir))
+
+class PooledDriver:
+    """A pooled browser that restarts itself after max_pages page loads.
+
+    Everything other than get() is passed straight through to the underlying
+    webdriver, so it can be used anywhere a Firefox driver is expected.
+    """
+
+    def __init__(self, launch: Callable[[], webdriver.Firefox], max_pages: int = DEFAULT_MAX_PAGES):
+        self._launch = launch
+        self.max_pages = max_pages
+        self.pages_loaded = 0
+        self._driver = launch()
+
+    def get(self, url: str) -> None:
+        if self.max_pages and self.pages_loaded >= self.max_pages:
+            self.restart()
+        self.pages_loaded += 1
+        self._driver.get(url)
+
+    def is_healthy(self) -> bool:
+        """True if the browser still answers commands."""
+        try:
+            self._driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def restart(self) -> None:
+        """Replace the browser with a fresh instance."""
+        self.shutdown()
+        self._driver = self._launch()
+        self.pages_loaded = 0
+
+    def shutdown(self) -> None:
+        """Quit the underlying browser."""
+        try:
+            self._driver.quit()
+        except Exception:
+            pass
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+class DriverPool:
+    """A fixed set of warm browsers handed out to scrapers and returned after use.
+
+    Browsers are launched once when the pool is created. acquire() checks that a
+    browser still responds and replaces it if not, so a crashed instance is never
+    handed out twice.
+    """
+
+    def __init__(self, launch: Callable[[], webdriver.Firefox] = launch_firefox, size: int = 1,
+                 max_pages: int = DEFAULT_MAX_PAGES):
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._drivers: List[PooledDriver] = []
+        self._lock = threading.Lock()
+        for _ in range(size):
+            driver = PooledDriver(launch, max_pages)
+            self._drivers.append(driver)
+            self._idle.put(driver)
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledDriver:
+        """Take a healthy browser from the pool, waiting up to timeout seconds for one to free up."""
+        driver = self._idle.get(timeout=timeout)
+        if not driver.is_healthy():
+            driver.restart()
+        return driver
+
+    def release(self, driver: PooledDriver) -> None:
+        self._idle.put(driver)
+
+    @contextmanager
+    def driver(self, timeout: Optional[float] = None):
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self) -> None:
+        """Quit every browser in the pool."""
+        with self._lock:
+            for driver in self._drivers:
+                driver.shutdown()
+            self._drivers = []
+
+    def __enter__(self) -> 'DriverPool':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -0,0 +1,72 @@
+import json
+import os
+from typing import Dict, Iterator, Optional
+
+from whitelist_journal import ChangeJournal
+
+class FilmCache:
+    """Append-only JSONL store of film records keyed by film URL.
+
+    Every set() is journaled as one line and written in batches; loading replays the
+    file with the last line for a URL winning. When superseded lines outnumber the
+    live records, compact() rewrites the file with one line per film.
+    """
+
+    def __init__(self, path: str, key: str = 'Link', batch_size: int = 25):
+        self.path = path
+        self.key = key
+        self.journal = ChangeJournal(path, batch_size=batch_size)
+        self.records: Dict[str, Dict] = {}
+        self.lines = 0
+        self.load()
+
+    def load(self) -> None:
+        self.records = {}
+        entries = self.journal.read()
+        for entry in entries:
+            url = entry.get(self.key)
+            if url:
+                self.records[url] = entry
+        self.lines = len(entries)
+
+    def get(self, url: str) -> Optional[Dict]:
+        return self.records.get(url)
+
+    def set(self, url: str, record: Dict) -> None:
+        """Store record for url, appending it to the file with the next batch."""
+        record = {**record, self.key: url}
+        self.records[url] = record
+        self.journal.append(record)
+        self.lines += 1
+
+    def flush(self) -> None:
+        self.journal.flush()
+
+    def needs_compaction(self) -> bool:
+        return self.lines > 2 * max(len(self.records), 1)
+
+    def compact(self) -> None:
+        """Rewrite the file atomically with only the latest record for each film."""
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, mode='w', encoding='utf-8') as file:
+            for record in self.records.values():
+                file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        os.replace(temp_path, self.path)
+        self.journal.buffer = []
+        self.lines = len(self.records)
+
+    def close(self) -> None:
+        """Write any buffered records, compacting first if the file has grown stale."""
+        if self.needs_compaction():
+            self.compact()
+        else:
+            self.flush()
+
+    def __contains__(self, url: str) -> bool:
+        return url in self.records
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self.records.values())
+
+    def __len__(self) -> int:
+        return len(self.records)
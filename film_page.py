@@ -0,0 +1,230 @@
+import html as html_entities
+import json
+import re
+from typing import Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Map common rating formats to MPAA ratings
+MPAA_RATING_MAP = {
+    'R': 'R',
+    'PG-13': 'PG-13',
+    'PG': 'PG',
+    'G': 'G',
+    'NC-17': 'NC-17',
+    'X': 'NC-17',  # Historical rating
+    'M': 'PG',     # Historical rating
+    'GP': 'PG',    # Historical rating
+}
+
+OG_TITLE = re.compile(r'<meta[^>]+property="og:title"[^>]+content="([^"]*)"')
+# Same pattern FILM_DETAILS_SCRIPT uses, so every parser reads the same count from a page
+RATING_COUNT = re.compile(r'ratingCount"\s*:\s*(\d+)')
+JSON_LD = re.compile(r'<script[^>]+type="application/ld\+json"[^>]*>(.*?)</script>', re.DOTALL)
+
+# Reads every field the scrapers use from a loaded film page in one execute_script call,
+# with the same selectors the per-field find_elements lookups used
+FILM_DETAILS_SCRIPT = """
+const text = el => (el && el.textContent ? el.textContent.trim() : '');
+const names = selector => Array.from(document.querySelectorAll(selector)).map(text).filter(Boolean);
+
+const languages = [];
+document.querySelectorAll('#tab-details h3').forEach(heading => {
+    const label = text(heading.querySelector('span') || heading);
+    if (!label.includes('Language')) return;
+    let sluglist = heading.nextElementSibling;
+    while (sluglist && !(sluglist.tagName === 'DIV' && sluglist.classList.contains('text-sluglist'))) {
+        sluglist = sluglist.nextElementSibling;
+    }
+    const p = sluglist ? sluglist.querySelector('p') : null;
+    if (!p) return;
+    p.querySelectorAll('a.text-slug[href*="/films/language/"]').forEach(a => {
+        const name = text(a);
+        if (name && !languages.includes(name)) languages.push(name);
+    });
+});
+
+let ratingCount = null;
+const ratingSources = Array.from(document.querySelectorAll('script[type="application/ld+json"]')).map(s => s.textContent);
+ratingSources.push(document.documentElement.innerHTML);
+for (const source of ratingSources) {
+    const match = source.match(/ratingCount"\\s*:\\s*(\\d+)/);
+    if (match) { ratingCount = parseInt(match[1], 10); break; }
+}
+
+return {
+    tmdbID: document.body ? document.body.getAttribute('data-tmdb-id') : null,
+    directors: names('span.directorlist a.contributor'),
+    actors: names('#tab-cast .text-sluglist a.text-slug.tooltip'),
+    genres: names('#tab-genres .text-sluglist a.text-slug[href*="/films/genre/"]')
+        .filter(name => !name.includes('…') && !name.includes('Show All')),
+    studios: names('#tab-details .text-sluglist a.text-slug[href*="/studio/"]'),
+    countries: names('#tab-details .text-sluglist a.text-slug[href*="/films/country/"]'),
+    languages: languages,
+    runtimeText: text(document.querySelector('p.text-link.text-footer')),
+    ratingCount: ratingCount,
+    releaseCountries: Array.from(document.querySelectorAll('.release-country')).map(country => ({
+        name: text(country.querySelector('.name')),
+        rating: text(country.querySelector('.release-certification-badge .label'))
+    }))
+};
+"""
+
+def mpaa_from_release_countries(country_data: List[Dict]) -> Optional[str]:
+    """Return the MPAA rating from the USA entry of a film's release-country data."""
+    for data in country_data or []:
+        name = data.get('name')
+        rating = data.get('rating')
+
+        if name == "USA" and rating:
+            # Handle special cases
+            if rating.upper() in ['NR', 'NOT RATED', 'UNRATED']:
+                return 'NR'
+
+            if rating in MPAA_RATING_MAP:
+                return MPAA_RATING_MAP[rating]
+
+    return None
+
+def empty_film_details() -> Dict:
+    """Film details with every field blank, for pages that could not be read."""
+    return {
+        'tmdbID': None,
+        'MPAA': None,
+        'Runtime': None,
+        'RatingCount': 0,
+        'Languages': [],
+        'Countries': [],
+        'Directors': [],
+        'Genres': [],
+        'Studios': [],
+        'Actors': [],
+        'ReleaseCountries': [],
+    }
+
+def extract_film_details(driver, timeout: int = 10) -> Dict:
+    """Read all metadata from the film page loaded in driver with a single WebDriver round-trip.
+
+    Keys match the whitelist Information layout (Directors, Actors, Genres, Studios,
+    Languages, Countries, Runtime, RatingCount, MPAA, tmdbID) plus ReleaseCountries, the
+    raw release-country rows the MPAA rating was derived from.
+    """
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, 'p.text-link.text-footer'))
+        )
+    except TimeoutException:
+        # Read whatever did load; missing sections come back empty
+        pass
+
+    return _details_from_page_data(driver.execute_script(FILM_DETAILS_SCRIPT) or {})
+
+def parse_film_details(html: str) -> Dict:
+    """Read the same fields as extract_film_details from a film page's HTML, without a browser."""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    def text(element) -> str:
+        return element.get_text().strip() if element else ''
+
+    def names(selector: str) -> List[str]:
+        return [name for name in (text(element) for element in soup.select(selector)) if name]
+
+    languages: List[str] = []
+    for heading in soup.select('#tab-details h3'):
+        if 'Language' not in text(heading.find('span') or heading):
+            continue
+        sluglist = heading.find_next_sibling('div', class_='text-sluglist')
+        p_tag = sluglist.find('p') if sluglist else None
+        if not p_tag:
+            continue
+        for language in p_tag.select('a.text-slug[href*="/films/language/"]'):
+            name = text(language)
+            if name and name not in languages:
+                languages.append(name)
+
+    match = RATING_COUNT.search(html)
+    return _details_from_page_data({
+        'tmdbID': soup.body.get('data-tmdb-id') if soup.body else None,
+        'directors': names('span.directorlist a.contributor'),
+        'actors': names('#tab-cast .text-sluglist a.text-slug.tooltip'),
+        'genres': [name for name in names('#tab-genres .text-sluglist a.text-slug[href*="/films/genre/"]')
+                   if '…' not in name and 'Show All' not in name],
+        'studios': names('#tab-details .text-sluglist a.text-slug[href*="/studio/"]'),
+        'countries': names('#tab-details .text-sluglist a.text-slug[href*="/films/country/"]'),
+        'languages': languages,
+        'runtimeText': text(soup.select_one('p.text-link.text-footer')),
+        'ratingCount': int(match.group(1)) if match else None,
+        'releaseCountries': [
+            {'name': text(country.select_one('.name')),
+             'rating': text(country.select_one('.release-certification-badge .label'))}
+            for country in soup.select('.release-country')
+        ],
+    })
+
+def parse_rating_summary(html: str) -> Tuple[Optional[str], int]:
+    """Read the release year (from og:title) and rating count from a film page's HTML.
+
+    Mirrors what the scrapers read from a loaded page before their rating-count checks.
+    """
+    release_year = None
+    match = OG_TITLE.search(html)
+    if match:
+        release_year = match.group(1).split('(')[-1].strip(')')
+    match = RATING_COUNT.search(html)
+    return release_year, int(match.group(1)) if match else 0
+
+def parse_film_summary(html: str) -> Optional[Dict]:
+    """Read Title, Year and RatingCount from a film page's static HTML, or None without og:title.
+
+    The count comes from the JSON-LD aggregateRating; RatingCount is None if the page has none.
+    """
+    match = OG_TITLE.search(html)
+    if not match:
+        return None
+    title_content = html_entities.unescape(match.group(1))
+
+    rating_count = None
+    for block in JSON_LD.findall(html):
+        block = block.replace('/* <![CDATA[ */', '').replace('/* ]]> */', '').strip()
+        try:
+            data = json.loads(block)
+        except ValueError:
+            continue
+        rating = data.get('aggregateRating') if isinstance(data, dict) else None
+        if isinstance(rating, dict) and rating.get('ratingCount') is not None:
+            rating_count = int(rating['ratingCount'])
+            break
+
+    return {
+        'Title': title_content.split(' (')[0],
+        'Year': title_content.split('(')[-1].strip(')'),
+        'RatingCount': rating_count,
+    }
+
+def _details_from_page_data(data: Dict) -> Dict:
+    """Normalize the raw fields read from a film page into the whitelist Information layout."""
+    runtime = None
+    match = re.search(r'(\d+)\s*min(?:s)?', data.get('runtimeText') or '')
+    if match:
+        runtime = int(match.group(1))
+
+    release_countries = data.get('releaseCountries') or []
+    details = empty_film_details()
+    details.update({
+        'tmdbID': data.get('tmdbID'),
+        'MPAA': mpaa_from_release_countries(release_countries),
+        'Runtime': runtime,
+        'RatingCount': data.get('ratingCount') or 0,
+        'Languages': data.get('languages') or [],
+        'Countries': data.get('countries') or [],
+        'Directors': data.get('directors') or [],
+        'Genres': data.get('genres') or [],
+        'Studios': data.get('studios') or [],
+        'Actors': data.get('actors') or [],
+        'ReleaseCountries': release_countries,
+    })
+    return details
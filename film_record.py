@@ -0,0 +1,137 @@
+import json
+import sys
+from typing import Any, Dict, Optional, Tuple
+
+# Whitelist Information keys
+SCALAR_FIELDS = ('Title', 'Year', 'tmdbID', 'MPAA', 'Runtime', 'RatingCount', 'Decade')
+MULTI_FIELDS = ('Languages', 'Countries', 'Directors', 'Genres', 'Studios', 'Actors')
+FIELDS = SCALAR_FIELDS + MULTI_FIELDS
+
+def _intern(value):
+    """Intern strings so repeated names share one object across the whole store."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+class FilmRecord:
+    """Compact film record for whitelist entries.
+
+    Names that repeat heavily (directors, actors, studios, countries) are interned and
+    multi-valued fields are stored as tuples. Supports the read-only dict access the
+    scrapers already use (``record.get('Directors', [])``, ``record['Title']``).
+
+    Records created with ``lazy()`` keep the raw JSON and only parse it the first time
+    a field is read, so loading a large whitelist does not pay for entries never hit.
+    """
+    __slots__ = ('Title', 'Year', 'tmdbID', 'MPAA', 'Runtime', 'RatingCount', 'Decade',
+                 'Languages', 'Countries', 'Directors', 'Genres', 'Studios', 'Actors', 'extra', '_raw')
+
+    def __init__(self, **fields):
+        self._raw = None
+        self._set_fields(fields)
+
+    def _set_fields(self, fields: Dict) -> None:
+        for name in SCALAR_FIELDS:
+            setattr(self, name, _intern(fields.pop(name, None)))
+        for name in MULTI_FIELDS:
+            values = fields.pop(name, None)
+            setattr(self, name, tuple(_intern(v) for v in values) if values else ())
+        # Keys outside the known layout are kept so round-trips stay lossless
+        self.extra = fields or None
+
+    @classmethod
+    def from_dict(cls, info: Optional[Dict]) -> 'FilmRecord':
+        """Build a record from a whitelist Information dict."""
+        if isinstance(info, FilmRecord):
+            return info
+        return cls(**(info or {}))
+
+    @classmethod
+    def from_json(cls, text) -> 'FilmRecord':
+        """Build a record from a whitelist Information cell, treating blanks and bad JSON as empty."""
+        if isinstance(text, dict):
+            return cls.from_dict(text)
+        return cls(**_parse_information(text))
+
+    @classmethod
+    def lazy(cls, text) -> 'FilmRecord':
+        """Wrap a whitelist Information cell without parsing it yet."""
+        record = cls.__new__(cls)
+        record._raw = text
+        return record
+
+    def __getattr__(self, name):
+        # Only reached for unset slots, i.e. fields of a lazy record not parsed yet
+        if name in FIELDS or name == 'extra':
+            try:
+                raw = object.__getattribute__(self, '_raw')
+            except AttributeError:
+                raise AttributeError(name) from None
+            self._raw = None
+            self._set_fields(_parse_information(raw))
+            return object.__getattribute__(self, name)
+        raise AttributeError(name)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the Information dict for this record, omitting unset fields."""
+        info = {}
+        for name in SCALAR_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                info[name] = value
+        for name in MULTI_FIELDS:
+            values = getattr(self, name)
+            if values:
+                info[name] = list(values)
+        if self.extra:
+            info.update(self.extra)
+        return info
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    def to_tuple(self) -> Tuple:
+        """Positional form used for comparisons."""
+        return tuple(getattr(self, name) for name in FIELDS) + (self.extra,)
+
+    def get(self, key: str, default=None):
+        if key in FIELDS:
+            value = getattr(self, key)
+            if value is None or (key in MULTI_FIELDS and not value):
+                return default
+            return value
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        return default
+
+    def __getitem__(self, key: str):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __bool__(self) -> bool:
+        return bool(self.to_dict())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, FilmRecord):
+            return self.to_tuple() == other.to_tuple()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"FilmRecord({self.to_dict()!r})"
+
+def _parse_information(text) -> Dict:
+    """Parse an Information cell, treating blanks, NaN and bad JSON as an empty dict."""
+    if not isinstance(text, str) or not text:
+        return {}
+    try:
+        info = json.loads(text)
+    except (json.JSONDecodeError, TypeError):
+        return {}
+    return info if isinstance(info, dict) else {}
@@ -0,0 +1,80 @@
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+# Define continents and their associated countries
+CONTINENTS_COUNTRIES = {
+    'Africa': ['Ivory Coast', 'Algeria', 'Angola', 'Benin', 'Botswana', 'Burkina Faso', 'Burundi', 'Cabo Verde', 'Cameroon', 'Central African Republic', 'Chad', 'Comoros', 'Congo, Democratic Republic of the', 'Congo, Republic of the', 'Djibouti', 'Egypt', 'Equatorial Guinea', 'Eritrea', 'Eswatini', 'Ethiopia', 'Gabon', 'Gambia', 'Ghana', 'Guinea', 'Guinea-Bissau', 'Kenya', 'Lesotho', 'Liberia', 'Libya', 'Madagascar', 'Malawi', 'Mali', 'Mauritania', 'Mauritius', 'Morocco', 'Mozambique', 'Namibia', 'Niger', 'Nigeria', 'Rwanda', 'Sao Tome and Principe', 'Senegal', 'Seychelles', 'Sierra Leone', 'Somalia', 'South Africa', 'South Sudan', 'Sudan', 'Tanzania', 'Togo', 'Tunisia', 'Uganda', 'Zambia', 'Zimbabwe', 'Congo'],
+    'Asia': ['State of Palestine', 'Hong Kong', 'Afghanistan', 'Armenia', 'Azerbaijan', 'Bahrain', 'Bangladesh', 'Bhutan', 'Brunei', 'Cambodia', 'China', 'Cyprus', 'Georgia', 'India', 'Indonesia', 'Iran', 'Iraq', 'Israel', 'Japan', 'Jordan', 'Kazakhstan', 'Kuwait', 'Kyrgyzstan', 'Laos', 'Lebanon', 'Malaysia', 'Maldives', 'Mongolia', 'Myanmar', 'Nepal', 'North Korea', 'Oman', 'Pakistan', 'Palestine', 'Philippines', 'Qatar', 'Russia', 'Saudi Arabia', 'Singapore', 'South Korea', 'Sri Lanka', 'Syrian Arab Republic', 'Taiwan', 'Tajikistan', 'Thailand', 'Timor-Leste', 'Turkey', 'Turkmenistan', 'United Arab Emirates', 'Uzbekistan', 'Vietnam', 'Yemen', 'Syria'],
+    'Europe': ['East Germany', 'North Macedonia', 'Yugoslavia', 'Serbia and Montenegro', 'Czechoslovakia', 'Czechia', 'USSR', 'Albania', 'Latvia', 'Andorra', 'Liechtenstein', 'Armenia', 'Lithuania', 'Austria', 'Luxembourg', 'Azerbaijan', 'Malta', 'Belarus', 'Moldova', 'Belgium', 'Monaco', 'Bosnia and Herzegovina', 'Montenegro', 'Bulgaria', 'Netherlands', 'Croatia', 'Norway', 'Cyprus', 'Poland', 'Czech Republic', 'Portugal', 'Denmark', 'Romania', 'Estonia', 'Russia', 'Finland', 'San Marino', 'Former Yugoslav Republic of Macedonia', 'Serbia', 'France', 'Slovakia', 'Georgia', 'Slovenia', 'Germany', 'Spain', 'Greece', 'Sweden', 'Hungary', 'Switzerland', 'Iceland', 'Ireland', 'Turkey', 'Italy', 'Ukraine', 'Kosovo', 'UK'],
+    'North America': ['Bahamas', 'Guadeloupe', 'Cuba', 'The Bahamas', 'Bermuda', 'Canada', 'The Caribbean', 'Clipperton Island', 'Greenland', 'Mexico', 'Saint Pierre and Miquelon', 'Turks and Caicos Islands', 'USA', 'United States', 'Belize', 'Costa Rica', 'El Salvador', 'Guatemala', 'Honduras', 'Nicaragua', 'Panama', 'Dominican Republic', 'Haiti', 'Jamaica', 'Martinique', 'Netherlands Antilles', 'Puerto Rico'],
+    'Oceania': ['Australia', 'Fiji', 'Kiribati', 'Marshall Islands', 'Micronesia', 'Nauru', 'New Zealand', 'Palau', 'Papua New Guinea', 'Samoa', 'Solomon Islands', 'Tonga', 'Tuvalu', 'Vanuatu', 'French Polynesia'],
+    'South America': ['Argentina', 'Bolivia', 'Brazil', 'Chile', 'Colombia', 'Ecuador', 'Guyana', 'Paraguay', 'Peru', 'Suriname', 'Uruguay', 'Bolivarian Republic of Venezuela', 'The Falkland Islands', 'South Georgia and the South Sandwich Islands', 'French Guiana', 'Venezuela'],
+}
+
+# Alternate spellings that should route like the canonical Letterboxd name
+COUNTRY_ALIASES = {
+    'Soviet Union': 'USSR',
+    'U.S.S.R.': 'USSR',
+    'Union of Soviet Socialist Republics': 'USSR',
+    'Czechoslovak Socialist Republic': 'Czechoslovakia',
+    'Czechoslovak Republic': 'Czechoslovakia',
+    'United Kingdom': 'UK',
+    'U.K.': 'UK',
+    'Great Britain': 'UK',
+    'England': 'UK',
+    'Scotland': 'UK',
+    'Wales': 'UK',
+    'Northern Ireland': 'UK',
+    'United States of America': 'USA',
+    'U.S.A.': 'USA',
+    'West Germany': 'Germany',
+    'Federal Republic of Germany': 'Germany',
+    'German Democratic Republic': 'East Germany',
+    "Côte d'Ivoire": 'Ivory Coast',
+    "Cote d'Ivoire": 'Ivory Coast',
+}
+
+def _build_country_continents() -> Dict[str, FrozenSet[str]]:
+    """Build the case-insensitive country -> continents map once at import time."""
+    lookup: Dict[str, set] = {}
+    for continent, countries in CONTINENTS_COUNTRIES.items():
+        for country in countries:
+            lookup.setdefault(country.casefold(), set()).add(continent)
+    for alias, canonical in COUNTRY_ALIASES.items():
+        lookup.setdefault(alias.casefold(), set()).update(lookup.get(canonical.casefold(), set()))
+    return {country: frozenset(continents) for country, continents in lookup.items()}
+
+COUNTRY_CONTINENTS = _build_country_continents()
+
+# Continent order used whenever several continents match, so routing is deterministic
+_CONTINENT_ORDER = {continent: idx for idx, continent in enumerate(CONTINENTS_COUNTRIES)}
+
+def get_continents(country: str) -> Tuple[str, ...]:
+    """Return every continent a country belongs to, in CONTINENTS_COUNTRIES order.
+
+    Transcontinental countries (Russia, Turkey, Cyprus, Georgia, Armenia, Azerbaijan)
+    belong to both Asia and Europe. Unknown countries return an empty tuple.
+    """
+    if not country:
+        return ()
+    continents = COUNTRY_CONTINENTS.get(str(country).strip().casefold())
+    if not continents:
+        return ()
+    return tuple(sorted(continents, key=_CONTINENT_ORDER.__getitem__))
+
+def continents_for_countries(countries: Iterable[str]) -> Tuple[List[str], List[str]]:
+    """Route a film's countries to continents.
+
+    Returns (continents, unmapped_countries). Each continent appears once, in the order
+    it is first reached through the film's country list.
+    """
+    continents: List[str] = []
+    unmapped: List[str] = []
+    for country in countries or []:
+        matched = get_continents(country)
+        if not matched:
+            unmapped.append(country)
+            continue
+        for continent in matched:
+            if continent not in continents:
+                continents.append(continent)
+    return continents, unmapped
@@ -0,0 +1,141 @@
+import re
+from typing import Dict, List, Optional
+from urllib.parse import urljoin, urlparse
+
+from bs4 import BeautifulSoup
+
+LETTERBOXD_URL = 'https://letterboxd.com'
+
+# Posters on a full /films/ listing page
+LISTING_PAGE_SIZE = 72
+POSTER_SELECTOR = 'div.react-component.poster'
+
+# Attributes the poster components have used for the film's page link and name
+LINK_ATTRIBUTES = ('data-target-link', 'data-item-link', 'data-film-link')
+NAME_ATTRIBUTES = ('data-film-name', 'data-item-name', 'data-item-full-display-name')
+YEAR_ATTRIBUTES = ('data-film-release-year', 'data-item-release-year')
+DISPLAY_NAME_YEAR = re.compile(r'^(.*\S)\s*\((\d{4})\)$')
+
+# Fields a list entry needs before its detail page can be skipped
+LIST_ENTRY_FIELDS = ('title', 'year', 'film_id')
+
+class ListingPage:
+    """The posters parsed from one listing page plus what pagination says about it.
+
+    last_page is None when the page has no pagination to read, in which case it is
+    treated as a full page in the middle of the listing.
+    """
+
+    def __init__(self, page_number: int, films: List[Dict], last_page: Optional[int], page_size: int = LISTING_PAGE_SIZE):
+        self.page_number = page_number
+        self.films = films
+        self.last_page = last_page
+        self.page_size = page_size
+
+    @property
+    def is_last_page(self) -> bool:
+        return self.last_page is not None and self.page_number >= self.last_page
+
+    @property
+    def expected_count(self) -> Optional[int]:
+        """How many posters the page should hold, or None if any number is valid (the last page)."""
+        return None if self.is_last_page else self.page_size
+
+    @property
+    def is_complete(self) -> bool:
+        expected = self.expected_count
+        return bool(self.films) if expected is None else len(self.films) >= expected
+
+def parse_last_page(soup: BeautifulSoup) -> Optional[int]:
+    """Highest page number linked from the listing's pagination, if it has any."""
+    pages = []
+    for item in soup.select('.paginate-pages li'):
+        text = item.get_text().strip().replace(',', '')
+        if text.isdigit():
+            pages.append(int(text))
+    return max(pages) if pages else None
+
+def parse_poster(poster) -> Optional[Dict]:
+    """Read title, URL, slug and film id from one poster component, or None if it has no film link."""
+    anchor = poster.find('a', href=True)
+    link = anchor['href'] if anchor else None
+    for attribute in LINK_ATTRIBUTES:
+        if link:
+            break
+        link = poster.get(attribute)
+    slug = poster.get('data-film-slug') or poster.get('data-item-slug')
+    if not link and slug:
+        link = f'/film/{slug}/'
+    if not link:
+        return None
+    if not slug:
+        match = re.search(r'/film/([^/]+)/', link)
+        slug = match.group(1) if match else None
+
+    title = None
+    for attribute in NAME_ATTRIBUTES:
+        title = poster.get(attribute)
+        if title:
+            break
+    if not title:
+        image = poster.find('img', alt=True)
+        title = image['alt'] if image else None
+
+    return {
+        'title': title.strip() if title else None,
+        'url': urljoin(LETTERBOXD_URL, link),
+        'slug': slug,
+        'film_id': poster.get('data-film-id'),
+    }
+
+def parse_listing_page(html: str, page_number: int, page_size: int = LISTING_PAGE_SIZE) -> ListingPage:
+    """Parse every poster on a listing page from its HTML in one pass."""
+    soup = BeautifulSoup(html, 'html.parser')
+    films = []
+    seen_urls = set()
+    for poster in soup.select(POSTER_SELECTOR):
+        film = parse_poster(poster)
+        if film and film['url'] not in seen_urls:
+            seen_urls.add(film['url'])
+            films.append(film)
+    return ListingPage(page_number, films, parse_last_page(soup), page_size)
+
+def parse_list_entry(item) -> Optional[Dict]:
+    """Build a film record from one list entry's markup alone.
+
+    item is the entry's li (or its poster div). Adds year, list_number and the site-relative
+    path to what parse_poster reads; fields the markup does not carry are None.
+    """
+    poster = item if item.get('data-film-slug') or item.get('data-target-link') else None
+    poster = poster or item.find('div', class_='film-poster') or item.select_one(POSTER_SELECTOR)
+    if poster is None:
+        return None
+    film = parse_poster(poster)
+    if film is None:
+        return None
+
+    year = None
+    for attribute in YEAR_ATTRIBUTES:
+        year = poster.get(attribute)
+        if year:
+            break
+    # Display names carry the year, e.g. "Alien (1979)"
+    names = [film['title']] + [poster.get(attribute) for attribute in NAME_ATTRIBUTES]
+    for name in names:
+        match = DISPLAY_NAME_YEAR.match(name.strip()) if name else None
+        if match:
+            if film['title'] == name.strip():
+                film['title'] = match.group(1)
+            year = year or match.group(2)
+            break
+
+    list_number_tag = item.find('p', class_='list-number')
+    list_number = list_number_tag.get_text().strip().replace(',', '') if list_number_tag else ''
+    film['year'] = year.strip() if year else None
+    film['list_number'] = int(list_number) if list_number.isdigit() else None
+    film['path'] = urlparse(film['url']).path
+    return film
+
+def missing_fields(film: Dict, fields=LIST_ENTRY_FIELDS) -> List[str]:
+    """Fields the list markup did not provide, which only the film's detail page can fill in."""
+    return [field for field in fields if not film.get(field)]
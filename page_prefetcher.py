@@ -0,0 +1,102 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from listing_page import LISTING_PAGE_SIZE, ListingPage, parse_listing_page
+
+class PagePrefetcher:
+    """Fetches the next listing page, and the detail pages of its unknown films, in the background.
+
+    At most one listing page is ever in flight or waiting to be taken, and no more than
+    max_details detail pages are held at once, split evenly between the page being scraped
+    and the one prefetched after it; warmed pages are handed out once and then dropped. Fetches go over HTTP with fetch, never through the scraper's browser, and
+    anything that fails or looks incomplete just returns None so the caller falls back to
+    loading the page itself.
+    """
+
+    def __init__(self, fetch: Callable[[str], str], workers: int = 4, max_details: int = 2 * LISTING_PAGE_SIZE):
+        self.fetch = fetch
+        self.max_details = max_details
+        self.page_budget = max_details // 2
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.listing: Optional[Tuple[int, Future]] = None
+        self.details: 'OrderedDict[str, Future]' = OrderedDict()
+        # Listing page each warmed URL was queued for, so every page is held to its own share
+        self.detail_pages: Dict[str, int] = {}
+        # Detail pages are queued from the listing worker and taken from the scraper's thread
+        self.lock = threading.Lock()
+
+    def prefetch(self, page_number: int, url: str, should_warm: Callable[[dict], bool]) -> None:
+        """Start loading listing page page_number unless a page is already waiting."""
+        if self.listing is not None:
+            return
+        self.listing = (page_number, self.executor.submit(self._load_listing, page_number, url, should_warm))
+
+    def _load_listing(self, page_number: int, url: str, should_warm: Callable[[dict], bool]) -> ListingPage:
+        listing = parse_listing_page(self.fetch(url), page_number)
+        if listing.is_complete:
+            self.warm((film['url'] for film in listing.films if should_warm(film)), page_number)
+        return listing
+
+    def warm(self, urls: Iterable[str], page_number: int) -> None:
+        """Queue detail page fetches for a listing page, skipping any beyond its half of the budget.
+
+        Unread pages from the page being scraped only use their own share, so the next page
+        can always be warmed while the current one is still being worked through.
+        """
+        with self.lock:
+            queued = sum(1 for page in self.detail_pages.values() if page == page_number)
+            for url in urls:
+                if queued >= self.page_budget:
+                    break
+                if url not in self.details:
+                    self.details[url] = self.executor.submit(self.fetch, url)
+                    self.detail_pages[url] = page_number
+                    queued += 1
+
+    def take_listing(self, page_number: int, timeout: float = 60) -> Optional[ListingPage]:
+        """Hand over the prefetched listing for page_number if it loaded completely."""
+        if self.listing is None:
+            return None
+        prefetched_page, future = self.listing
+        self.listing = None
+        if prefetched_page != page_number:
+            future.cancel()
+            return None
+        try:
+            listing = future.result(timeout=timeout)
+        except Exception:
+            return None
+        return listing if listing.is_complete else None
+
+    def take_detail(self, url: str, timeout: float = 30) -> Optional[str]:
+        """Hand over the warmed HTML for a film page, freeing its slot in the budget."""
+        with self.lock:
+            future = self.details.pop(url, None)
+            self.detail_pages.pop(url, None)
+        if future is None:
+            return None
+        try:
+            return future.result(timeout=timeout)
+        except Exception:
+            return None
+
+    def discard_details(self, keep: List[str]) -> None:
+        """Drop warmed pages that are not for the given URLs so stale ones do not hold the budget."""
+        keep_urls = set(keep)
+        with self.lock:
+            for url in [url for url in self.details if url not in keep_urls]:
+                self.details.pop(url).cancel()
+                self.detail_pages.pop(url, None)
+
+    def close(self) -> None:
+        if self.listing is not None:
+            self.listing[1].cancel()
+            self.listing = None
+        with self.lock:
+            for future in self.details.values():
+                future.cancel()
+            self.details.clear()
+            self.detail_pages.clear()
+        self.executor.shutdown(wait=False)
@@ -0,0 +1,109 @@
+import heapq
+import os
+import re
+from datetime import datetime
+from string import Template
+from typing import Dict, Mapping, Optional, Tuple
+
+LIST_INDEX_URL = 'https://letterboxd.com/bigbadraj/list/the-official-list-index/'
+
+# Display names for the *_counts categories in the stats dicts
+CATEGORY_DISPLAY_NAMES = {
+    'director_counts': 'directors',
+    'actor_counts': 'actors',
+    'decade_counts': 'decades',
+    'genre_counts': 'genres',
+    'studio_counts': 'studios',
+    'language_counts': 'languages',
+    'country_counts': 'countries'
+}
+
+ELIGIBILITY_CRITERIA = (
+    "<strong>Film eligibility criteria:</strong>\n"
+    "-- Must have a minimum of 1,000 reviews on Letterboxd.\n"
+    "-- Cannot be a short film (minimum 40 minutes).\n"
+    "-- Cannot be a television miniseries.\n"
+    "-- Cannot be a compilation of short serials.\n"
+    "-- Cannot be a documentary.\n"
+    "-- Cannot be a non-narrative project (paint drying for 10 hours, a timelapse of the construction of a building, abstract images, etc).\n"
+    "-- Cannot be a recording of a live performance (stand-up specials, recordings of live theater, concert films, etc).\n"
+    "-- Cannot be a television special episode, though feature film spin-offs from television shows are allowed.\n"
+    "-- Feature film spin-offs from television shows must contain original material, not just recap or compilation of existing material.\n"
+    "-- Entries that have scores inflated because they share a name with a popular television show are removed, as I notice them.\n\n"
+)
+
+FOOTER = "<strong>If you notice any movies you believe should/should not be included just let me know!</strong>"
+PLAIN_FOOTER = "If you notice any movies you believe should/should not be included just let me know!"
+
+REPORT_TEMPLATE = Template(
+    "<strong>$title</strong>\n\n"
+    "$preamble"
+    "<strong>Last updated: $updated</strong>\n\n"
+    "<a href=$index_url> Check out more of the lists I update regularly! </a>\n\n"
+    "$criteria"
+    "$stats"
+    "$footer"
+)
+STATS_TEMPLATE = Template("<strong>The ten most appearing $name:</strong>\n$rows\n")
+
+# The date line changes every day, so it is ignored when deciding whether a report changed
+UPDATED_LINE = re.compile(r'<strong>Last updated: [^<]*</strong>')
+
+def get_ordinal(n: int) -> str:
+    if 10 <= n % 100 <= 20:
+        suffix = 'th'
+    else:
+        suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
+    return str(n) + suffix
+
+def format_updated_date(date: Optional[datetime] = None) -> str:
+    """Format a date the way the reports show it, e.g. "March 3rd, 2025"."""
+    date = date or datetime.now()
+    return date.strftime('%B ') + get_ordinal(date.day) + f", {date.year}"
+
+def render_stats(stats: Mapping) -> str:
+    """Render the top ten of every *_counts category in a stats dict."""
+    blocks = []
+    for category_name, counts in stats.items():
+        if category_name == 'film_data':
+            continue
+        display_name = CATEGORY_DISPLAY_NAMES.get(category_name, category_name.replace('_counts', '').replace('_', ' '))
+        # nlargest keeps the same order as sorted(..., reverse=True)[:10] for tied counts
+        top = heapq.nlargest(10, counts.items(), key=lambda item: item[1])
+        blocks.append(STATS_TEMPLATE.substitute(name=display_name, rows=''.join(f"{item}: {count}\n" for item, count in top)))
+    return ''.join(blocks)
+
+def render_report(title: str, stats: Mapping, updated: str, preamble: str = '', footer: str = FOOTER) -> str:
+    """Render one stats_*.txt / *_filtered_titles.txt report."""
+    return REPORT_TEMPLATE.substitute(
+        title=title,
+        preamble=preamble,
+        updated=updated,
+        index_url=LIST_INDEX_URL,
+        criteria=ELIGIBILITY_CRITERIA,
+        stats=render_stats(stats),
+        footer=footer
+    )
+
+def write_report(path: str, content: str) -> bool:
+    """Write a report unless the file already holds the same content apart from its date.
+
+    Returns True if the file was written.
+    """
+    try:
+        with open(path, mode='r', encoding='utf-8') as file:
+            if UPDATED_LINE.sub('', file.read()) == UPDATED_LINE.sub('', content):
+                return False
+    except OSError:
+        pass
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, mode='w', encoding='utf-8') as file:
+        file.write(content)
+    os.replace(temp_path, path)
+    return True
+
+def write_reports(reports: Dict[str, str]) -> Tuple[int, int]:
+    """Write every rendered report. Returns (written, unchanged) counts."""
+    written = sum(write_report(path, content) for path, content in reports.items())
+    return written, len(reports) - written
@@ -0,0 +1,90 @@
+import difflib
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Trigram candidates re-scored with difflib per query; everything else is never compared
+CANDIDATE_LIMIT = 25
+
+def normalize_title(title) -> str:
+    return unicodedata.normalize('NFKC', str(title)).strip().lower()
+
+def trigrams(title: str) -> Set[str]:
+    padded = f"  {title} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class TitleIndex:
+    """Trigram inverted index over the normalized titles of a list workbook.
+
+    Exact checks are set lookups by link or (title, year). Fuzzy lookups only score the
+    titles that share trigrams with the query, so a query costs O(candidates) instead of
+    a pass over every title. The index is plain data, so it can be pickled and reused
+    until its workbook changes.
+    """
+
+    def __init__(self):
+        self.titles: List[str] = []
+        self.years: List[List[str]] = []
+        self.title_ids: Dict[str, int] = {}
+        self.postings: Dict[str, List[int]] = {}
+        self.keys: Set[Tuple[str, str]] = set()
+        self.links: Set[str] = set()
+
+    @classmethod
+    def build(cls, rows: Iterable[Tuple[str, str, Optional[str]]]) -> 'TitleIndex':
+        """Index (title, year, link) rows."""
+        index = cls()
+        for title, year, link in rows:
+            index.add(title, year, link)
+        return index
+
+    def add(self, title, year, link: Optional[str] = None) -> None:
+        title = normalize_title(title)
+        year = str(year).strip()
+        title_id = self.title_ids.get(title)
+        if title_id is None:
+            title_id = len(self.titles)
+            self.title_ids[title] = title_id
+            self.titles.append(title)
+            self.years.append([])
+            for gram in trigrams(title):
+                self.postings.setdefault(gram, []).append(title_id)
+        if year not in self.years[title_id]:
+            self.years[title_id].append(year)
+        self.keys.add((title, year))
+        if isinstance(link, str) and link:
+            self.links.add(link)
+
+    def contains(self, title, year, url: Optional[str] = None) -> bool:
+        """True if the film is listed, matching by URL first and then by title and year."""
+        if url and url in self.links:
+            return True
+        return (normalize_title(title), str(year).strip()) in self.keys
+
+    def close_matches(self, title, n: int = 3, cutoff: float = 0.6) -> List[Tuple[str, List[str], float]]:
+        """Return up to n (title, years, score) entries similar to title, best first.
+
+        Scores are difflib ratios like get_close_matches, but only for the titles sharing
+        the most trigrams with the query.
+        """
+        query = normalize_title(title)
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in trigrams(query):
+            for title_id in self.postings.get(gram, ()):
+                shared[title_id] += 1
+        candidates = sorted(shared, key=shared.get, reverse=True)[:CANDIDATE_LIMIT]
+
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(query)
+        scored = []
+        for title_id in candidates:
+            matcher.set_seq1(self.titles[title_id])
+            if matcher.real_quick_ratio() >= cutoff and matcher.quick_ratio() >= cutoff:
+                score = matcher.ratio()
+                if score >= cutoff:
+                    scored.append((score, title_id))
+        scored.sort(reverse=True)
+        return [(self.titles[title_id], self.years[title_id], score) for score, title_id in scored[:n]]
+
+    def batch_close_matches(self, titles: Iterable[str], n: int = 3, cutoff: float = 0.6) -> List[List[Tuple[str, List[str], float]]]:
+        return [self.close_matches(title, n, cutoff) for title in titles]
@@ -0,0 +1,72 @@
+import json
+import os
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# Returned by TTLCache.get when a key is missing or stale, so None can be cached as a real value
+MISSING = object()
+
+class TTLCache:
+    """Small persistent key -> value store where every entry expires after ttl seconds.
+
+    Entries live in a JSON file as {key: [value, checked_at]}. Changes stay in memory
+    until save(), which rewrites the file atomically, so a run costs a single write.
+    """
+
+    def __init__(self, path: str, ttl: float):
+        self.path = path
+        self.ttl = ttl
+        self.entries: Dict[str, Tuple[Any, float]] = {}
+        self.dirty = False
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with open(self.path, mode='r', encoding='utf-8') as file:
+                data = json.load(file)
+            self.entries = {key: (value, float(checked)) for key, (value, checked) in data.items()}
+        except (OSError, ValueError, TypeError):
+            # A missing or unreadable cache just means everything is fetched again
+            self.entries = {}
+        self.dirty = False
+
+    def get(self, key: str, default: Any = MISSING) -> Any:
+        """Return the cached value for key, or default if it is missing or older than the TTL."""
+        entry = self.entries.get(key)
+        if entry is None or time.time() - entry[1] > self.ttl:
+            return default
+        return entry[0]
+
+    def checked_at(self, key: str) -> Optional[float]:
+        """When key was last stored, whether or not it has expired."""
+        entry = self.entries.get(key)
+        return entry[1] if entry else None
+
+    def set(self, key: str, value: Any, checked_at: Optional[float] = None) -> None:
+        self.entries[key] = (value, time.time() if checked_at is None else checked_at)
+        self.dirty = True
+
+    def discard(self, key: str) -> None:
+        if self.entries.pop(key, None) is not None:
+            self.dirty = True
+
+    def items(self) -> Iterator[Tuple[str, Any, float]]:
+        """Yield (key, value, checked_at) for every entry, fresh or not."""
+        for key, (value, checked) in self.entries.items():
+            yield key, value, checked
+
+    def save(self) -> None:
+        """Write the cache to disk if anything changed since it was loaded."""
+        if not self.dirty:
+            return
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, mode='w', encoding='utf-8') as file:
+            json.dump({key: [value, checked] for key, (value, checked) in self.entries.items()}, file, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+        self.dirty = False
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not MISSING
+
+    def __len__(self) -> int:
+        return len(self.entries)
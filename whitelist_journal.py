@@ -0,0 +1,63 @@
+import json
+import os
+import time
+from typing import Dict, List
+
+class ChangeJournal:
+    """Append-only JSONL log of row changes waiting to be compacted into a workbook.
+
+    Changes are buffered in memory and appended to disk in batches, so persisting one
+    film costs a small append instead of rewriting the whole workbook. Flushed entries
+    survive a crash and are replayed on the next load until compact() is called; a crash
+    loses at most the batch_size - 1 changes still in the buffer.
+    """
+
+    def __init__(self, path: str, batch_size: int = 25, compact_interval: float = 600):
+        self.path = path
+        self.batch_size = batch_size
+        self.compact_interval = compact_interval
+        self.buffer: List[Dict] = []
+        self.last_compacted = time.time()
+
+    def append(self, entry: Dict) -> None:
+        """Queue a change, writing the batch to disk once it is full."""
+        self.buffer.append(entry)
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append all buffered changes to the journal file."""
+        if not self.buffer:
+            return
+        with open(self.path, mode='a', encoding='utf-8') as file:
+            for entry in self.buffer:
+                file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+        self.buffer = []
+
+    def read(self) -> List[Dict]:
+        """Return every change on disk plus any still buffered, oldest first."""
+        entries = []
+        if os.path.exists(self.path):
+            with open(self.path, mode='r', encoding='utf-8') as file:
+                for line in file:
+                    try:
+                        entries.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # A torn final line from an interrupted write is skipped
+                        continue
+        return entries + list(self.buffer)
+
+    def has_changes(self) -> bool:
+        return bool(self.buffer) or os.path.exists(self.path)
+
+    def compaction_due(self) -> bool:
+        return time.time() - self.last_compacted >= self.compact_interval
+
+    def clear(self) -> None:
+        """Drop all changes once they have been written to the canonical store."""
+        self.buffer = []
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self.last_compacted = time.time()
@@ -0,0 +1,41 @@
+import os
+import pickle
+from typing import Callable
+
+import pandas as pd
+
+# Bumped whenever the cached frame layout changes so old sidecars are ignored
+CACHE_VERSION = 1
+
+def _source_signature(source_path: str):
+    stat = os.stat(source_path)
+    return (CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+
+def load_cached_frame(source_path: str, cache_path: str, build: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+    """Return build()'s DataFrame for a workbook, reusing a pickle sidecar while the workbook is unchanged.
+
+    The sidecar is keyed by the workbook's mtime and size, so any edit to the workbook
+    (by hand or by another script) rebuilds it. Missing workbooks raise FileNotFoundError
+    like pd.read_excel does.
+    """
+    signature = _source_signature(source_path)
+    try:
+        with open(cache_path, 'rb') as file:
+            cached_signature, frame = pickle.load(file)
+        if cached_signature == signature:
+            return frame
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError):
+        pass
+
+    frame = build()
+    store_cached_frame(source_path, cache_path, frame)
+    return frame
+
+def store_cached_frame(source_path: str, cache_path: str, frame: pd.DataFrame) -> None:
+    """Record frame as the cached contents of a workbook that was just written from it."""
+    try:
+        with open(cache_path, 'wb') as file:
+            pickle.dump((_source_signature(source_path), frame), file, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        # A read-only or locked directory only costs the speed-up
+        pass